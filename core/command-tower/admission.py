@@ -0,0 +1,127 @@
+"""
+Ultimate ShunsukeModel Ecosystem - Session Admission Control
+コマンドセッションのアドミッション制御
+
+同時実行セッション数を上限で制御し、超過分はクライアント単位の
+ラウンドロビンで公平に待機させる (同一クライアント内は到着順)
+"""
+
+import asyncio
+import time
+from typing import Dict, Any, Optional, Deque
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+
+
+class AdmissionRejected(RuntimeError):
+    """待機キューが満杯でセッションを受け付けられない"""
+
+
+class AdmissionController:
+    """
+    セッションアドミッションコントローラー
+
+    主要機能:
+    1. 同時実行セッション数の上限
+    2. クライアント間ラウンドロビンの公平待機キュー
+    3. 待機キュー長の上限による受付拒否
+    4. 待ち時間統計
+    """
+
+    DEFAULT_CLIENT = "default"
+
+    def __init__(self, max_active: int = 4, max_queued: Optional[int] = None):
+        """初期化"""
+        self.max_active = max(1, max_active)
+        self.max_queued = max_queued
+        self.active = 0
+        self._waiters: "OrderedDict[str, Deque[asyncio.Future]]" = OrderedDict()
+        self._queued = 0
+        self.stats = {'admitted': 0, 'waited': 0, 'rejected': 0, 'total_wait': 0.0, 'max_wait': 0.0}
+
+    @property
+    def queued(self) -> int:
+        """待機中のセッション数"""
+        return self._queued
+
+    async def acquire(self, client_id: Optional[str] = None):
+        """実行枠を取得 (上限到達時は待機)"""
+        client_id = client_id or self.DEFAULT_CLIENT
+
+        if self.active < self.max_active and not self._queued:
+            self.active += 1
+            self.stats['admitted'] += 1
+            return
+
+        if self.max_queued is not None and self._queued >= self.max_queued:
+            self.stats['rejected'] += 1
+            raise AdmissionRejected(f"Admission queue is full ({self._queued} sessions waiting)")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(client_id, deque()).append(waiter)
+        self._queued += 1
+        self.stats['waited'] += 1
+        started = time.monotonic()
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # 枠を受け取った直後にキャンセルされた場合は次の待機者へ譲る
+                self.release()
+            else:
+                self._remove_waiter(client_id, waiter)
+            raise
+
+        waited = time.monotonic() - started
+        self.stats['admitted'] += 1
+        self.stats['total_wait'] += waited
+        self.stats['max_wait'] = max(self.stats['max_wait'], waited)
+
+    def _remove_waiter(self, client_id: str, waiter: asyncio.Future):
+        """キャンセルされた待機者を除去"""
+        queue = self._waiters.get(client_id)
+        if queue and waiter in queue:
+            queue.remove(waiter)
+            self._queued -= 1
+            if not queue:
+                del self._waiters[client_id]
+
+    def release(self):
+        """実行枠を返却 (待機者がいればラウンドロビンで引き渡す)"""
+        while self._waiters:
+            client_id, queue = next(iter(self._waiters.items()))
+            waiter = queue.popleft()
+            self._queued -= 1
+            if queue:
+                self._waiters.move_to_end(client_id)
+            else:
+                del self._waiters[client_id]
+
+            if not waiter.done():
+                # 枠は返却せずそのまま待機者へ引き継ぐ
+                waiter.set_result(None)
+                return
+
+        self.active -= 1
+
+    @asynccontextmanager
+    async def admit(self, client_id: Optional[str] = None):
+        """実行枠を保持するコンテキスト"""
+        await self.acquire(client_id)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """アドミッション統計取得"""
+        waited = self.stats['waited']
+        return {
+            "max_active": self.max_active,
+            "active": self.active,
+            "queued": self._queued,
+            "waiting_clients": len(self._waiters),
+            "avg_wait": self.stats['total_wait'] / waited if waited else 0.0,
+            **self.stats
+        }
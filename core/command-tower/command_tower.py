@@ -7,19 +7,27 @@ CLAUDE.mdの「Repository-Based Project Management Workflow」に基づく実装
 """
 
 import asyncio
+import heapq
+import importlib
 import logging
-from typing import Dict, List, Any, Optional, Union
+import sys
+import time
+from typing import Dict, List, Any, Optional, Union, Callable, Tuple, Awaitable
 from dataclasses import dataclass, field
+from collections import OrderedDict
 from enum import Enum
 from pathlib import Path
 import json
-import yaml
 from datetime import datetime, timezone
+import uuid
 
-from ..meta_framework.project_orchestrator import ProjectOrchestrator
-from ..meta_framework.meta_project_manager import MetaProjectManager
-from ...orchestration.coordinator.agent_coordinator import AgentCoordinator
-from ...integration.claude_integration.claude_bridge import ClaudeBridge
+from ..ecosystem_logging import get_component_logger, configure_logging
+from .plan_executor import PlanExecutor
+from .admission import AdmissionController, AdmissionRejected
+from .task_store import TaskStore
+from .intent_cache import IntentAnalysisCache
+from .session_wal import SessionWAL, DONE_STATUSES
+from ...orchestration.coordinator.task_archive import TaskArchive
 
 
 class TaskStatus(Enum):
@@ -40,33 +48,180 @@ class Priority(Enum):
     LOW = "low"
 
 
-@dataclass
+# 優先度の並び順 (小さいほど先に実行)
+PRIORITY_RANK = {
+    Priority.CRITICAL: 0,
+    Priority.HIGH: 1,
+    Priority.MEDIUM: 2,
+    Priority.LOW: 3
+}
+
+
+# ログのタイムスタンプは単調時計で保持し、辞書形式への変換時に壁時計へ換算する
+_WALL_ANCHOR = time.time()
+_MONOTONIC_ANCHOR = time.monotonic()
+
+
+def monotonic_to_datetime(ts: float) -> datetime:
+    """単調時計の値を UTC の datetime へ換算"""
+    return datetime.fromtimestamp(_WALL_ANCHOR + (ts - _MONOTONIC_ANCHOR), timezone.utc)
+
+
+def datetime_to_monotonic(value: datetime) -> float:
+    """datetime を単調時計の値へ換算"""
+    return _MONOTONIC_ANCHOR + (value.timestamp() - _WALL_ANCHOR)
+
+
+class TaskLogEntry:
+    """
+    タスクログエントリ (コンパクト表現)
+    
+    タイムスタンプは単調時計の float、アクションは intern した文字列、
+    ステータスは TaskStatus のまま保持し、空の詳細は持たない。
+    to_dict() で従来の辞書形式を再現する
+    """
+    
+    __slots__ = ('ts', 'action', 'details', 'status')
+    
+    FIELDS = ("timestamp", "action", "details", "status")
+    
+    def __init__(self, ts: float, action: str, details: Optional[Dict[str, Any]], status: TaskStatus):
+        """初期化"""
+        self.ts = ts
+        self.action = sys.intern(action)
+        self.details = details or None
+        self.status = status
+    
+    @classmethod
+    def from_dict(cls, entry: Dict[str, Any]) -> 'TaskLogEntry':
+        """従来の辞書形式から復元"""
+        try:
+            ts = datetime_to_monotonic(datetime.fromisoformat(entry["timestamp"]))
+        except (KeyError, TypeError, ValueError):
+            ts = time.monotonic()
+        return cls(ts, entry.get("action", ""), entry.get("details"), TaskStatus(entry.get("status", "pending")))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """従来の辞書形式"""
+        return {
+            "timestamp": monotonic_to_datetime(self.ts).isoformat(),
+            "action": self.action,
+            "details": dict(self.details) if self.details else {},
+            "status": self.status.value
+        }
+    
+    # 従来の辞書形式と同じキーでの参照
+    def __getitem__(self, key: str) -> Any:
+        if key == "action":
+            return self.action
+        if key == "details":
+            return self.details if self.details is not None else {}
+        if key == "status":
+            return self.status.value
+        if key == "timestamp":
+            return monotonic_to_datetime(self.ts).isoformat()
+        raise KeyError(key)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in self.FIELDS else default
+    
+    def __repr__(self) -> str:
+        return f"TaskLogEntry({self.action!r}, status={self.status.value!r}, details={self.details!r})"
+
+
 class CommandTask:
-    """司令塔管理タスク"""
-    id: str
-    name: str
-    description: str
-    status: TaskStatus = TaskStatus.PENDING
-    priority: Priority = Priority.MEDIUM
-    assigned_agents: List[str] = field(default_factory=list)
-    dependencies: List[str] = field(default_factory=list)
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    completed_at: Optional[datetime] = None
-    archived_at: Optional[datetime] = None  # 消し込み日時
-    metadata: Dict[str, Any] = field(default_factory=dict)
-    logs: List[Dict[str, Any]] = field(default_factory=list)
+    """司令塔管理タスク (スロット化したコンパクト表現)"""
+    
+    __slots__ = (
+        'id', 'name', 'description', 'status', 'priority', 'assigned_agents', 'dependencies',
+        'created_at', '_updated_ts', 'completed_at', 'archived_at', 'metadata', 'logs', '_status_listener'
+    )
+    
+    def __init__(
+        self,
+        id: str,
+        name: str,
+        description: str,
+        status: TaskStatus = TaskStatus.PENDING,
+        priority: Priority = Priority.MEDIUM,
+        assigned_agents: Optional[List[str]] = None,
+        dependencies: Optional[List[str]] = None,
+        created_at: Optional[datetime] = None,
+        updated_at: Optional[datetime] = None,
+        completed_at: Optional[datetime] = None,
+        archived_at: Optional[datetime] = None,  # 消し込み日時
+        metadata: Optional[Dict[str, Any]] = None,
+        logs: Optional[List[Union[TaskLogEntry, Dict[str, Any]]]] = None
+    ):
+        """初期化"""
+        self._status_listener: Optional[Callable[['CommandTask', TaskStatus], None]] = None
+        self.id = id
+        self.name = name
+        self.description = description
+        self.status = status
+        self.priority = priority
+        self.assigned_agents = assigned_agents if assigned_agents is not None else []
+        self.dependencies = dependencies if dependencies is not None else []
+        self.created_at = created_at or datetime.now(timezone.utc)
+        self._updated_ts = datetime_to_monotonic(updated_at) if updated_at else time.monotonic()
+        self.completed_at = completed_at
+        self.archived_at = archived_at
+        self.metadata = metadata if metadata is not None else {}
+        self.logs: List[TaskLogEntry] = [
+            entry if isinstance(entry, TaskLogEntry) else TaskLogEntry.from_dict(entry)
+            for entry in (logs or [])
+        ]
+    
+    def __setattr__(self, name: str, value: Any):
+        """ステータス変更をタスクストアへ通知"""
+        if name == 'status':
+            old_status = getattr(self, 'status', None)
+            object.__setattr__(self, name, value)
+            listener = getattr(self, '_status_listener', None)
+            if listener is not None and old_status is not value:
+                listener(self, old_status)
+            return
+        object.__setattr__(self, name, value)
+    
+    @property
+    def updated_at(self) -> datetime:
+        """最終更新日時"""
+        return monotonic_to_datetime(self._updated_ts)
+    
+    @updated_at.setter
+    def updated_at(self, value: datetime):
+        self._updated_ts = datetime_to_monotonic(value)
+    
+    def __repr__(self) -> str:
+        return f"CommandTask(id={self.id!r}, name={self.name!r}, status={self.status.value!r}, logs={len(self.logs)})"
+    
+    def log_dicts(self) -> List[Dict[str, Any]]:
+        """ログを従来の辞書形式で取得"""
+        return [entry.to_dict() for entry in self.logs]
+    
+    def to_record(self) -> Dict[str, Any]:
+        """アーカイブ用の辞書形式"""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "description": self.description,
+            "status": self.status.value,
+            "priority": self.priority.value,
+            "assigned_agents": self.assigned_agents,
+            "dependencies": self.dependencies,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "archived_at": self.archived_at.isoformat() if self.archived_at else None,
+            "metadata": self.metadata,
+            "logs": self.log_dicts()
+        }
     
     def add_log(self, action: str, details: Dict[str, Any] = None):
         """ログエントリを追加"""
-        log_entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "action": action,
-            "details": details or {},
-            "status": self.status.value
-        }
-        self.logs.append(log_entry)
-        self.updated_at = datetime.now(timezone.utc)
+        now = time.monotonic()
+        self.logs.append(TaskLogEntry(now, action, details, self.status))
+        self._updated_ts = now
     
     def mark_completed(self):
         """タスクを完了マーク"""
@@ -84,6 +239,19 @@ class CommandTask:
         })
 
 
+# 遅延生成するコンポーネント: 属性名 -> (モジュール, クラス名, 設定キー)
+# 各モジュールの import は重いため、初回使用時まで読み込まない
+COMPONENTS = {
+    "project_orchestrator": ("..meta_framework.project_orchestrator", "ProjectOrchestrator", "orchestrator"),
+    "meta_manager": ("..meta_framework.meta_project_manager", "MetaProjectManager", "meta_manager"),
+    "agent_coordinator": ("...orchestration.coordinator.agent_coordinator", "AgentCoordinator", "coordinator"),
+    "claude_bridge": ("...integration.claude_integration.claude_bridge", "ClaudeBridge", "claude_integration")
+}
+
+# コマンドシーケンスの実行に必要なコンポーネント
+SEQUENCE_COMPONENTS = ("project_orchestrator", "agent_coordinator", "claude_bridge")
+
+
 @dataclass
 class CommandContext:
     """司令塔実行コンテキスト"""
@@ -114,26 +282,118 @@ class CommandTower:
         self.config_path = config_path or Path.home() / '.claude' / 'shunsuke-ecosystem' / 'command-tower.yaml'
         self.config = self._load_config()
         
-        # コンポーネント初期化
-        self.project_orchestrator = ProjectOrchestrator(self.config.get('orchestrator', {}))
-        self.meta_manager = MetaProjectManager(self.config.get('meta_manager', {}))
-        self.agent_coordinator = AgentCoordinator(self.config.get('coordinator', {}))
-        self.claude_bridge = ClaudeBridge(self.config.get('claude_integration', {}))
+        # コンポーネント (初回使用時に生成・初期化)
+        self._components: Dict[str, Any] = {}
+        self._initialized_components: set = set()
+        self._component_lock: Optional[asyncio.Lock] = None
         
-        # タスク管理
-        self.tasks: Dict[str, CommandTask] = {}
+        # タスク管理 (ステータス / セッション別インデックス付き, 消し込み済みタスクはディスクへ退避)
+        archive_config = self.config.get('command_tower', {}).get('task_archive', {})
+        self.task_archive = TaskArchive(
+            Path(archive_config.get(
+                'archive_dir',
+                Path.home() / '.claude' / 'shunsuke-ecosystem' / 'command-archive'
+            )).expanduser(),
+            segment_max_bytes=archive_config.get('segment_max_bytes', 8 * 1024 * 1024),
+            max_segments=archive_config.get('max_segments', 32)
+        ) if archive_config.get('enabled', True) else None
+        self.tasks = TaskStore(self.task_archive)
         self.active_contexts: Dict[str, CommandContext] = {}
         
         # ログ設定
         self.logger = logging.getLogger(__name__)
         self._setup_logging()
         
+        # プラン実行 (依存関係を満たしたタスクから並行実行)
+        tower_config = self.config.get('command_tower', {})
+        self.plan_executor = PlanExecutor(
+            max_parallelism=tower_config.get('max_parallel_tasks', tower_config.get('max_concurrent_tasks', 10)),
+            logger=self.logger
+        )
+        
+        # セッションのアドミッション制御 (同時実行数の上限と公平な待機キュー)
+        self.admission = AdmissionController(
+            max_active=tower_config.get('max_concurrent_sessions', 4),
+            max_queued=tower_config.get('max_queued_sessions')
+        )
+        
+        # 意図解析キャッシュ (同一意図の再解析と同時解析を抑止)
+        intent_cache_config = tower_config.get('intent_cache', {})
+        self.intent_cache = IntentAnalysisCache(
+            max_entries=intent_cache_config.get('max_entries', 256),
+            ttl=intent_cache_config.get('ttl_seconds', 900),
+            disk_dir=Path(intent_cache_config['disk_dir']).expanduser() if intent_cache_config.get('disk_dir') else None
+        ) if intent_cache_config.get('enabled', True) else None
+        
+        # セッション WAL (タスク状態遷移とフェーズ結果の永続化, 起動時に復旧)
+        wal_config = tower_config.get('wal', {})
+        self.session_wal = SessionWAL(
+            Path(wal_config.get(
+                'wal_dir',
+                Path.home() / '.claude' / 'shunsuke-ecosystem' / 'command-wal'
+            )).expanduser(),
+            sync_interval=wal_config.get('sync_interval_ms', 50) / 1000,
+            max_batch=wal_config.get('max_batch', 256),
+            compact_every=wal_config.get('compact_every_sessions', 32)
+        ) if wal_config.get('enabled', True) else None
+        self.tasks.on_transition = self._log_task_transition
+        self.recovered_sessions: Dict[str, Dict[str, Any]] = {}
+        self.resume_tasks: Dict[str, asyncio.Task] = {}
+        
+        # 完了したセッションの結果 (失敗タスクの再実行用, 古いものから破棄)
+        self.session_results: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.max_retained_sessions = tower_config.get('retained_sessions', 32)
+        
         # 司令塔状態
         self.is_active = False
         self.startup_time = None
         
+    @property
+    def project_orchestrator(self):
+        """プロジェクトオーケストレーター (遅延生成)"""
+        return self._component("project_orchestrator")
+    
+    @property
+    def meta_manager(self):
+        """メタプロジェクトマネージャー (遅延生成)"""
+        return self._component("meta_manager")
+    
+    @property
+    def agent_coordinator(self):
+        """エージェントコーディネーター (遅延生成)"""
+        return self._component("agent_coordinator")
+    
+    @property
+    def claude_bridge(self):
+        """Claude Bridge (遅延生成)"""
+        return self._component("claude_bridge")
+    
+    def _component(self, name: str) -> Any:
+        """コンポーネント取得 (未生成なら import して生成)"""
+        component = self._components.get(name)
+        if component is None:
+            module_name, class_name, config_key = COMPONENTS[name]
+            started = time.perf_counter()
+            component_class = getattr(importlib.import_module(module_name, __package__), class_name)
+            component = self._components[name] = component_class(self.config.get(config_key, {}))
+            self.logger.debug("Component loaded: %s (%.1fms)", name, (time.perf_counter() - started) * 1000)
+        return component
+    
+    async def _ensure_components(self, *names: str):
+        """コンポーネントの生成と初期化 (各コンポーネント1回のみ)"""
+        if self._component_lock is None:
+            self._component_lock = asyncio.Lock()
+        
+        async with self._component_lock:
+            for name in names or tuple(COMPONENTS):
+                if name not in self._initialized_components:
+                    await self._component(name).initialize()
+                    self._initialized_components.add(name)
+    
     def _load_config(self) -> Dict[str, Any]:
         """設定ファイル読み込み"""
+        import yaml  # 設定ファイルの読み書き時のみ必要
+        
         if self.config_path.exists():
             with open(self.config_path, 'r', encoding='utf-8') as f:
                 return yaml.safe_load(f)
@@ -142,10 +402,28 @@ class CommandTower:
         default_config = {
             "command_tower": {
                 "max_concurrent_tasks": 10,
+                "max_parallel_tasks": 10,
+                "max_concurrent_sessions": 4,
+                "max_queued_sessions": 100,
+                "streaming_execution": False,
                 "task_timeout_minutes": 30,
                 "quality_threshold": 0.8,
                 "auto_archive_completed": True,
-                "log_level": "INFO"
+                "log_level": "INFO",
+                "lazy_components": True,
+                "retained_sessions": 32,
+                "intent_cache": {
+                    "enabled": True,
+                    "max_entries": 256,
+                    "ttl_seconds": 900
+                },
+                "wal": {
+                    "enabled": True,
+                    "sync_interval_ms": 50,
+                    "max_batch": 256,
+                    "compact_every_sessions": 32,
+                    "auto_resume": True
+                }
             },
             "orchestrator": {
                 "max_agents_per_task": 5,
@@ -174,34 +452,40 @@ class CommandTower:
         return default_config
     
     def _setup_logging(self):
-        """ログ設定"""
-        log_level = self.config.get('command_tower', {}).get('log_level', 'INFO')
-        log_dir = Path.home() / '.claude' / 'logs' / 'shunsuke-ecosystem'
-        log_dir.mkdir(parents=True, exist_ok=True)
-        
-        handler = logging.FileHandler(log_dir / 'command-tower.log')
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        handler.setFormatter(formatter)
+        """ログ設定 (共通ロギング基盤, ハンドラーはロガーごとに1つ)"""
+        tower_config = self.config.get('command_tower', {})
+        if tower_config.get('logging'):
+            configure_logging(**tower_config['logging'])
         
-        self.logger.addHandler(handler)
-        self.logger.setLevel(getattr(logging, log_level.upper()))
+        log_level = tower_config.get('log_level', 'INFO')
+        get_component_logger(__name__, 'command-tower.log', getattr(logging, log_level.upper()))
     
     async def initialize(self) -> bool:
         """司令塔システム初期化"""
         try:
             self.logger.info("Command Tower initialization started")
             
-            # コンポーネント初期化
-            await self.project_orchestrator.initialize()
-            await self.meta_manager.initialize()
-            await self.agent_coordinator.initialize()
-            await self.claude_bridge.initialize()
+            # コンポーネント初期化 (遅延モードでは初回のコマンド実行時まで行わない)
+            if not self.config.get('command_tower', {}).get('lazy_components', True):
+                await self._ensure_components()
+            
+            if self.task_archive is not None:
+                self.task_archive.open()
+            
+            # 前回停止時に完了していなかったセッションの復旧 (オーナープロセスが終了済みのもののみ)
+            if self.session_wal is not None:
+                self.recovered_sessions = self.session_wal.recover()
+                self.session_wal.start()
             
             self.is_active = True
             self.startup_time = datetime.now(timezone.utc)
             
+            if self.recovered_sessions:
+                self.logger.warning(f"Recovered {len(self.recovered_sessions)} incomplete command sessions")
+                if self.config.get('command_tower', {}).get('wal', {}).get('auto_resume', True):
+                    for session_id in list(self.recovered_sessions):
+                        self.resume_tasks[session_id] = asyncio.ensure_future(self.resume_session(session_id))
+            
             self.logger.info("Command Tower initialization completed successfully")
             return True
             
@@ -212,7 +496,9 @@ class CommandTower:
     async def execute_command_sequence(
         self,
         user_intent: str,
-        context: Optional[CommandContext] = None
+        context: Optional[CommandContext] = None,
+        client_id: Optional[str] = None,
+        streaming: Optional[bool] = None
     ) -> Dict[str, Any]:
         """
         シュンスケ式コマンドシーケンス実行
@@ -220,6 +506,9 @@ class CommandTower:
         Args:
             user_intent: ユーザーの意図・要求
             context: 実行コンテキスト
+            client_id: アドミッション制御で公平性を保つ単位 (省略時は共通キュー)
+            streaming: タスク生成・配置・実行・品質分析を重ねるストリーミングモード
+                       (省略時は設定 command_tower.streaming_execution)
             
         Returns:
             実行結果とメトリクス
@@ -228,80 +517,434 @@ class CommandTower:
             raise RuntimeError("Command Tower is not initialized")
         
         # コンテキスト準備
-        session_id = f"cmd_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         if context is None:
             context = CommandContext(
-                session_id=session_id,
+                session_id=self._new_session_id(),
                 user_intent=user_intent,
                 current_phase="analysis"
             )
+        elif not context.session_id:
+            context.session_id = self._new_session_id()
+        session_id = context.session_id
         
-        self.active_contexts[session_id] = context
+        if streaming is None:
+            streaming = self.config.get('command_tower', {}).get('streaming_execution', False)
+        
+        return await self._run_admitted(
+            context, client_id, lambda: self._run_command_sequence(user_intent, context, streaming)
+        )
+    
+    async def _run_admitted(
+        self,
+        context: CommandContext,
+        client_id: Optional[str],
+        run: Callable[[], Awaitable[Dict[str, Any]]],
+        on_rejected: Optional[Callable[[], None]] = None
+    ) -> Dict[str, Any]:
+        """アドミッション制御下でセッションを実行 (上限到達時は待機, 待機キュー満杯時は拒否)"""
+        session_id = context.session_id
+        try:
+            await self.admission.acquire(client_id)
+        except AdmissionRejected as e:
+            if on_rejected is not None:
+                on_rejected()
+            self.logger.warning(f"Command sequence rejected: {e}")
+            return {
+                "session_id": session_id,
+                "status": "rejected",
+                "error": str(e),
+                "context": context
+            }
+        
+        try:
+            if session_id in self.active_contexts:
+                raise ValueError(f"Session is already active: {session_id}")
+            self.active_contexts[session_id] = context
+            return await run()
+        finally:
+            self.admission.release()
+    
+    def _new_session_id(self) -> str:
+        """一意なセッションID生成"""
+        return f"cmd_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+    
+    async def _run_command_sequence(
+        self,
+        user_intent: str,
+        context: CommandContext,
+        streaming: bool = False
+    ) -> Dict[str, Any]:
+        """コマンドシーケンス本体 (アドミッション済み)"""
+        session_id = context.session_id
+        self._wal_append({
+            "type": "session_started",
+            "session_id": session_id,
+            "user_intent": user_intent,
+            "streaming": streaming
+        })
         
         try:
             self.logger.info(f"Command sequence started: {user_intent}")
+            await self._ensure_components(*SEQUENCE_COMPONENTS)
             
             # フェーズ1: 意図解析とタスク分解
             analysis_result = await self._analyze_user_intent(user_intent, context)
             context.current_phase = "task_planning"
             
-            # フェーズ2: タスクプランニング
-            task_plan = await self._create_task_plan(analysis_result, context)
-            context.current_phase = "agent_allocation"
+            if streaming:
+                # フェーズ2-5: プランニング・配置・実行・品質分析をタスク単位で重ねて実行
+                execution_result, quality_result = await self._execute_streaming(analysis_result, context)
+            else:
+                # フェーズ2: タスクプランニング
+                task_plan = await self._create_task_plan(analysis_result, context)
+                context.current_phase = "agent_allocation"
+                
+                # フェーズ3: エージェント配置
+                agent_allocation = await self._allocate_agents(task_plan, context)
+                context.current_phase = "execution"
+                
+                # フェーズ4: 実行とモニタリング
+                execution_result = await self._execute_task_plan(task_plan, agent_allocation, context)
+                context.current_phase = "quality_analysis"
+                
+                # フェーズ5: 品質分析
+                quality_result = await self._analyze_quality(execution_result, context)
             
-            # フェーズ3: エージェント配置
-            agent_allocation = await self._allocate_agents(task_plan, context)
+            return await self._finish_command_sequence(execution_result, quality_result, context)
+            
+        except Exception as e:
+            return self._fail_command_sequence(e, context)
+        
+        finally:
+            # コンテキストクリーンアップ
+            if session_id in self.active_contexts:
+                del self.active_contexts[session_id]
+    
+    async def _finish_command_sequence(
+        self,
+        execution_result: Dict[str, Any],
+        quality_result: Dict[str, Any],
+        context: CommandContext
+    ) -> Dict[str, Any]:
+        """フェーズ6: 完了処理と成功結果の生成"""
+        session_id = context.session_id
+        context.current_phase = "completion"
+        
+        completion_result = await self._complete_command_sequence(
+            execution_result, quality_result, context
+        )
+        
+        # 成功ログ
+        self.logger.info(f"Command sequence completed successfully: {session_id}")
+        self._wal_append({"type": "session_finished", "session_id": session_id, "status": "completed"})
+        self._retain_session_result(context, execution_result, completion_result)
+        
+        return {
+            "session_id": session_id,
+            "status": "completed",
+            "results": completion_result,
+            "quality_metrics": quality_result,
+            "execution_time": (datetime.now(timezone.utc) - context.execution_history[0]["timestamp"]).total_seconds(),
+            "context": context
+        }
+    
+    def _retain_session_result(
+        self,
+        context: CommandContext,
+        execution_result: Dict[str, Any],
+        completion_result: Dict[str, Any]
+    ):
+        """失敗タスク再実行のためにセッション結果を保持"""
+        self.session_results[context.session_id] = {
+            "context": context,
+            "execution_result": execution_result,
+            "completion_result": completion_result
+        }
+        self.session_results.move_to_end(context.session_id)
+        while len(self.session_results) > self.max_retained_sessions:
+            evicted_id, _ = self.session_results.popitem(last=False)
+            self._release_session(evicted_id)
+    
+    def _release_session(self, session_id: str):
+        """再実行対象でなくなったセッションを WAL の圧縮対象にする"""
+        self._wal_append({"type": "session_released", "session_id": session_id})
+    
+    def _fail_command_sequence(self, error: Exception, context: CommandContext) -> Dict[str, Any]:
+        """失敗結果の生成"""
+        self.logger.error(f"Command sequence failed: {error}", exc_info=True)
+        context.current_phase = "error"
+        self._wal_append({
+            "type": "session_finished",
+            "session_id": context.session_id,
+            "status": "failed",
+            "error": str(error)
+        })
+        if context.session_id not in self.session_results:
+            self._release_session(context.session_id)
+        
+        return {
+            "session_id": context.session_id,
+            "status": "failed",
+            "error": str(error),
+            "context": context
+        }
+    
+    async def retry_failed(self, session_id: str, client_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        失敗したタスクの部分再実行
+        
+        BLOCKED のタスクとその依存先のみを再配置・再実行する。意図解析・タスクプラン・
+        成功済みの成果物は前回の結果を再利用し、新しい結果を完了レポートへ統合する
+        
+        Args:
+            session_id: 完了済みセッションのID
+            client_id: アドミッション制御で公平性を保つ単位
+            
+        Returns:
+            execute_command_sequence と同じ形式の実行結果
+        """
+        previous = self.session_results.get(session_id)
+        if previous is None:
+            raise ValueError(f"No completed session to retry: {session_id}")
+        
+        context = previous["context"]
+        return await self._run_admitted(
+            context, client_id, lambda: self._retry_command_sequence(context, previous)
+        )
+    
+    async def _retry_command_sequence(self, context: CommandContext, previous: Dict[str, Any]) -> Dict[str, Any]:
+        """失敗タスク再実行の本体 (アドミッション済み)"""
+        session_id = context.session_id
+        
+        try:
+            await self._ensure_components(*SEQUENCE_COMPONENTS)
+            retry_tasks = self._retry_targets(session_id)
+            attempt = len(context.performance_metrics.setdefault("retries", [])) + 1
+            self.logger.info(f"Retrying {len(retry_tasks)} tasks in session {session_id} (attempt {attempt})")
+            
+            self._wal_append({"type": "session_reopened", "session_id": session_id, "reason": "retry_failed"})
+            for task in retry_tasks:
+                task.status = TaskStatus.PENDING
+                task.assigned_agents = []
+                task.add_log("retry_scheduled", {"attempt": attempt})
+            
+            self._record_phase(context, {
+                "phase": "retry",
+                "timestamp": datetime.now(timezone.utc),
+                "attempt": attempt,
+                "retried_tasks": [t.id for t in retry_tasks]
+            })
+            
+            context.current_phase = "agent_allocation"
+            allocation = await self._allocate_agents(retry_tasks, context) if retry_tasks else {}
             context.current_phase = "execution"
+            retry_result = await self._execute_task_plan(retry_tasks, allocation, context)
             
-            # フェーズ4: 実行とモニタリング
-            execution_result = await self._execute_task_plan(task_plan, agent_allocation, context)
-            context.current_phase = "quality_analysis"
+            # 前回の成功結果と統合 (失敗は今回の再実行分のみ)
+            previous_execution = previous["execution_result"]
+            total_tasks = self.tasks.session_total(session_id)
+            successful = {**previous_execution.get("successful_tasks", {}), **retry_result["successful_tasks"]}
+            execution_result = {
+                **retry_result,
+                "successful_tasks": successful,
+                "completion_rate": len(successful) / total_tasks if total_tasks else 0,
+                "retried_tasks": [t.id for t in retry_tasks]
+            }
+            context.performance_metrics["retries"].append({
+                "attempt": attempt,
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "retried_tasks": len(retry_tasks),
+                "recovered_tasks": len(retry_result["successful_tasks"]),
+                "still_failed": len(retry_result["failed_tasks"])
+            })
             
-            # フェーズ5: 品質分析
+            context.current_phase = "quality_analysis"
             quality_result = await self._analyze_quality(execution_result, context)
-            context.current_phase = "completion"
             
-            # フェーズ6: 完了処理
-            completion_result = await self._complete_command_sequence(
-                execution_result, quality_result, context
+            result = await self._finish_command_sequence(execution_result, quality_result, context)
+            result["results"]["retries"] = context.performance_metrics["retries"]
+            return result
+            
+        except Exception as e:
+            return self._fail_command_sequence(e, context)
+        
+        finally:
+            if session_id in self.active_contexts:
+                del self.active_contexts[session_id]
+    
+    def _retry_targets(self, session_id: str) -> List[CommandTask]:
+        """再実行対象: BLOCKED タスクと、その推移的な依存先のうち未完了のもの"""
+        session_tasks = self.tasks.by_session(session_id)
+        dependents: Dict[str, List[CommandTask]] = {}
+        for task in session_tasks:
+            for dep_id in task.dependencies:
+                dependents.setdefault(dep_id, []).append(task)
+        
+        targets: Dict[str, CommandTask] = {}
+        stack = [task for task in session_tasks if task.status == TaskStatus.BLOCKED]
+        while stack:
+            task = stack.pop()
+            if task.id in targets or task.status in (TaskStatus.COMPLETED, TaskStatus.ARCHIVED):
+                continue
+            targets[task.id] = task
+            stack.extend(dependents.get(task.id, []))
+        
+        # 元のプラン順を保つ
+        return [task for task in session_tasks if task.id in targets]
+    
+    async def resume_session(self, session_id: str, client_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        WAL から復旧したセッションの再開
+        
+        完了済みタスクは再実行せず、その結果を引き継いで残りのタスクのみ実行する
+        
+        Args:
+            session_id: 復旧対象のセッションID
+            client_id: アドミッション制御で公平性を保つ単位
+            
+        Returns:
+            execute_command_sequence と同じ形式の実行結果
+        """
+        state = self.recovered_sessions.pop(session_id, None)
+        if state is None:
+            raise ValueError(f"No recoverable session: {session_id}")
+        
+        context = CommandContext(
+            session_id=session_id,
+            user_intent=state["user_intent"] or "",
+            current_phase="recovery",
+            execution_history=[self._restore_history_entry(entry) for entry in state["phases"]]
+        )
+        
+        def on_rejected():
+            self.recovered_sessions[session_id] = state
+        
+        try:
+            return await self._run_admitted(
+                context, client_id, lambda: self._resume_command_sequence(context, state), on_rejected
+            )
+        finally:
+            self.resume_tasks.pop(session_id, None)
+    
+    async def _resume_command_sequence(self, context: CommandContext, state: Dict[str, Any]) -> Dict[str, Any]:
+        """復旧セッション本体 (アドミッション済み)"""
+        session_id = context.session_id
+        
+        try:
+            self.logger.info(f"Command sequence resumed: {session_id}")
+            await self._ensure_components(*SEQUENCE_COMPONENTS)
+            done = {task_id for task_id, status in state["status"].items() if status in DONE_STATUSES}
+            phases = {entry.get("phase") for entry in context.execution_history}
+            
+            analysis = next(
+                (entry.get("output") for entry in context.execution_history if entry.get("phase") == "intent_analysis"),
+                None
             )
+            if analysis is None:
+                analysis = await self._analyze_user_intent(context.user_intent, context)
             
-            # 成功ログ
-            self.logger.info(f"Command sequence completed successfully: {session_id}")
+            if "task_planning" in phases:
+                tasks = [self._restore_task(record, record["id"] in done, context) for record in state["tasks"].values()]
+            else:
+                # タスク分解の途中で停止したセッションは再分解し、ID が一致する完了済みタスクを引き継ぐ
+                tasks = await self._create_task_plan(analysis, context)
+                for task in tasks:
+                    if task.id in done:
+                        task.mark_completed()
+                        task.add_log("task_recovered", {"source": "session_wal"})
             
-            return {
-                "session_id": session_id,
-                "status": "completed",
-                "results": completion_result,
-                "quality_metrics": quality_result,
-                "execution_time": (datetime.now(timezone.utc) - context.execution_history[0]["timestamp"]).total_seconds(),
-                "context": context
+            recovered_results = {
+                task.id: state["results"].get(task.id, {}) for task in tasks if task.status == TaskStatus.COMPLETED
             }
+            pending = [task for task in tasks if task.status != TaskStatus.COMPLETED]
+            self._record_phase(context, {
+                "phase": "recovery",
+                "timestamp": datetime.now(timezone.utc),
+                "recovered_tasks": len(recovered_results),
+                "pending_tasks": len(pending)
+            })
             
-        except Exception as e:
-            self.logger.error(f"Command sequence failed: {e}", exc_info=True)
-            context.current_phase = "error"
+            context.current_phase = "agent_allocation"
+            allocation = await self._allocate_agents(pending, context) if pending else {}
+            context.current_phase = "execution"
+            execution_result = await self._execute_task_plan(pending, allocation, context)
             
-            return {
-                "session_id": session_id,
-                "status": "failed",
-                "error": str(e),
-                "context": context
-            }
+            # 完了済みタスクの結果を統合
+            execution_result["successful_tasks"] = {**recovered_results, **execution_result["successful_tasks"]}
+            execution_result["completion_rate"] = len(execution_result["successful_tasks"]) / len(tasks) if tasks else 0
+            execution_result["recovered_tasks"] = list(recovered_results)
+            
+            context.current_phase = "quality_analysis"
+            quality_result = await self._analyze_quality(execution_result, context)
+            
+            return await self._finish_command_sequence(execution_result, quality_result, context)
+            
+        except Exception as e:
+            return self._fail_command_sequence(e, context)
         
         finally:
-            # コンテキストクリーンアップ
             if session_id in self.active_contexts:
                 del self.active_contexts[session_id]
     
+    @staticmethod
+    def _restore_history_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+        """WAL の実行履歴エントリを復元 (タイムスタンプを datetime へ)"""
+        entry = dict(entry)
+        try:
+            entry["timestamp"] = datetime.fromisoformat(entry["timestamp"])
+        except (KeyError, TypeError, ValueError):
+            entry["timestamp"] = datetime.now(timezone.utc)
+        return entry
+    
+    def _restore_task(self, record: Dict[str, Any], completed: bool, context: CommandContext) -> CommandTask:
+        """WAL のタスクレコードから司令塔タスクを復元・登録 (エージェント配置は破棄)"""
+        task = CommandTask(
+            id=record["id"],
+            name=record["name"],
+            description=record.get("description", ""),
+            status=TaskStatus.COMPLETED if completed else TaskStatus.PENDING,
+            priority=Priority(record.get("priority", "medium")),
+            dependencies=record.get("dependencies", []),
+            metadata=record.get("metadata", {}),
+            logs=record.get("logs", [])
+        )
+        if completed:
+            task.completed_at = datetime.now(timezone.utc)
+        task.add_log("task_recovered", {"source": "session_wal", "completed": completed})
+        self.tasks.add(task, context.session_id)
+        return task
+    
+    def _wal_append(self, record: Dict[str, Any]):
+        """WAL へレコード追記 (WAL 無効時は何もしない)"""
+        if self.session_wal is not None:
+            self.session_wal.append(record)
+    
+    def _record_phase(self, context: CommandContext, entry: Dict[str, Any]):
+        """実行履歴への記録と WAL への追記"""
+        context.execution_history.append(entry)
+        self._wal_append({"type": "phase", "session_id": context.session_id, "entry": entry})
+    
+    def _log_task_transition(self, task: CommandTask, session_id: Optional[str], old_status: TaskStatus):
+        """タスクステータス遷移の WAL 記録"""
+        if session_id is not None:
+            self._wal_append({
+                "type": "task_status",
+                "session_id": session_id,
+                "task_id": task.id,
+                "status": task.status.value
+            })
+    
     async def _analyze_user_intent(self, user_intent: str, context: CommandContext) -> Dict[str, Any]:
         """ユーザー意図の解析"""
-        self.logger.debug(f"Analyzing user intent: {user_intent}")
+        self.logger.debug("Analyzing user intent: %s", user_intent)
         
-        # Claude Bridge を使用した意図解析
-        analysis = await self.claude_bridge.analyze_intent(user_intent)
+        # Claude Bridge を使用した意図解析 (キャッシュ / 実行中の同一解析を優先)
+        if self.intent_cache is not None:
+            analysis = await self.intent_cache.get_or_analyze(user_intent, self.claude_bridge.analyze_intent)
+        else:
+            analysis = await self.claude_bridge.analyze_intent(user_intent)
         
-        context.execution_history.append({
+        self._record_phase(context, {
             "phase": "intent_analysis",
             "timestamp": datetime.now(timezone.utc),
             "input": user_intent,
@@ -317,32 +960,68 @@ class CommandTower:
         # プロジェクトオーケストレーターによるタスク分解
         task_breakdown = await self.project_orchestrator.create_task_breakdown(analysis)
         
-        tasks = []
-        for i, task_info in enumerate(task_breakdown):
-            task = CommandTask(
-                id=f"{context.session_id}_task_{i:03d}",
-                name=task_info.get("name", f"Task {i+1}"),
-                description=task_info.get("description", ""),
-                priority=Priority(task_info.get("priority", "medium")),
-                metadata=task_info.get("metadata", {})
-            )
-            
-            task.add_log("task_created", {"source": "command_tower"})
-            tasks.append(task)
-            self.tasks[task.id] = task
+        plan_ids: Dict[str, str] = {}
+        tasks = [
+            self._new_command_task(task_info, i, context, plan_ids)
+            for i, task_info in enumerate(task_breakdown)
+        ]
         
-        context.execution_history.append({
+        self._record_task_planning(tasks, context)
+        return tasks
+    
+    def _new_command_task(
+        self,
+        task_info: Dict[str, Any],
+        index: int,
+        context: CommandContext,
+        plan_ids: Dict[str, str]
+    ) -> CommandTask:
+        """
+        タスク分解結果から司令塔タスクを作成・登録
+        
+        Args:
+            task_info: タスク分解結果の1件
+            index: プラン内の順番
+            context: 実行コンテキスト
+            plan_ids: タスク分解側のタスクID -> 司令塔タスクID (このプランで作成済みのもの)
+        """
+        task_id = f"{context.session_id}_task_{index:03d}"
+        
+        # 依存関係の引き継ぎ (指定がない場合は従来通り直前のタスクに続けて実行)
+        declared = task_info.get("dependencies")
+        if declared is None:
+            dependencies = [f"{context.session_id}_task_{index-1:03d}"] if index > 0 else []
+        else:
+            dependencies = [plan_ids.get(dep_id, dep_id) for dep_id in declared]
+        if task_info.get("id"):
+            plan_ids[task_info["id"]] = task_id
+        
+        task = CommandTask(
+            id=task_id,
+            name=task_info.get("name", f"Task {index+1}"),
+            description=task_info.get("description", ""),
+            priority=Priority(task_info.get("priority", "medium")),
+            dependencies=dependencies,
+            metadata=task_info.get("metadata", {})
+        )
+        
+        task.add_log("task_created", {"source": "command_tower"})
+        self.tasks.add(task, context.session_id)
+        self._wal_append({"type": "task_planned", "session_id": context.session_id, "task": task.to_record()})
+        return task
+    
+    def _record_task_planning(self, tasks: List[CommandTask], context: CommandContext):
+        """タスクプランニングの実行履歴記録"""
+        self._record_phase(context, {
             "phase": "task_planning",
             "timestamp": datetime.now(timezone.utc),
             "task_count": len(tasks),
             "tasks": [{"id": t.id, "name": t.name} for t in tasks]
         })
-        
-        return tasks
     
     async def _allocate_agents(self, tasks: List[CommandTask], context: CommandContext) -> Dict[str, List[str]]:
         """エージェント配置"""
-        self.logger.debug(f"Allocating agents for {len(tasks)} tasks")
+        self.logger.debug("Allocating agents for %d tasks", len(tasks))
         
         # AgentCoordinator によるエージェント配置
         allocation = await self.agent_coordinator.allocate_agents_to_tasks(
@@ -355,17 +1034,20 @@ class CommandTower:
                 task.assigned_agents = allocation[task.id]
                 task.add_log("agents_allocated", {"agents": task.assigned_agents})
         
+        self._record_agent_allocation(allocation, context)
+        return allocation
+    
+    def _record_agent_allocation(self, allocation: Dict[str, List[str]], context: CommandContext):
+        """エージェント配置の実行履歴記録"""
         context.active_agents = list(set([agent for agents in allocation.values() for agent in agents]))
         context.resource_allocation = allocation
         
-        context.execution_history.append({
+        self._record_phase(context, {
             "phase": "agent_allocation",
             "timestamp": datetime.now(timezone.utc),
             "allocation": allocation,
             "total_agents": len(context.active_agents)
         })
-        
-        return allocation
     
     async def _execute_task_plan(
         self,
@@ -373,99 +1055,280 @@ class CommandTower:
         allocation: Dict[str, List[str]],
         context: CommandContext
     ) -> Dict[str, Any]:
-        """タスクプラン実行"""
+        """タスクプラン実行 (依存関係を満たしたタスクから並行実行)"""
         self.logger.info(f"Executing task plan with {len(tasks)} tasks")
         
-        execution_results = {}
-        failed_tasks = []
-        
-        # 依存関係に基づくタスク実行順序決定
+        # 依存関係に基づくタスク実行順序決定 (並行実行時の優先順)
         execution_order = self._resolve_task_dependencies(tasks)
         
-        for task in execution_order:
-            try:
-                task.status = TaskStatus.IN_PROGRESS
-                task.add_log("execution_started")
-                
-                # エージェント協調による実行
-                result = await self.agent_coordinator.execute_task_with_agents(
-                    task_id=task.id,
-                    agents=task.assigned_agents,
-                    task_spec={
-                        "name": task.name,
-                        "description": task.description,
-                        "metadata": task.metadata
-                    }
-                )
-                
-                if result.get("success", False):
-                    task.mark_completed()
-                    execution_results[task.id] = result
-                    self.logger.info(f"Task completed successfully: {task.name}")
-                else:
-                    task.status = TaskStatus.BLOCKED
-                    task.add_log("execution_failed", {"error": result.get("error")})
-                    failed_tasks.append(task)
-                    self.logger.warning(f"Task failed: {task.name} - {result.get('error')}")
-                
-            except Exception as e:
-                task.status = TaskStatus.BLOCKED
-                task.add_log("execution_error", {"exception": str(e)})
+        task_results: Dict[str, Any] = {}
+        outcome = await self.plan_executor.execute(
+            execution_order,
+            lambda task: self._run_plan_task(task, task_results),
+            self._on_task_blocked,
+            allocate_agents=self._allocate_deferred_agents
+        )
+        
+        return self._summarize_execution(outcome, task_results, context)
+    
+    def _on_task_blocked(self, task: CommandTask, action: str, details: Dict[str, Any]):
+        """依存先の失敗などで実行されなかったタスクの記録"""
+        task.status = TaskStatus.BLOCKED
+        task.add_log(action, details)
+        self.logger.warning("Task blocked without execution: %s - %s", task.name, details)
+    
+    def _summarize_execution(
+        self,
+        outcome: Dict[str, Any],
+        task_results: Dict[str, Any],
+        context: CommandContext
+    ) -> Dict[str, Any]:
+        """プラン実行結果の集約と実行履歴記録"""
+        tasks = outcome["tasks"]
+        execution_results = {}
+        failed_tasks = []
+        for task in tasks:
+            if task.id in outcome["succeeded"]:
+                execution_results[task.id] = task_results[task.id]
+            else:
                 failed_tasks.append(task)
-                self.logger.error(f"Task execution error: {task.name} - {e}")
         
-        context.execution_history.append({
+        self.logger.info(
+            f"Task plan finished in {outcome['wall_time']:.2f}s "
+            f"(first result {outcome['first_result_time'] or 0.0:.2f}s, "
+            f"critical path {outcome['critical_path_time']:.2f}s, peak parallelism {outcome['peak_parallelism']})"
+        )
+        
+        self._record_phase(context, {
             "phase": "task_execution",
             "timestamp": datetime.now(timezone.utc),
             "completed_tasks": len(execution_results),
             "failed_tasks": len(failed_tasks),
-            "results": execution_results
+            "blocked_tasks": len(outcome["blocked"]),
+            "results": execution_results,
+            "wall_time": outcome["wall_time"],
+            "first_result_time": outcome["first_result_time"],
+            "critical_path": outcome["critical_path"],
+            "critical_path_time": outcome["critical_path_time"]
         })
         
         return {
             "successful_tasks": execution_results,
             "failed_tasks": [{"id": t.id, "name": t.name, "error": t.logs[-1].get("details", {})} for t in failed_tasks],
-            "completion_rate": len(execution_results) / len(tasks) if tasks else 0
+            "completion_rate": len(execution_results) / len(tasks) if tasks else 0,
+            "critical_path": outcome["critical_path"],
+            "critical_path_time": outcome["critical_path_time"],
+            "wall_time": outcome["wall_time"],
+            "peak_parallelism": outcome["peak_parallelism"]
         }
     
+    async def _execute_streaming(
+        self,
+        analysis: Dict[str, Any],
+        context: CommandContext
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        ストリーミング実行
+        
+        タスク分解で詳細化されたタスクから順に配置・実行し、品質指標も
+        タスク完了ごとに更新する。戻り値は逐次実行時の実行結果・品質分析と同じ形式
+        """
+        self.logger.info("Executing command sequence in streaming mode")
+        
+        tasks: List[CommandTask] = []
+        allocation: Dict[str, List[str]] = {}
+        task_results: Dict[str, Any] = {}
+        progress = {"completed": 0, "failed": 0}
+        timeline: List[Dict[str, Any]] = []
+        context.performance_metrics["quality_progress"] = timeline
+        started_at = time.monotonic()
+        plan_ids: Dict[str, str] = {}
+        
+        async def task_source():
+            async for task_info in self.project_orchestrator.iter_task_breakdown(analysis):
+                task = self._new_command_task(task_info, len(tasks), context, plan_ids)
+                tasks.append(task)
+                
+                task_allocation = await self.agent_coordinator.allocate_agents_to_tasks(
+                    [{"id": task.id, "requirements": task.metadata.get("agent_requirements", {})}]
+                )
+                if task.id in task_allocation:
+                    allocation[task.id] = task.assigned_agents = task_allocation[task.id]
+                    task.add_log("agents_allocated", {"agents": task.assigned_agents})
+                
+                context.current_phase = "execution"
+                yield task
+            
+            self._record_task_planning(tasks, context)
+            self._record_agent_allocation(allocation, context)
+        
+        def on_finished(task: CommandTask, success: bool):
+            progress["completed" if success else "failed"] += 1
+            snapshot = self._build_quality_result(
+                progress["completed"], progress["failed"], progress["completed"] / len(tasks)
+            )
+            timeline.append({
+                "elapsed": time.monotonic() - started_at,
+                "task_id": task.id,
+                "tasks_known": len(tasks),
+                "overall_score": snapshot["overall_score"],
+                "completion_rate": snapshot["completion_rate"],
+                "error_rate": snapshot["error_rate"]
+            })
+        
+        outcome = await self.plan_executor.execute_stream(
+            task_source(),
+            lambda task: self._run_plan_task(task, task_results),
+            self._on_task_blocked,
+            on_finished,
+            allocate_agents=self._allocate_deferred_agents
+        )
+        
+        execution_result = self._summarize_execution(outcome, task_results, context)
+        context.current_phase = "quality_analysis"
+        quality_result = self._build_quality_result(
+            len(execution_result["successful_tasks"]),
+            len(execution_result["failed_tasks"]),
+            execution_result["completion_rate"]
+        )
+        self._record_quality(quality_result, context)
+        
+        return execution_result, quality_result
+    
+    async def _allocate_deferred_agents(self, task: CommandTask) -> List[str]:
+        """計画時にエージェントを確保できなかったタスクの再配置 (エージェント解放後にプランエグゼキューターから呼ばれる)"""
+        allocation = await self.agent_coordinator.allocate_agents_to_tasks(
+            [{"id": task.id, "requirements": task.metadata.get("agent_requirements", {})}]
+        )
+        agents = allocation.get(task.id, [])
+        if agents:
+            task.add_log("agents_allocated", {"agents": agents, "deferred": True})
+        return agents
+    
+    async def _run_plan_task(self, task: CommandTask, results: Dict[str, Any]) -> bool:
+        """プラン内の単一タスク実行 (成功時 True)"""
+        try:
+            task.status = TaskStatus.IN_PROGRESS
+            task.add_log("execution_started")
+            
+            # エージェント協調による実行
+            result = await self.agent_coordinator.execute_task_with_agents(
+                task_id=task.id,
+                agents=task.assigned_agents,
+                task_spec={
+                    "name": task.name,
+                    "description": task.description,
+                    "metadata": task.metadata
+                }
+            )
+            
+            if result.get("success", False):
+                # 完了遷移より先に結果を記録し、復旧時に結果のない完了タスクを作らない
+                self._wal_append({
+                    "type": "task_result",
+                    "session_id": self.tasks.session_of(task.id),
+                    "task_id": task.id,
+                    "result": result
+                })
+                task.mark_completed()
+                results[task.id] = result
+                self.logger.info("Task completed successfully: %s", task.name)
+                return True
+            
+            task.status = TaskStatus.BLOCKED
+            task.add_log("execution_failed", {"error": result.get("error")})
+            self.logger.warning("Task failed: %s - %s", task.name, result.get('error'))
+            return False
+            
+        except Exception as e:
+            task.status = TaskStatus.BLOCKED
+            task.add_log("execution_error", {"exception": str(e)})
+            self.logger.error(f"Task execution error: {task.name} - {e}")
+            return False
+    
     def _resolve_task_dependencies(self, tasks: List[CommandTask]) -> List[CommandTask]:
-        """タスク依存関係解決"""
-        # 単純な依存関係解決 (実際はより複雑なアルゴリズムが必要)
-        task_map = {task.id: task for task in tasks}
-        resolved = []
-        remaining = tasks.copy()
-        
-        while remaining:
-            # 依存関係のないタスクを探す
-            ready_tasks = [
-                task for task in remaining
-                if all(dep_id in [t.id for t in resolved] for dep_id in task.dependencies)
-            ]
-            
-            if not ready_tasks:
-                # 循環依存または未解決依存関係
-                self.logger.warning("Circular dependency detected or unresolved dependencies")
-                resolved.extend(remaining)
-                break
-            
-            # 優先度順でソート
-            ready_tasks.sort(key=lambda t: t.priority.value, reverse=True)
-            selected = ready_tasks[0]
-            
-            resolved.append(selected)
-            remaining.remove(selected)
+        """
+        タスク依存関係解決 (優先度ヒープ付き Kahn 法, O((V+E) log V))
+        
+        実行可能になったタスクは優先度順 (同順位は元の順序) に取り出す。
+        循環依存に含まれるタスクは末尾に残し、循環を構成するタスク名を報告する
+        """
+        index = {task.id: i for i, task in enumerate(tasks)}
+        in_degree = [0] * len(tasks)
+        dependents: List[List[int]] = [[] for _ in tasks]
+        
+        for i, task in enumerate(tasks):
+            for dep_id in dict.fromkeys(task.dependencies):
+                dep_index = index.get(dep_id)
+                if dep_index is None:
+                    # プラン外の依存は解決済みとみなす
+                    continue
+                in_degree[i] += 1
+                dependents[dep_index].append(i)
+        
+        ready = [(PRIORITY_RANK[task.priority], i) for i, task in enumerate(tasks) if in_degree[i] == 0]
+        heapq.heapify(ready)
+        resolved: List[CommandTask] = []
+        
+        while ready:
+            _, i = heapq.heappop(ready)
+            resolved.append(tasks[i])
+            for dependent in dependents[i]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    heapq.heappush(ready, (PRIORITY_RANK[tasks[dependent].priority], dependent))
+        
+        if len(resolved) < len(tasks):
+            remaining = [i for i in range(len(tasks)) if in_degree[i] > 0]
+            cycle = self._find_dependency_cycle(tasks, index, in_degree, remaining[0])
+            cycle_names = [tasks[i].name for i in cycle]
+            self.logger.warning(
+                f"Circular dependency detected among {len(remaining)} tasks: "
+                + " -> ".join(cycle_names + cycle_names[:1])
+            )
+            for i in cycle:
+                tasks[i].add_log("dependency_cycle", {"cycle": [tasks[j].id for j in cycle]})
+            resolved.extend(tasks[i] for i in remaining)
         
         return resolved
     
+    @staticmethod
+    def _find_dependency_cycle(
+        tasks: List[CommandTask],
+        index: Dict[str, int],
+        in_degree: List[int],
+        start: int
+    ) -> List[int]:
+        """未解決タスクから依存を辿り、循環を1つ特定"""
+        # 未解決タスクは必ず未解決の依存を持つため、辿れば必ず循環に到達する
+        visited_at: Dict[int, int] = {}
+        path: List[int] = []
+        node = start
+        while node not in visited_at:
+            visited_at[node] = len(path)
+            path.append(node)
+            node = next(
+                index[dep_id] for dep_id in tasks[node].dependencies
+                if dep_id in index and in_degree[index[dep_id]] > 0
+            )
+        return path[visited_at[node]:]
+    
     async def _analyze_quality(self, execution_result: Dict[str, Any], context: CommandContext) -> Dict[str, Any]:
         """品質分析"""
         self.logger.debug("Analyzing execution quality")
         
-        # 品質メトリクス計算
-        completion_rate = execution_result.get("completion_rate", 0)
-        error_rate = len(execution_result.get("failed_tasks", [])) / (
-            len(execution_result.get("successful_tasks", {})) + len(execution_result.get("failed_tasks", []))
-        ) if (execution_result.get("successful_tasks") or execution_result.get("failed_tasks")) else 0
+        quality_result = self._build_quality_result(
+            len(execution_result.get("successful_tasks", {})),
+            len(execution_result.get("failed_tasks", [])),
+            execution_result.get("completion_rate", 0)
+        )
+        self._record_quality(quality_result, context)
+        
+        return quality_result
+    
+    def _build_quality_result(self, completed: int, failed: int, completion_rate: float) -> Dict[str, Any]:
+        """品質メトリクス計算 (ストリーミング実行中の途中経過にも使用)"""
+        error_rate = failed / (completed + failed) if (completed or failed) else 0
         
         quality_score = max(0, 1.0 - error_rate) * completion_rate
         
@@ -484,14 +1347,16 @@ class CommandTower:
         if completion_rate < 0.9:
             quality_result["recommendations"].append("Review task dependencies and resource allocation")
         
+        return quality_result
+    
+    def _record_quality(self, quality_result: Dict[str, Any], context: CommandContext):
+        """品質分析結果の記録"""
         context.quality_thresholds = quality_result
-        context.execution_history.append({
+        self._record_phase(context, {
             "phase": "quality_analysis",
             "timestamp": datetime.now(timezone.utc),
             "quality_metrics": quality_result
         })
-        
-        return quality_result
     
     async def _complete_command_sequence(
         self,
@@ -504,20 +1369,16 @@ class CommandTower:
         
         # 完了したタスクの消し込み処理
         if self.config.get("command_tower", {}).get("auto_archive_completed", True):
-            completed_tasks = [
-                task for task in self.tasks.values()
-                if task.status == TaskStatus.COMPLETED and context.session_id in task.id
-            ]
-            
-            for task in completed_tasks:
+            for task in self.tasks.by_session(context.session_id, TaskStatus.COMPLETED):
                 task.archive_task("command_sequence_completion")
+            self.tasks.flush_archived()
         
         # 最終結果レポート生成
         completion_result = {
             "session_summary": {
                 "user_intent": context.user_intent,
                 "execution_phases": len(context.execution_history),
-                "total_tasks": len([t for t in self.tasks.values() if context.session_id in t.id]),
+                "total_tasks": self.tasks.session_total(context.session_id),
                 "completed_tasks": len(execution_result.get("successful_tasks", {})),
                 "failed_tasks": len(execution_result.get("failed_tasks", [])),
             },
@@ -533,7 +1394,7 @@ class CommandTower:
             "next_steps": self._generate_next_steps(execution_result, quality_result)
         }
         
-        context.execution_history.append({
+        self._record_phase(context, {
             "phase": "completion",
             "timestamp": datetime.now(timezone.utc),
             "final_result": completion_result
@@ -565,17 +1426,27 @@ class CommandTower:
                 "active": self.is_active,
                 "startup_time": self.startup_time.isoformat() if self.startup_time else None,
                 "active_contexts": len(self.active_contexts),
-                "total_tasks": len(self.tasks),
-                "pending_tasks": len([t for t in self.tasks.values() if t.status == TaskStatus.PENDING]),
-                "in_progress_tasks": len([t for t in self.tasks.values() if t.status == TaskStatus.IN_PROGRESS]),
-                "completed_tasks": len([t for t in self.tasks.values() if t.status == TaskStatus.COMPLETED]),
-                "archived_tasks": len([t for t in self.tasks.values() if t.status == TaskStatus.ARCHIVED])
+                "admission": self.admission.get_stats(),
+                "total_tasks": self.tasks.total,
+                "pending_tasks": self.tasks.count(TaskStatus.PENDING),
+                "in_progress_tasks": self.tasks.count(TaskStatus.IN_PROGRESS),
+                "completed_tasks": self.tasks.count(TaskStatus.COMPLETED),
+                "archived_tasks": self.tasks.count(TaskStatus.ARCHIVED),
+                "blocked_tasks": self.tasks.count(TaskStatus.BLOCKED),
+                "task_store": self.tasks.get_stats(),
+                "intent_cache": self.intent_cache.get_stats() if self.intent_cache is not None else None,
+                "session_wal": self.session_wal.get_stats() if self.session_wal is not None else None,
+                "recoverable_sessions": len(self.recovered_sessions),
+                "resuming_sessions": len(self.resume_tasks)
             },
+            # 未初期化のコンポーネントは生成せずに状態のみ報告
             "components": {
-                "project_orchestrator": await self.project_orchestrator.get_status(),
-                "meta_manager": await self.meta_manager.get_status(),
-                "agent_coordinator": await self.agent_coordinator.get_status(),
-                "claude_bridge": await self.claude_bridge.get_status()
+                name: (
+                    await self._components[name].get_status()
+                    if name in self._initialized_components
+                    else {"initialized": False}
+                )
+                for name in COMPONENTS
             }
         }
     
@@ -583,15 +1454,27 @@ class CommandTower:
         """司令塔シャットダウン"""
         self.logger.info("Command Tower shutdown initiated")
         
-        # アクティブなコンテキストの保存
+        # 再開中のセッションは WAL に残り、次回起動時に再度復旧される
+        for resume_task in list(self.resume_tasks.values()):
+            resume_task.cancel()
+        
+        # アクティブなコンテキストは WAL に記録済み (次回起動時に完了済みタスクから再開)
         for session_id, context in self.active_contexts.items():
-            self.logger.warning(f"Active context during shutdown: {session_id}")
+            self.logger.warning(f"Active context during shutdown: {session_id} (resumable from WAL)")
+        
+        # コンポーネントシャットダウン (初期化済みのもののみ, 初期化と逆順)
+        for name in reversed(list(COMPONENTS)):
+            if name in self._initialized_components:
+                await self._components[name].shutdown()
+        self._initialized_components.clear()
+        
+        if self.task_archive is not None:
+            self.tasks.flush_archived()
+            await self.task_archive.flush()
+            self.task_archive.close()
         
-        # コンポーネントシャットダウン
-        await self.claude_bridge.shutdown()
-        await self.agent_coordinator.shutdown()
-        await self.meta_manager.shutdown()
-        await self.project_orchestrator.shutdown()
+        if self.session_wal is not None:
+            await self.session_wal.close()
         
         self.is_active = False
         self.logger.info("Command Tower shutdown completed")
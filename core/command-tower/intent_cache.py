@@ -0,0 +1,118 @@
+"""
+Ultimate ShunsukeModel Ecosystem - Intent Analysis Cache
+ユーザー意図解析キャッシュ
+
+正規化した意図文字列をキーに解析結果を保持し (TTL + LRU, 任意のディスク層)、
+同一の意図に対する同時解析要求は実行中の1回の解析を共有する (シングルフライト)
+"""
+
+import asyncio
+import copy
+import re
+from typing import Dict, Any, Optional, Callable, Awaitable
+from pathlib import Path
+
+from ...orchestration.coordinator.result_cache import AgentResultCache, make_cache_key
+
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_intent(user_intent: str) -> str:
+    """意図文字列の正規化 (大文字小文字・空白の差異を無視)"""
+    return _WHITESPACE.sub(" ", user_intent).strip().casefold()
+
+
+class IntentAnalysisCache:
+    """
+    意図解析キャッシュ
+
+    主要機能:
+    1. 正規化した意図による解析結果キャッシュ (TTL + LRU, 任意のディスク層)
+    2. 同一意図の同時解析の合流 (シングルフライト)
+    3. ヒット率 / 合流数の統計
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl: float = 900.0,
+        disk_dir: Optional[Path] = None
+    ):
+        """初期化"""
+        self.cache = AgentResultCache(max_entries=max_entries, default_ttl=ttl, disk_dir=disk_dir)
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self.stats = {'requests': 0, 'coalesced': 0, 'analyses': 0, 'failures': 0}
+
+    @staticmethod
+    def key_of(user_intent: str) -> str:
+        """キャッシュキー生成"""
+        return make_cache_key("intent", {"intent": normalize_intent(user_intent)})
+
+    async def get_or_analyze(
+        self,
+        user_intent: str,
+        analyze: Callable[[str], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        解析結果取得 (キャッシュ → 実行中の解析 → 新規解析の順)
+
+        呼び出し元ごとに独立したコピーを返すため、結果を変更しても他に影響しない
+        """
+        self.stats['requests'] += 1
+        key = self.key_of(user_intent)
+
+        # ディスク層の参照は単一実行のタスク内で行う (ここで await すると重複解析が起きる)
+        cached = self.cache.get_memory(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            self.stats['coalesced'] += 1
+        else:
+            # 解析は呼び出し元から独立したタスクで実行し、先頭の呼び出し元が
+            # キャンセルされても合流中の呼び出し元には結果を届ける
+            in_flight = asyncio.ensure_future(self._analyze(key, user_intent, analyze))
+            self._in_flight[key] = in_flight
+
+        return copy.deepcopy(await asyncio.shield(in_flight))
+
+    async def _analyze(
+        self,
+        key: str,
+        user_intent: str,
+        analyze: Callable[[str], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """ディスク層の参照と解析実行 (成功時のみキャッシュ)"""
+        try:
+            cached = await self.cache.aget(key)
+            if cached is not None:
+                return cached
+            self.stats['analyses'] += 1
+            analysis = await analyze(user_intent)
+        except Exception:
+            self.stats['failures'] += 1
+            raise
+        finally:
+            self._in_flight.pop(key, None)
+
+        await self.cache.aput(key, analysis)
+        return analysis
+
+    def invalidate(self):
+        """キャッシュ無効化"""
+        self.cache.invalidate("intent")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """キャッシュ統計取得"""
+        requests = self.stats['requests']
+        cache_stats = self.cache.get_stats()
+        served = cache_stats['hits'] + cache_stats['disk_hits'] + self.stats['coalesced']
+        return {
+            **self.stats,
+            "in_flight": len(self._in_flight),
+            "hit_rate": cache_stats['hit_rate'],
+            "effective_hit_rate": served / requests if requests else 0.0,
+            "cache": cache_stats
+        }
@@ -0,0 +1,326 @@
+"""
+Ultimate ShunsukeModel Ecosystem - Concurrent Plan Executor
+タスクプランの並行DAG実行
+
+依存タスクが全て完了したタスクから順に起動し、並列度の上限と
+エージェントの占有状況で同時実行数を制御する。失敗したタスクの
+依存先は実行せずに BLOCKED として扱い、クリティカルパス時間を報告する。
+プランは一括でも、生成されるそばから逐次投入 (ストリーミング) でも実行できる
+"""
+
+import asyncio
+import time
+import logging
+from typing import Dict, List, Any, Optional, Set, Tuple, Callable, Awaitable, AsyncIterator
+
+
+class _PlanRun:
+    """1回のプラン実行状態 (タスクの逐次追加に対応)"""
+
+    def __init__(self, executor: 'PlanExecutor', on_blocked: Callable[[Any, str, Dict[str, Any]], None]):
+        self.executor = executor
+        self.on_blocked = on_blocked
+        self.order: List[Any] = []
+        self.tasks: Dict[str, Any] = {}
+        self.rank: Dict[str, int] = {}
+        self.waiting_on: Dict[str, int] = {}
+        self.dependents: Dict[str, List[str]] = {}
+        # まだ投入されていない依存先 -> 待機中のタスク
+        self.unseen: Dict[str, List[str]] = {}
+        self.ready: List[str] = []
+        self.succeeded: Set[str] = set()
+        self.failed: Set[str] = set()
+        self.blocked: Set[str] = set()
+        self.durations: Dict[str, float] = {}
+
+    def add(self, task: Any):
+        """タスク追加"""
+        task_id = task.id
+        self.order.append(task)
+        self.tasks[task_id] = task
+        self.rank[task_id] = len(self.rank)
+        self.dependents[task_id] = self.unseen.pop(task_id, [])
+
+        waiting = 0
+        failed_dep = None
+        for dep in dict.fromkeys(task.dependencies):
+            if dep in self.succeeded:
+                continue
+            if dep in self.failed or dep in self.blocked:
+                failed_dep = dep
+                break
+            if dep in self.tasks:
+                self.dependents[dep].append(task_id)
+            else:
+                self.unseen.setdefault(dep, []).append(task_id)
+            waiting += 1
+        self.waiting_on[task_id] = waiting
+
+        if failed_dep is not None:
+            self.block(task_id, failed_dep, failed_dep)
+        elif waiting == 0:
+            self.ready.append(task_id)
+
+    def close_input(self):
+        """投入終了 (最後まで現れなかった依存は充足済みとみなす)"""
+        for dep, waiters in self.unseen.items():
+            self.executor.logger.warning(
+                f"Dependency {dep} is outside the plan; treating as satisfied for {len(waiters)} tasks"
+            )
+            for task_id in waiters:
+                self._dependency_satisfied(task_id)
+        self.unseen.clear()
+
+    def _dependency_satisfied(self, task_id: str):
+        self.waiting_on[task_id] -= 1
+        if self.waiting_on[task_id] == 0 and task_id not in self.blocked:
+            self.ready.append(task_id)
+
+    def block(self, task_id: str, blocked_by: str, root_id: str):
+        """タスクとその推移的な依存先をブロック"""
+        stack = [(task_id, blocked_by)]
+        while stack:
+            current, cause = stack.pop()
+            if current in self.blocked:
+                continue
+            self.blocked.add(current)
+            self.on_blocked(self.tasks[current], "execution_blocked", {"blocked_by": cause, "root_failure": root_id})
+            stack.extend((dependent_id, current) for dependent_id in self.dependents[current])
+
+    def block_unassigned(self, task_id: str):
+        """エージェントを確保できないまま起動できなくなったタスクのブロック"""
+        self.ready.remove(task_id)
+        self.blocked.add(task_id)
+        self.on_blocked(self.tasks[task_id], "execution_blocked", {"reason": "no_agents_available"})
+        for dependent_id in self.dependents[task_id]:
+            self.block(dependent_id, task_id, task_id)
+
+    def finish(self, task_id: str, success: bool):
+        """タスク終了の反映 (未投入の依存先は add() 時に失敗を検出する)"""
+        if success:
+            self.succeeded.add(task_id)
+            for dependent_id in self.dependents[task_id]:
+                self._dependency_satisfied(dependent_id)
+        else:
+            self.failed.add(task_id)
+            for dependent_id in self.dependents[task_id]:
+                self.block(dependent_id, task_id, task_id)
+
+
+class PlanExecutor:
+    """
+    並行DAGプランエグゼキューター
+
+    主要機能:
+    1. 依存関係充足時点での即時起動 (優先順は投入順に従う)
+    2. 並列度上限とエージェント単位の排他制御 (エージェント未確保のタスクは解放待ち)
+    3. 失敗の依存先への伝播 (実行せずにブロック)
+    4. 実行時間に基づくクリティカルパス算出
+    5. 逐次生成されるタスクのストリーミング実行
+    """
+
+    def __init__(self, max_parallelism: int = 10, logger: Optional[logging.Logger] = None):
+        """初期化"""
+        self.max_parallelism = max(1, max_parallelism)
+        self.logger = logger or logging.getLogger(__name__)
+
+    async def execute(
+        self,
+        ordered_tasks: List[Any],
+        run_task: Callable[[Any], Awaitable[bool]],
+        on_blocked: Callable[[Any, str, Dict[str, Any]], None],
+        on_finished: Optional[Callable[[Any, bool], None]] = None,
+        allocate_agents: Optional[Callable[[Any], Awaitable[List[str]]]] = None
+    ) -> Dict[str, Any]:
+        """
+        プラン実行
+
+        Args:
+            ordered_tasks: 依存関係解決済みのタスク (先頭ほど優先)
+            run_task: タスク実行コルーチン (成功時 True)
+            on_blocked: 実行されなかったタスクへの通知 (task, action, details)
+            on_finished: 実行したタスクの終了通知 (task, success)
+            allocate_agents: エージェント未確保タスクの再配置 (確保したエージェントID)。
+                未確保のタスクは起動せず、実行中タスクがエージェントを解放するたびに再配置する
+
+        Returns:
+            タスクIDごとの成否・所要時間とクリティカルパス
+        """
+        plan = _PlanRun(self, on_blocked)
+        for task in ordered_tasks:
+            plan.add(task)
+        plan.close_input()
+        return await self._run(plan, None, run_task, on_finished, allocate_agents)
+
+    async def execute_stream(
+        self,
+        task_source: AsyncIterator[Any],
+        run_task: Callable[[Any], Awaitable[bool]],
+        on_blocked: Callable[[Any, str, Dict[str, Any]], None],
+        on_finished: Optional[Callable[[Any, bool], None]] = None,
+        allocate_agents: Optional[Callable[[Any], Awaitable[List[str]]]] = None
+    ) -> Dict[str, Any]:
+        """
+        ストリーミング実行 (タスク生成と実行を重ねる)
+
+        task_source から届いたタスクは依存関係を満たしていれば即座に起動する。
+        戻り値は execute() と同じ
+        """
+        return await self._run(_PlanRun(self, on_blocked), task_source, run_task, on_finished, allocate_agents)
+
+    async def _run(
+        self,
+        plan: _PlanRun,
+        task_source: Optional[AsyncIterator[Any]],
+        run_task: Callable[[Any], Awaitable[bool]],
+        on_finished: Optional[Callable[[Any, bool], None]],
+        allocate_agents: Optional[Callable[[Any], Awaitable[List[str]]]]
+    ) -> Dict[str, Any]:
+        """実行ループ"""
+        running: Dict[asyncio.Future, str] = {}
+        busy_agents: Set[str] = set()
+        # エージェント解放の世代と、未確保タスクが最後に再配置を試みた世代
+        releases = 0
+        allocation_attempts: Dict[str, int] = {}
+        peak_parallelism = 0
+        started_at = time.monotonic()
+        first_result_time: Optional[float] = None
+        next_input: Optional[asyncio.Future] = (
+            asyncio.ensure_future(task_source.__anext__()) if task_source is not None else None
+        )
+
+        async def assign_agents():
+            """エージェント未確保の起動可能タスクの再配置 (前回試行後に解放があった場合のみ)"""
+            for task_id in sorted(plan.ready, key=plan.rank.__getitem__):
+                task = plan.tasks[task_id]
+                if task.assigned_agents or allocation_attempts.get(task_id) == releases:
+                    continue
+                allocation_attempts[task_id] = releases
+                task.assigned_agents = list(await allocate_agents(task))
+
+        def launchable() -> List[str]:
+            """エージェントが空いている起動可能タスク (優先順)"""
+            selected = []
+            reserved: Set[str] = set()
+            for task_id in sorted(plan.ready, key=plan.rank.__getitem__):
+                if len(running) + len(selected) >= self.max_parallelism:
+                    break
+                agents = set(plan.tasks[task_id].assigned_agents)
+                if not agents or agents & (busy_agents | reserved):
+                    continue
+                reserved |= agents
+                selected.append(task_id)
+            return selected
+
+        async def timed(task_id: str) -> bool:
+            task_started = time.monotonic()
+            try:
+                return await run_task(plan.tasks[task_id])
+            finally:
+                plan.durations[task_id] = time.monotonic() - task_started
+
+        try:
+            while plan.ready or running or next_input is not None:
+                if allocate_agents is not None:
+                    await assign_agents()
+                for task_id in launchable():
+                    plan.ready.remove(task_id)
+                    busy_agents.update(plan.tasks[task_id].assigned_agents)
+                    running[asyncio.ensure_future(timed(task_id))] = task_id
+                peak_parallelism = max(peak_parallelism, len(running))
+
+                waitables = set(running)
+                if next_input is not None:
+                    waitables.add(next_input)
+                if not waitables:
+                    break
+
+                done, _ = await asyncio.wait(waitables, return_when=asyncio.FIRST_COMPLETED)
+
+                if next_input is not None and next_input in done:
+                    try:
+                        plan.add(next_input.result())
+                        next_input = asyncio.ensure_future(task_source.__anext__())
+                    except StopAsyncIteration:
+                        next_input = None
+                        plan.close_input()
+
+                for finished in done:
+                    task_id = running.pop(finished, None)
+                    if task_id is None:
+                        continue
+                    busy_agents.difference_update(plan.tasks[task_id].assigned_agents)
+                    releases += 1
+
+                    success = bool(not finished.cancelled() and finished.exception() is None and finished.result())
+                    if first_result_time is None:
+                        first_result_time = time.monotonic() - started_at
+                    plan.finish(task_id, success)
+                    if on_finished is not None:
+                        on_finished(plan.tasks[task_id], success)
+        finally:
+            if next_input is not None:
+                next_input.cancel()
+            for pending in running:
+                pending.cancel()
+
+        # 実行中タスクがなくなってもエージェントを確保できなかったタスク
+        for task_id in [task_id for task_id in plan.ready if not plan.tasks[task_id].assigned_agents]:
+            plan.block_unassigned(task_id)
+
+        # 循環依存などで一度も起動できなかったタスク
+        for task_id in plan.tasks:
+            if task_id not in plan.succeeded and task_id not in plan.failed and task_id not in plan.blocked:
+                plan.blocked.add(task_id)
+                plan.on_blocked(plan.tasks[task_id], "execution_blocked", {"reason": "unresolved_dependencies"})
+
+        critical_path, critical_path_time = self._critical_path(plan.order, plan.durations)
+
+        return {
+            "tasks": plan.order,
+            "succeeded": plan.succeeded,
+            "failed": plan.failed,
+            "blocked": plan.blocked,
+            "durations": plan.durations,
+            "wall_time": time.monotonic() - started_at,
+            "first_result_time": first_result_time,
+            "critical_path": critical_path,
+            "critical_path_time": critical_path_time,
+            "peak_parallelism": peak_parallelism
+        }
+
+    @staticmethod
+    def _critical_path(
+        ordered_tasks: List[Any],
+        durations: Dict[str, float]
+    ) -> Tuple[List[str], float]:
+        """実行済みタスクの最長依存チェーン"""
+        finish: Dict[str, float] = {}
+        previous: Dict[str, Optional[str]] = {}
+
+        # 実行済みタスクを依存先が先に来る順で処理 (未確定の依存は後回し)
+        pending = [task for task in ordered_tasks if task.id in durations]
+        while pending:
+            deferred = []
+            for task in pending:
+                deps = [dep for dep in task.dependencies if dep in durations]
+                if any(dep not in finish for dep in deps):
+                    deferred.append(task)
+                    continue
+                best = max(deps, key=finish.__getitem__, default=None)
+                previous[task.id] = best
+                finish[task.id] = (finish[best] if best else 0.0) + durations[task.id]
+            if len(deferred) == len(pending):
+                break
+            pending = deferred
+
+        if not finish:
+            return [], 0.0
+
+        tail = max(finish, key=finish.__getitem__)
+        path = []
+        node: Optional[str] = tail
+        while node is not None:
+            path.append(node)
+            node = previous.get(node)
+        return list(reversed(path)), finish[tail]
@@ -0,0 +1,364 @@
+"""
+Ultimate ShunsukeModel Ecosystem - Command Session Write-Ahead Log
+コマンドセッションの先行書き込みログ (WAL)
+
+セッション開始 / フェーズ結果 / タスク状態遷移を追記専用の JSONL へ記録する。
+書き込みはバッファリングし、一定間隔ごとにまとめて fsync する (グループコミット)。
+WAL ファイルは複数プロセスで共有し、書き込みと圧縮はロックファイルの排他ロック下で行う。
+各セッションは開始したプロセス (オーナー) に属し、起動時の復旧ではオーナーが
+終了済みの未完了セッションのみを引き継ぐ。解放済みの完了セッションは実行中にも圧縮で除去する
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Dict, List, Any, Optional, Iterator
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+# 完了済みとして再実行しないタスクステータス
+DONE_STATUSES = frozenset({"completed", "archived"})
+
+
+class SessionWAL:
+    """
+    セッション WAL
+
+    主要機能:
+    1. レコードのバッファリングと間隔 / 件数によるバッチ fsync
+    2. オーナープロセスが終了済みの未完了セッションの引き継ぎと状態復元
+    3. ロックファイルによるプロセス間の書き込み / 圧縮の排他制御
+    4. 解放済み / オーナー終了済みの完了セッションを除去するログ圧縮 (起動時と実行中)
+    5. 書き込み統計
+    """
+
+    FILE_NAME = "command-sessions.wal"
+    LOCK_NAME = "command-sessions.wal.lock"
+    OWNER_DIR = "owners"
+
+    def __init__(
+        self,
+        wal_dir: Path,
+        sync_interval: float = 0.05,
+        max_batch: int = 256,
+        compact_every: int = 32
+    ):
+        """初期化"""
+        self.wal_dir = Path(wal_dir)
+        self.path = self.wal_dir / self.FILE_NAME
+        self.lock_path = self.wal_dir / self.LOCK_NAME
+        self.sync_interval = sync_interval
+        self.max_batch = max(1, max_batch)
+        self.compact_every = compact_every
+        self.logger = logging.getLogger(__name__)
+
+        # このプロセスのオーナーID (オーナーロックを保持している間は生存とみなされる)
+        self.owner_id = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._owner_file = None
+        self._lock_file = None
+
+        self._file = None
+        self._buffer: List[bytes] = []
+        self._released_since_compaction = 0
+        self._wakeup: Optional[asyncio.Event] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._write_lock: Optional[asyncio.Lock] = None
+        self._closing = False
+        self.stats = {'records': 0, 'batches': 0, 'bytes': 0, 'compactions': 0, 'adopted': 0}
+
+    def recover(self) -> Dict[str, Dict[str, Any]]:
+        """
+        オーナーが終了済みの未完了セッションを引き継ぎ、その状態を返した上でログを圧縮する
+
+        他の稼働中プロセスが所有するセッションはログに残し、復旧対象にしない
+
+        Returns:
+            session_id -> {"user_intent", "streaming", "phases", "tasks", "status", "results"}
+        """
+        self._acquire_owner()
+        adopted = self._compact(adopt=True)
+        self.logger.info(f"Session WAL recovered: adopted {len(adopted)} incomplete sessions")
+        return adopted
+
+    def _acquire_owner(self):
+        """オーナーロックの取得 (プロセス終了時に OS が解放する)"""
+        if self._owner_file is not None:
+            return
+        owner_dir = self.wal_dir / self.OWNER_DIR
+        owner_dir.mkdir(parents=True, exist_ok=True)
+        # 生存確認 (WAL ロック下で行う) と競合しないよう、作成とロックを WAL ロック下で行う
+        with self._file_lock():
+            self._owner_file = open(owner_dir / f"{self.owner_id}.lock", 'ab')
+            if fcntl is not None:
+                fcntl.flock(self._owner_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+    def _release_owner(self):
+        """オーナーロックの解放"""
+        if self._owner_file is None:
+            return
+        owner_path = Path(self._owner_file.name)
+        self._owner_file.close()
+        self._owner_file = None
+        owner_path.unlink(missing_ok=True)
+
+    def _owner_alive(self, owner: Optional[str], cache: Dict[str, bool]) -> bool:
+        """セッションのオーナープロセスが稼働中か (オーナーロックを取得できなければ稼働中)"""
+        if owner is None:
+            return False
+        if owner == self.owner_id:
+            return True
+        if owner in cache:
+            return cache[owner]
+
+        owner_path = self.wal_dir / self.OWNER_DIR / f"{owner}.lock"
+        alive = False
+        if fcntl is not None and owner_path.exists():
+            with open(owner_path, 'ab') as f:
+                try:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    alive = True
+            if not alive:
+                # 異常終了したオーナーのロックファイルを掃除
+                owner_path.unlink(missing_ok=True)
+        cache[owner] = alive
+        return alive
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """WAL ファイルのプロセス間排他ロック"""
+        if self._lock_file is None:
+            self.wal_dir.mkdir(parents=True, exist_ok=True)
+            self._lock_file = open(self.lock_path, 'ab')
+        if fcntl is None:
+            yield
+            return
+        fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+
+    @staticmethod
+    def _apply(sessions: Dict[str, Dict[str, Any]], record: Dict[str, Any]):
+        """レコードをセッション状態へ反映"""
+        session_id = record['session_id']
+        state = sessions.get(session_id)
+        if state is None:
+            state = sessions[session_id] = {
+                "user_intent": None,
+                "streaming": False,
+                "phases": [],
+                "tasks": {},
+                "status": {},
+                "results": {},
+                "finished": False,
+                "released": False,
+                "owner": None
+            }
+
+        record_type = record.get('type')
+        if record_type == "session_started":
+            state['user_intent'] = record.get('user_intent')
+            state['streaming'] = record.get('streaming', False)
+            state['owner'] = record.get('owner')
+        elif record_type == "session_adopted":
+            state['owner'] = record.get('owner')
+        elif record_type == "phase":
+            state['phases'].append(record.get('entry', {}))
+        elif record_type == "task_planned":
+            task = record['task']
+            state['tasks'][task['id']] = task
+            state['status'][task['id']] = task.get('status', "pending")
+        elif record_type == "task_status":
+            state['status'][record['task_id']] = record['status']
+        elif record_type == "task_result":
+            state['results'][record['task_id']] = record.get('result')
+        elif record_type == "session_finished":
+            state['finished'] = True
+        elif record_type == "session_reopened":
+            # 失敗タスクの再実行で再開されたセッション
+            state['finished'] = False
+        elif record_type == "session_released":
+            # 再実行用の結果が破棄され、完了後はログに残す必要がなくなったセッション
+            state['released'] = True
+
+    def _compact(self, adopt: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        ロック下で WAL を読み直し、不要になった完了セッションを除いてログを書き直す
+
+        完了済みセッションは解放済み、またはオーナーが終了済みの場合に除去する。
+        adopt=True の場合はオーナーが終了済みの未完了セッションをこのプロセスへ引き継ぐ
+
+        Returns:
+            引き継いだセッションの状態
+        """
+        with self._file_lock():
+            sessions: Dict[str, Dict[str, Any]] = {}
+            records: Dict[str, List[bytes]] = {}
+
+            if self.path.exists():
+                with open(self.path, 'rb') as f:
+                    for raw in f:
+                        try:
+                            record = json.loads(raw)
+                        except ValueError:
+                            # クラッシュ時の書きかけ行
+                            self.logger.warning("Skipping truncated WAL record")
+                            continue
+                        session_id = record.get('session_id')
+                        if session_id is None:
+                            continue
+                        self._apply(sessions, record)
+                        records.setdefault(session_id, []).append(raw if raw.endswith(b'\n') else raw + b'\n')
+
+            alive: Dict[str, bool] = {}
+            adopted: Dict[str, Dict[str, Any]] = {}
+            lines: List[bytes] = []
+            for session_id, state in sessions.items():
+                owner_alive = self._owner_alive(state['owner'], alive)
+                if state['finished']:
+                    if state['released'] or not owner_alive:
+                        continue
+                elif adopt and not owner_alive:
+                    adopted[session_id] = state
+                    records[session_id].append(self._encode({
+                        "type": "session_adopted",
+                        "session_id": session_id,
+                        "owner": self.owner_id,
+                        "previous_owner": state['owner']
+                    }))
+                    state['owner'] = self.owner_id
+                lines.extend(records[session_id])
+
+            reopen = self._file is not None
+            self._close_file()
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.writelines(lines)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+            if reopen:
+                self._file = open(self.path, 'ab')
+
+        self.stats['compactions'] += 1
+        self.stats['adopted'] += len(adopted)
+        return adopted
+
+    @staticmethod
+    def _encode(record: Dict[str, Any]) -> bytes:
+        """レコードを JSONL の1行へ変換"""
+        record.setdefault('ts', time.time())
+        return (json.dumps(record, default=str, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+
+    def start(self):
+        """バッチ書き込みループ開始"""
+        self._acquire_owner()
+        if self._file is None:
+            self.wal_dir.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, 'ab')
+        if self._flusher is None:
+            self._closing = False
+            self._write_lock = asyncio.Lock()
+            self._wakeup = asyncio.Event()
+            self._flusher = asyncio.ensure_future(self._flush_loop())
+
+    def append(self, record: Dict[str, Any]):
+        """レコード追記 (fsync は次のバッチでまとめて行う)"""
+        if record.get('type') == "session_started":
+            record.setdefault('owner', self.owner_id)
+        elif record.get('type') == "session_released":
+            self._released_since_compaction += 1
+        self._buffer.append(self._encode(record))
+        self.stats['records'] += 1
+        if len(self._buffer) >= self.max_batch and self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _flush_loop(self):
+        """一定間隔ごとのグループコミット"""
+        while not self._closing:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.sync_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+                if self.compact_every and self._released_since_compaction >= self.compact_every:
+                    await self.compact()
+            except OSError as e:
+                self.logger.error(f"Session WAL write failed: {e}")
+
+    async def compact(self):
+        """実行中のログ圧縮 (解放済みの完了セッションを除去, 書き込みとは排他)"""
+        async with self._write_lock:
+            self._released_since_compaction = 0
+            await asyncio.get_running_loop().run_in_executor(None, self._compact)
+
+    async def flush(self):
+        """バッファ済みレコードの書き込みと fsync"""
+        if not self._buffer or self._file is None or self._write_lock is None:
+            return
+        async with self._write_lock:
+            batch, self._buffer = self._buffer, []
+            if batch:
+                await asyncio.get_running_loop().run_in_executor(None, self._write_batch, batch)
+
+    def _write_batch(self, batch: List[bytes]):
+        """バッチ書き込み (executor スレッドで実行)"""
+        data = b''.join(batch)
+        with self._file_lock():
+            # 他プロセスの圧縮でファイルが置き換えられていれば開き直す
+            try:
+                replaced = os.stat(self.path).st_ino != os.fstat(self._file.fileno()).st_ino
+            except FileNotFoundError:
+                replaced = True
+            if replaced:
+                self._file.close()
+                self._file = open(self.path, 'ab')
+            self._file.write(data)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        self.stats['batches'] += 1
+        self.stats['bytes'] += len(data)
+
+    def _close_file(self):
+        """ファイルハンドルを閉じる"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    async def close(self):
+        """書き込みループ停止と残りのレコードの書き込み"""
+        if self._flusher is not None:
+            # 書き込み中のバッチを中断しないよう、キャンセルせずにループを終わらせる
+            self._closing = True
+            self._wakeup.set()
+            await self._flusher
+            self._flusher = None
+        await self.flush()
+        self._close_file()
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+        self._release_owner()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """WAL 統計取得"""
+        return {
+            "path": str(self.path),
+            "owner": self.owner_id,
+            "pending_records": len(self._buffer),
+            "avg_batch_size": self.stats['records'] / self.stats['batches'] if self.stats['batches'] else 0.0,
+            **self.stats
+        }
@@ -0,0 +1,184 @@
+"""
+Ultimate ShunsukeModel Ecosystem - Command Task Store
+司令塔タスクストア
+
+ステータス別 / セッション別の二次インデックスと O(1) のステータスカウンターを持ち、
+消し込み (ARCHIVED) されたタスクはディスクのアーカイブへ退避してメモリから外す
+"""
+
+import logging
+from typing import Dict, List, Any, Optional, Iterator, Callable
+from collections.abc import Mapping as MappingABC
+
+from ...orchestration.coordinator.task_archive import TaskArchive
+
+
+class TaskStore(MappingABC):
+    """
+    インデックス付きタスクストア
+
+    主要機能:
+    1. task_id によるアクセス (Mapping 互換)
+    2. ステータス別 / セッション別インデックス
+    3. ステータス別カウンター (累計, 退避済みを含む)
+    4. ARCHIVED タスクのディスク退避
+    5. ステータス遷移の外部通知 (WAL 記録など)
+    """
+
+    def __init__(
+        self,
+        archive: Optional[TaskArchive] = None,
+        evict_archived: bool = True,
+        on_transition: Optional[Callable[[Any, Optional[str], Any], None]] = None
+    ):
+        """初期化"""
+        self.archive = archive
+        self.evict_archived = evict_archived and archive is not None
+        # (task, session_id, old_status) を受け取るステータス遷移フック
+        self.on_transition = on_transition
+        self.logger = logging.getLogger(__name__)
+
+        self._tasks: Dict[str, Any] = {}
+        self._session_of: Dict[str, str] = {}
+        # 挿入順を保つため dict を順序付き集合として使う
+        self._by_status: Dict[Any, Dict[str, None]] = {}
+        self._by_session: Dict[str, Dict[str, None]] = {}
+        self._status_counts: Dict[Any, int] = {}
+        self._session_totals: Dict[str, int] = {}
+        self._pending_archive: Dict[str, None] = {}
+        self.evicted = 0
+
+    # Mapping インターフェース (メモリ上のタスクのみ)
+    def __getitem__(self, task_id: str) -> Any:
+        return self._tasks[task_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._tasks)
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def add(self, task: Any, session_id: Optional[str] = None):
+        """タスク登録"""
+        if task.id in self._tasks:
+            self._unindex(self._tasks[task.id])
+
+        self._tasks[task.id] = task
+        self._by_status.setdefault(task.status, {})[task.id] = None
+        self._status_counts[task.status] = self._status_counts.get(task.status, 0) + 1
+
+        if session_id is not None:
+            self._session_of[task.id] = session_id
+            self._by_session.setdefault(session_id, {})[task.id] = None
+            self._session_totals[session_id] = self._session_totals.get(session_id, 0) + 1
+
+        task._status_listener = self._on_status_change
+        if self.evict_archived and self._is_archived(task.status):
+            self._pending_archive[task.id] = None
+
+    def _unindex(self, task: Any):
+        """インデックスとカウンターから除去"""
+        self._by_status.get(task.status, {}).pop(task.id, None)
+        self._status_counts[task.status] = self._status_counts.get(task.status, 1) - 1
+        session_id = self._session_of.pop(task.id, None)
+        if session_id is not None:
+            self._by_session.get(session_id, {}).pop(task.id, None)
+            self._session_totals[session_id] -= 1
+        task._status_listener = None
+
+    @staticmethod
+    def _is_archived(status: Any) -> bool:
+        return getattr(status, 'value', status) == "archived"
+
+    def _on_status_change(self, task: Any, old_status: Any):
+        """タスクのステータス変更通知 (インデックスとカウンター更新)"""
+        self._by_status.get(old_status, {}).pop(task.id, None)
+        self._by_status.setdefault(task.status, {})[task.id] = None
+        self._status_counts[old_status] = self._status_counts.get(old_status, 1) - 1
+        self._status_counts[task.status] = self._status_counts.get(task.status, 0) + 1
+
+        if self.on_transition is not None:
+            self.on_transition(task, self._session_of.get(task.id), old_status)
+
+        if self.evict_archived and self._is_archived(task.status):
+            # 消し込みログの追記が終わった後に flush_archived() で退避する
+            self._pending_archive[task.id] = None
+
+    def flush_archived(self) -> int:
+        """消し込み済みタスクをディスクへ退避してメモリから外す"""
+        flushed = 0
+        for task_id in list(self._pending_archive):
+            del self._pending_archive[task_id]
+            task = self._tasks.get(task_id)
+            if task is None or not self._is_archived(task.status):
+                continue
+
+            record = task.to_record()
+            record["session_id"] = self._session_of.get(task_id)
+            try:
+                self.archive.append(record)
+            except Exception as e:
+                # 退避失敗時はメモリに残す
+                self.logger.error(f"Failed to archive command task {task_id}: {e}")
+                continue
+
+            del self._tasks[task_id]
+            self._by_status.get(task.status, {}).pop(task_id, None)
+            session_id = self._session_of.pop(task_id, None)
+            if session_id is not None:
+                session_tasks = self._by_session.get(session_id, {})
+                session_tasks.pop(task_id, None)
+                if not session_tasks:
+                    self._by_session.pop(session_id, None)
+            task._status_listener = None
+            flushed += 1
+
+        self.evicted += flushed
+        return flushed
+
+    def get_task(self, task_id: str) -> Optional[Any]:
+        """タスク取得 (メモリ上のタスク、なければアーカイブのレコード)"""
+        task = self._tasks.get(task_id)
+        if task is not None:
+            return task
+        if self.archive is not None:
+            return self.archive.get(task_id)
+        return None
+
+    def by_status(self, status: Any) -> List[Any]:
+        """ステータス別のメモリ上タスク"""
+        return [self._tasks[task_id] for task_id in self._by_status.get(status, {})]
+
+    def by_session(self, session_id: str, status: Any = None) -> List[Any]:
+        """セッション別のメモリ上タスク (status 指定時は絞り込み)"""
+        tasks = [self._tasks[task_id] for task_id in self._by_session.get(session_id, {})]
+        if status is not None:
+            tasks = [task for task in tasks if task.status == status]
+        return tasks
+
+    def session_of(self, task_id: str) -> Optional[str]:
+        """タスクが属するセッション"""
+        return self._session_of.get(task_id)
+
+    def count(self, status: Any) -> int:
+        """ステータス別タスク数 (退避済みを含む)"""
+        return self._status_counts.get(status, 0)
+
+    def session_total(self, session_id: str) -> int:
+        """セッションのタスク総数 (退避済みを含む)"""
+        return self._session_totals.get(session_id, 0)
+
+    @property
+    def total(self) -> int:
+        """タスク総数 (退避済みを含む)"""
+        return len(self._tasks) + self.evicted
+
+    def get_stats(self) -> Dict[str, Any]:
+        """ストア統計取得"""
+        return {
+            "tasks_in_memory": len(self._tasks),
+            "evicted_to_archive": self.evicted,
+            "pending_archive": len(self._pending_archive),
+            "sessions": len(self._session_totals),
+            "archive": self.archive.get_stats() if self.archive is not None else None
+        }
@@ -0,0 +1,273 @@
+"""
+Ultimate ShunsukeModel Ecosystem - Shared Logging Backend
+エコシステム共通ロギング基盤
+
+各コンポーネントのロガーは整形済みの1行をキュー経由で渡すだけにし、
+ファイルへの書き込みはバックグラウンドのライタースレッドがまとめて行う。
+レコードは JSON Lines 形式で出力し、ファイルはサイズ上限でローテーションする。
+同一ロガー / ファイルへのハンドラーは何度コンポーネントを生成しても1つだけ登録される
+"""
+
+import atexit
+import json
+import logging
+import queue
+import threading
+import traceback
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+
+DEFAULT_LOG_DIR = Path.home() / '.claude' / 'logs' / 'shunsuke-ecosystem'
+
+# 構造化レコードへ含めない LogRecord 標準属性
+_STANDARD_ATTRS = frozenset(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+
+def record_to_json(record: logging.LogRecord) -> str:
+    """LogRecord を JSON 1行へ変換 (extra で渡した項目はそのまま含める)"""
+    entry: Dict[str, Any] = {
+        "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+        "level": record.levelname,
+        "logger": record.name,
+        "message": record.getMessage()
+    }
+    for key, value in record.__dict__.items():
+        if key not in _STANDARD_ATTRS and not key.startswith('_'):
+            entry[key] = value
+    if record.exc_info:
+        entry["exception"] = ''.join(traceback.format_exception(*record.exc_info))
+    return json.dumps(entry, default=str, ensure_ascii=False, separators=(',', ':'))
+
+
+class _RotatingWriter:
+    """サイズ上限でローテーションする追記ファイル"""
+
+    def __init__(self, path: Path, max_bytes: int, backup_count: int):
+        """初期化"""
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._file = None
+        self._size = 0
+
+    def _open(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'a', encoding='utf-8')
+        self._size = self._file.tell()
+
+    def _rotate(self):
+        """file.log → file.log.1 → ... → file.log.N (最古は削除)"""
+        self.close()
+        for index in range(self.backup_count - 1, 0, -1):
+            source = self.path.with_name(f"{self.path.name}.{index}")
+            if source.exists():
+                source.replace(self.path.with_name(f"{self.path.name}.{index + 1}"))
+        if self.backup_count > 0:
+            self.path.replace(self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink(missing_ok=True)
+        self._open()
+
+    def write_lines(self, lines: List[str]):
+        """複数行をまとめて書き込み (1バッチにつき flush は1回)"""
+        if self._file is None:
+            self._open()
+        for line in lines:
+            data = line + '\n'
+            if self.max_bytes and self._size and self._size + len(data) > self.max_bytes:
+                self._file.flush()
+                self._rotate()
+            self._file.write(data)
+            self._size += len(data)
+        self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class LoggingBackend:
+    """
+    キューベースのロギングバックエンド
+
+    主要機能:
+    1. 呼び出し元スレッド (イベントループ) は整形済みの行をキューへ投入するのみ
+    2. ライタースレッドによるバッチ書き込み
+    3. ファイル単位のサイズローテーション
+    4. 書き込み完了まで待機するフラッシュ
+    """
+
+    def __init__(
+        self,
+        log_dir: Path = DEFAULT_LOG_DIR,
+        max_bytes: int = 10 * 1024 * 1024,
+        backup_count: int = 5,
+        max_batch: int = 512
+    ):
+        """初期化"""
+        self.log_dir = Path(log_dir)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.max_batch = max(1, max_batch)
+
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._writers: Dict[str, _RotatingWriter] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.stats = {'records': 0, 'batches': 0, 'write_errors': 0}
+
+    def enqueue(self, log_file: str, line: str):
+        """整形済みの行を出力先ファイル名とともに投入 (ライタースレッドは初回に起動)"""
+        if self._thread is None:
+            self._start()
+        self._queue.put((log_file, line))
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="ecosystem-log-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        """ライタースレッド: 1件待ってから溜まっている分をまとめて書き込む"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch: List[Tuple[str, str]] = []
+            # フラッシュ待ちのイベント (それ以前に投入された行を書き終えてから通知)
+            markers: List[threading.Event] = []
+            stop = False
+            while True:
+                if isinstance(item, threading.Event):
+                    markers.append(item)
+                else:
+                    batch.append(item)
+                if len(batch) >= self.max_batch:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+            if batch:
+                self._write_batch(batch)
+            for marker in markers:
+                marker.set()
+            if stop:
+                return
+
+    def _write_batch(self, batch: List[Tuple[str, str]]):
+        """ファイルごとにまとめて書き込み"""
+        grouped: Dict[str, List[str]] = {}
+        for log_file, line in batch:
+            grouped.setdefault(log_file, []).append(line)
+
+        for log_file, lines in grouped.items():
+            writer = self._writers.get(log_file)
+            if writer is None:
+                writer = self._writers[log_file] = _RotatingWriter(
+                    self.log_dir / log_file, self.max_bytes, self.backup_count
+                )
+            try:
+                writer.write_lines(lines)
+            except OSError:
+                self.stats['write_errors'] += 1
+
+        self.stats['records'] += len(batch)
+        self.stats['batches'] += 1
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        投入済みレコードの書き込み完了を待つ
+
+        Returns:
+            タイムアウト前に書き込みが完了したか
+        """
+        if self._thread is None:
+            return True
+        written = threading.Event()
+        self._queue.put(written)
+        return written.wait(timeout)
+
+    def stop(self, timeout: float = 5.0):
+        """ライタースレッドを停止 (残りのレコードは書き込む)"""
+        thread = self._thread
+        if thread is not None:
+            self._queue.put(None)
+            thread.join(timeout)
+            self._thread = None
+        for writer in self._writers.values():
+            writer.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """バックエンド統計取得"""
+        return {
+            "log_dir": str(self.log_dir),
+            "files": sorted(self._writers),
+            "queued": self._queue.qsize(),
+            **self.stats
+        }
+
+
+class QueueFileHandler(logging.Handler):
+    """レコードを出力先ファイル名付きでバックエンドのキューへ渡すハンドラー"""
+
+    def __init__(self, backend: LoggingBackend, log_file: str):
+        super().__init__()
+        self.backend = backend
+        self.log_file = log_file
+
+    def emit(self, record: logging.LogRecord):
+        # 引数や extra の値が後から変更されないよう、呼び出し元スレッドで整形してから渡す
+        try:
+            line = record_to_json(record)
+        except Exception:
+            self.handleError(record)
+            return
+        self.backend.enqueue(self.log_file, line)
+
+
+_backend: Optional[LoggingBackend] = None
+_backend_lock = threading.Lock()
+
+
+def get_logging_backend() -> LoggingBackend:
+    """共通バックエンド取得 (初回に生成し、終了時に残りを書き出す)"""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = LoggingBackend()
+                atexit.register(_backend.stop)
+    return _backend
+
+
+def configure_logging(log_dir: Optional[Path] = None, **options) -> LoggingBackend:
+    """共通バックエンドの設定 (max_bytes / backup_count / max_batch)"""
+    backend = get_logging_backend()
+    if log_dir is not None:
+        backend.log_dir = Path(log_dir).expanduser()
+    for name, value in options.items():
+        if not hasattr(backend, name):
+            raise ValueError(f"Unknown logging option: {name}")
+        setattr(backend, name, value)
+    return backend
+
+
+def get_component_logger(name: str, log_file: str, level: int = logging.INFO) -> logging.Logger:
+    """
+    コンポーネント用ロガー取得
+
+    同じロガーに同じファイルのハンドラーが登録済みなら追加しない
+    """
+    logger = logging.getLogger(name)
+    if not any(isinstance(h, QueueFileHandler) and h.log_file == log_file for h in logger.handlers):
+        logger.addHandler(QueueFileHandler(get_logging_backend(), log_file))
+    logger.setLevel(level)
+    return logger
@@ -8,17 +8,20 @@ Ultimate ShunsukeModel Ecosystem - Meta Project Manager
 
 import asyncio
 import logging
+from collections import deque
 from typing import Dict, List, Any, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
-from pathlib import Path
 import json
-import yaml
 import networkx as nx
 from datetime import datetime, timezone
 import hashlib
+import heapq
+import time
+import uuid
 
-from .project_orchestrator import ProjectOrchestrator, ProjectSpec, TaskSpec
+from ..ecosystem_logging import get_component_logger
+from .project_scheduler import ResourceScheduler, ProjectSchedule
 
 
 class DependencyType(Enum):
@@ -60,25 +63,280 @@ class ProjectDependency:
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
+# 配分量の比較・端数処理の許容誤差
+_AMOUNT_EPSILON = 1e-9
+
+
 @dataclass
 class ResourceAllocation:
-    """リソース配分"""
+    """
+    リソース配分
+    
+    allocated / reserved は参照用。変更は allocate / reserve / unreserve / release を通し、
+    合計値を O(1) で保持する
+    """
     resource_type: ResourceType
     total_available: float
     allocated: Dict[str, float] = field(default_factory=dict)  # project_id -> amount
     reserved: Dict[str, float] = field(default_factory=dict)  # project_id -> amount
+    allocated_total: float = field(default=0.0, init=False)
+    reserved_total: float = field(default=0.0, init=False)
+    
+    def __post_init__(self):
+        """合計値の初期化"""
+        self.allocated_total = sum(self.allocated.values())
+        self.reserved_total = sum(self.reserved.values())
     
     @property
     def available(self) -> float:
         """利用可能量"""
-        used = sum(self.allocated.values()) + sum(self.reserved.values())
-        return max(0, self.total_available - used)
+        return max(0, self.total_available - self.allocated_total - self.reserved_total)
     
     @property
     def utilization_rate(self) -> float:
         """利用率"""
-        used = sum(self.allocated.values())
-        return used / self.total_available if self.total_available > 0 else 0
+        return self.allocated_total / self.total_available if self.total_available > 0 else 0
+    
+    def allocate(self, project_id: str, amount: float):
+        """配分追加"""
+        self.allocated[project_id] = self.allocated.get(project_id, 0.0) + amount
+        self.allocated_total += amount
+    
+    def reserve(self, project_id: str, amount: float):
+        """予約追加"""
+        self.reserved[project_id] = self.reserved.get(project_id, 0.0) + amount
+        self.reserved_total += amount
+    
+    def unreserve(self, project_id: str, amount: float):
+        """予約取り消し"""
+        self.reserved_total = self._decrease(self.reserved, project_id, amount, self.reserved_total)
+    
+    def release(self, project_id: str) -> float:
+        """プロジェクトへの配分を全て解放"""
+        amount = self.allocated.get(project_id, 0.0)
+        self.allocated_total = self._decrease(self.allocated, project_id, amount, self.allocated_total)
+        return amount
+    
+    @staticmethod
+    def _decrease(amounts: Dict[str, float], project_id: str, amount: float, total: float) -> float:
+        """プロジェクト別の量を減らし、新しい合計を返す (端数は切り捨てて誤差の蓄積を防ぐ)"""
+        remaining = amounts.get(project_id, 0.0) - amount
+        if remaining <= _AMOUNT_EPSILON:
+            amounts.pop(project_id, None)
+        else:
+            amounts[project_id] = remaining
+        return max(0.0, total - amount) if amounts else 0.0
+
+
+@dataclass
+class ResourceReservation:
+    """複数リソースにまたがる予約"""
+    id: str
+    project_id: str
+    amounts: Dict[ResourceType, float]
+    expires_at: Optional[float] = None  # time.monotonic() 基準, None は無期限
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class ResourceLedger:
+    """
+    リソース予約台帳
+    
+    主要機能:
+    1. 複数リソースタイプの原子的な予約 (全て確保できるか、何も確保しない)
+    2. 予約の確定 (commit) / 取り消し / プロジェクト単位の解放
+    3. TTL による予約の自動失効
+    4. 単一の asyncio.Lock による並行呼び出しの直列化
+    """
+    
+    def __init__(self, allocations: Dict[ResourceType, ResourceAllocation], default_ttl: Optional[float] = 300.0):
+        """初期化"""
+        self.allocations = allocations
+        self.default_ttl = default_ttl
+        self.logger = logging.getLogger(__name__)
+        
+        self._reservations: Dict[str, ResourceReservation] = {}
+        self._expiry: List[Tuple[float, str]] = []
+        self._lock: Optional[asyncio.Lock] = None
+        self.stats = {'reserved': 0, 'committed': 0, 'cancelled': 0, 'expired': 0, 'rejected': 0, 'released': 0}
+    
+    @property
+    def lock(self) -> asyncio.Lock:
+        """台帳ロック (実行中のイベントループで初回に生成)"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+    
+    async def reserve(
+        self,
+        project_id: str,
+        amounts: Dict[ResourceType, float],
+        ttl: Optional[float] = None,
+        partial: bool = False
+    ) -> Optional[ResourceReservation]:
+        """
+        リソース予約
+        
+        確定時にプロジェクトの既存の配分を置き換えるが、予約中は既存の配分も保持したままのため空き容量から確保する
+        
+        Args:
+            project_id: プロジェクトID
+            amounts: リソースタイプ -> 予約量
+            ttl: 有効期間 (秒, 省略時は default_ttl)
+            partial: 不足分を利用可能量まで切り詰めて予約するか
+            
+        Returns:
+            予約 (partial=False で1つでも不足する場合は None)
+        """
+        async with self.lock:
+            self._expire_locked()
+            grant = self._grant(project_id, amounts, partial, include_own_allocation=False)
+            if grant is None:
+                return None
+            return self._reserve_locked(project_id, grant, self.default_ttl if ttl is None else ttl)
+    
+    async def commit(self, reservation_id: str) -> Dict[ResourceType, float]:
+        """予約を配分として確定 (allocate() と同じくプロジェクトの既存の配分を置き換える)"""
+        async with self.lock:
+            self._expire_locked()
+            reservation = self._reservations.pop(reservation_id, None)
+            if reservation is None:
+                raise ValueError(f"Reservation not found or expired: {reservation_id}")
+            self._commit_locked(reservation)
+            return dict(reservation.amounts)
+    
+    async def cancel(self, reservation_id: str) -> bool:
+        """予約取り消し"""
+        async with self.lock:
+            reservation = self._reservations.pop(reservation_id, None)
+            if reservation is None:
+                return False
+            self._unreserve(reservation)
+            self.stats['cancelled'] += 1
+            return True
+    
+    async def allocate(
+        self,
+        project_id: str,
+        amounts: Dict[ResourceType, float],
+        partial: bool = False
+    ) -> Optional[Dict[ResourceType, float]]:
+        """
+        予約と確定を1回で行い、プロジェクトの配分をこの量に置き換える
+        
+        既存の配分は置き換え対象として利用可能量に含める
+        
+        Returns:
+            確定した配分量 (partial=False で不足する場合は None, 既存の配分はそのまま)
+        """
+        async with self.lock:
+            self._expire_locked()
+            grant = self._grant(project_id, amounts, partial, include_own_allocation=True)
+            if grant is None:
+                return None
+            for allocation in self.allocations.values():
+                allocation.release(project_id)
+            self._commit_locked(self._reserve_locked(project_id, grant, None))
+            return grant
+    
+    async def release_project(self, project_id: str) -> Dict[ResourceType, float]:
+        """プロジェクトの配分と未確定の予約を全て解放"""
+        async with self.lock:
+            for reservation_id in [rid for rid, r in self._reservations.items() if r.project_id == project_id]:
+                self._unreserve(self._reservations.pop(reservation_id))
+                self.stats['cancelled'] += 1
+            
+            released = {}
+            for resource_type, allocation in self.allocations.items():
+                amount = allocation.release(project_id)
+                if amount:
+                    released[resource_type] = amount
+            if released:
+                self.stats['released'] += 1
+            return released
+    
+    def expire_reservations(self) -> int:
+        """期限切れ予約の失効 (await を挟まないためロック外からも呼べる)"""
+        return self._expire_locked()
+    
+    def _grant(
+        self,
+        project_id: str,
+        amounts: Dict[ResourceType, float],
+        partial: bool,
+        include_own_allocation: bool
+    ) -> Optional[Dict[ResourceType, float]]:
+        """確保可能量の算出 (全て確保できない場合は None)"""
+        grant = {}
+        for resource_type, amount in amounts.items():
+            allocation = self.allocations[resource_type]
+            available = allocation.available
+            if include_own_allocation:
+                available += allocation.allocated.get(project_id, 0.0)
+            if amount <= available + _AMOUNT_EPSILON:
+                grant[resource_type] = amount
+            elif partial:
+                grant[resource_type] = available
+            else:
+                self.stats['rejected'] += 1
+                return None
+        return grant
+    
+    def _reserve_locked(
+        self,
+        project_id: str,
+        amounts: Dict[ResourceType, float],
+        ttl: Optional[float]
+    ) -> ResourceReservation:
+        """予約登録"""
+        reservation = ResourceReservation(
+            id=f"rsv_{uuid.uuid4().hex[:12]}",
+            project_id=project_id,
+            amounts=amounts,
+            expires_at=time.monotonic() + ttl if ttl is not None else None
+        )
+        for resource_type, amount in amounts.items():
+            self.allocations[resource_type].reserve(project_id, amount)
+        self._reservations[reservation.id] = reservation
+        if reservation.expires_at is not None:
+            heapq.heappush(self._expiry, (reservation.expires_at, reservation.id))
+        self.stats['reserved'] += 1
+        return reservation
+    
+    def _commit_locked(self, reservation: ResourceReservation):
+        """予約量を配分へ移す (既存の配分は解放して置き換え, 二重配分しない)"""
+        self._reservations.pop(reservation.id, None)
+        for allocation in self.allocations.values():
+            allocation.release(reservation.project_id)
+        for resource_type, amount in reservation.amounts.items():
+            allocation = self.allocations[resource_type]
+            allocation.unreserve(reservation.project_id, amount)
+            allocation.allocate(reservation.project_id, amount)
+        self.stats['committed'] += 1
+    
+    def _unreserve(self, reservation: ResourceReservation):
+        """予約量の返却"""
+        for resource_type, amount in reservation.amounts.items():
+            self.allocations[resource_type].unreserve(reservation.project_id, amount)
+    
+    def _expire_locked(self) -> int:
+        """期限切れ予約の返却 (確定 / 取り消し済みの予約はヒープから捨てるだけ)"""
+        now = time.monotonic()
+        expired = 0
+        while self._expiry and self._expiry[0][0] <= now:
+            _, reservation_id = heapq.heappop(self._expiry)
+            reservation = self._reservations.pop(reservation_id, None)
+            if reservation is not None:
+                self._unreserve(reservation)
+                expired += 1
+        if expired:
+            self.stats['expired'] += expired
+            self.logger.info(f"Expired {expired} resource reservations")
+        return expired
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """台帳統計取得"""
+        return {"active_reservations": len(self._reservations), **self.stats}
 
 
 @dataclass
@@ -130,31 +388,44 @@ class MetaProjectManager:
         self.resource_allocations: Dict[ResourceType, ResourceAllocation] = {}
         self.dependency_graph = nx.DiGraph()
         
+        # 依存エッジの提供元 ((source, target) -> {meta_project_id: dependency})
+        self._edge_owners: Dict[Tuple[str, str], Dict[str, ProjectDependency]] = {}
+        
+        # 並行グループ / スケジュール ((容量, 所要時間) -> スケジュール) のキャッシュと、
+        # ノード -> キャッシュ済みメタプロジェクトの索引
+        self._layout_cache: Dict[str, List[List[str]]] = {}
+        self._schedule_cache: Dict[str, Tuple[Tuple[Any, ...], ProjectSchedule]] = {}
+        self._layout_index: Dict[str, Set[str]] = {}
+        self.graph_stats = {
+            'layout_hits': 0, 'layout_misses': 0, 'layout_invalidations': 0,
+            'schedule_hits': 0, 'schedule_misses': 0
+        }
+        
         # ログ設定
         self.logger = logging.getLogger(__name__)
         self._setup_logging()
         
+        # リソース制約付きスケジューラー
+        self.scheduler = ResourceScheduler(self.logger)
+        
         # 設定値
         self.max_concurrent_projects = config.get('max_concurrent_projects', 5)
         self.resource_buffer_ratio = config.get('resource_buffer_ratio', 0.1)
         self.auto_conflict_resolution = config.get('auto_conflict_resolution', True)
+        self.balance_phases_by_resources = config.get('balance_phases_by_resources', False)
+        
+        # リソース予約台帳 (resource_allocations を共有)
+        self.resource_ledger = ResourceLedger(
+            self.resource_allocations,
+            default_ttl=config.get('reservation_ttl_seconds', 300.0)
+        )
         
         # 初期化状態
         self.is_initialized = False
     
     def _setup_logging(self):
-        """ログ設定"""
-        log_dir = Path.home() / '.claude' / 'logs' / 'shunsuke-ecosystem'
-        log_dir.mkdir(parents=True, exist_ok=True)
-        
-        handler = logging.FileHandler(log_dir / 'meta-project-manager.log')
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        handler.setFormatter(formatter)
-        
-        self.logger.addHandler(handler)
-        self.logger.setLevel(logging.INFO)
+        """ログ設定 (共通ロギング基盤, ハンドラーはロガーごとに1つ)"""
+        get_component_logger(__name__, 'meta-project-manager.log')
     
     async def initialize(self):
         """メタプロジェクト管理システム初期化"""
@@ -206,22 +477,128 @@ class MetaProjectManager:
         pass
     
     async def _rebuild_dependency_graph(self):
-        """依存関係グラフ再構築"""
+        """依存関係グラフ再構築 (初期化時のみ, 以降は差分更新)"""
         self.dependency_graph.clear()
+        self._edge_owners.clear()
+        self._layout_cache.clear()
+        self._schedule_cache.clear()
+        self._layout_index.clear()
         
-        # 全メタプロジェクトをノードとして追加
+        # 全メタプロジェクトをノード、依存関係をエッジとして追加
         for meta_project in self.meta_projects.values():
-            self.dependency_graph.add_node(meta_project.id, meta_project=meta_project)
+            self._add_to_dependency_graph(meta_project)
+        
+        self.logger.debug(
+            "Dependency graph rebuilt: %d nodes, %d edges",
+            len(self.dependency_graph.nodes), len(self.dependency_graph.edges)
+        )
+    
+    def _add_to_dependency_graph(self, meta_project: MetaProject):
+        """メタプロジェクトのノードと依存エッジのみをグラフへ追加"""
+        self.dependency_graph.add_node(meta_project.id, meta_project=meta_project)
+        
+        for dependency in meta_project.dependencies:
+            edge = (dependency.source_project, dependency.target_project)
+            owners = self._edge_owners.setdefault(edge, {})
+            owners[meta_project.id] = dependency
             
-            # 依存関係をエッジとして追加
-            for dependency in meta_project.dependencies:
-                self.dependency_graph.add_edge(
-                    dependency.source_project,
-                    dependency.target_project,
-                    dependency=dependency
-                )
+            if not self.dependency_graph.has_edge(*edge):
+                self.dependency_graph.add_edge(*edge)
+                self._refresh_edge(edge, owners)
+                self._invalidate_layouts(*edge)
+            elif self._refresh_edge(edge, owners):
+                # 既存エッジのブロッキング性が変わった場合も実行順序が変わる
+                self._invalidate_layouts(*edge)
+    
+    def _remove_from_dependency_graph(self, meta_id: str):
+        """メタプロジェクトのノードと、他から参照されなくなった依存エッジのみを削除"""
+        meta_project = self.meta_projects.get(meta_id)
+        if meta_project is None:
+            return
+        
+        self._drop_layout(meta_id)
+        for dependency in meta_project.dependencies:
+            edge = (dependency.source_project, dependency.target_project)
+            owners = self._edge_owners.get(edge)
+            if owners is None or owners.pop(meta_id, None) is None:
+                continue
+            
+            if owners:
+                # 他のメタプロジェクトが同じ依存を持つ場合はエッジを残す
+                if self._refresh_edge(edge, owners):
+                    self._invalidate_layouts(*edge)
+                continue
+            
+            del self._edge_owners[edge]
+            self.dependency_graph.remove_edge(*edge)
+            self._invalidate_layouts(*edge)
+            for node in edge:
+                if node not in self.meta_projects and self.dependency_graph.degree(node) == 0:
+                    self.dependency_graph.remove_node(node)
+        
+        if self.dependency_graph.has_node(meta_id):
+            self.dependency_graph.remove_node(meta_id)
+    
+    def _refresh_edge(self, edge: Tuple[str, str], owners: Dict[str, ProjectDependency]) -> bool:
+        """
+        エッジ属性を全提供元の依存から再計算
+        
+        いずれかの提供元がブロッキング依存ならブロッキングとする
         
-        self.logger.debug(f"Dependency graph rebuilt: {len(self.dependency_graph.nodes)} nodes, {len(self.dependency_graph.edges)} edges")
+        Returns:
+            ブロッキング性が変わったか (新規エッジは False)
+        """
+        edge_data = self.dependency_graph.edges[edge]
+        blocking = any(self._is_blocking_dependency(dependency) for dependency in owners.values())
+        changed = edge_data.get('blocking', blocking) != blocking
+        edge_data['blocking'] = blocking
+        # 代表の依存 (ブロッキング性が一致する最新のもの)
+        edge_data['dependency'] = next(
+            dependency for dependency in reversed(owners.values())
+            if self._is_blocking_dependency(dependency) == blocking
+        )
+        return changed
+    
+    def _invalidate_layouts(self, source: str, target: str):
+        """エッジの両端を含むメタプロジェクトのキャッシュのみ無効化"""
+        affected = self._layout_index.get(source)
+        if not affected:
+            return
+        for meta_id in list(affected & self._layout_index.get(target, set())):
+            self._drop_layout(meta_id)
+            self.graph_stats['layout_invalidations'] += 1
+    
+    def _drop_layout(self, meta_id: str):
+        """キャッシュ済み実行レイアウトとスケジュールの削除"""
+        layout = self._layout_cache.pop(meta_id, None)
+        schedule = self._schedule_cache.pop(meta_id, None)
+        if layout is None and schedule is None:
+            return
+        for project in self.meta_projects[meta_id].sub_projects:
+            indexed = self._layout_index.get(project)
+            if indexed is not None:
+                indexed.discard(meta_id)
+                if not indexed:
+                    del self._layout_index[project]
+    
+    async def _get_execution_layout(self, meta_project: MetaProject) -> List[List[str]]:
+        """並行グループ (依存エッジが変わるまでキャッシュ)"""
+        cached = self._layout_cache.get(meta_project.id)
+        if cached is not None:
+            self.graph_stats['layout_hits'] += 1
+            return cached
+        
+        self.graph_stats['layout_misses'] += 1
+        layout = await self._identify_parallel_groups(meta_project.sub_projects)
+        
+        self._layout_cache[meta_project.id] = layout
+        self._index_layout(meta_project)
+        return layout
+    
+    def _index_layout(self, meta_project: MetaProject):
+        """キャッシュ済みメタプロジェクトをサブプロジェクトの索引へ登録 (エッジ変更時の無効化用)"""
+        for project in meta_project.sub_projects:
+            self._layout_index.setdefault(project, set()).add(meta_project.id)
     
     async def create_meta_project(
         self,
@@ -271,16 +648,38 @@ class MetaProjectManager:
         resource_requirements = await self._calculate_resource_requirements(sub_projects)
         meta_project.resource_requirements = resource_requirements
         
-        # メタプロジェクト登録
+        # メタプロジェクト登録 (同一IDの既存エントリはグラフから外して置き換え)
+        self._remove_from_dependency_graph(meta_id)
         self.meta_projects[meta_id] = meta_project
         
-        # 依存関係グラフ更新
-        await self._rebuild_dependency_graph()
+        # 依存関係グラフ更新 (追加分のみ)
+        self._add_to_dependency_graph(meta_project)
         
         self.logger.info(f"Created meta project: {name} ({meta_id}) with {len(sub_projects)} sub-projects")
         
         return meta_id
     
+    async def remove_meta_project(self, meta_project_id: str) -> bool:
+        """
+        メタプロジェクト削除
+        
+        Args:
+            meta_project_id: メタプロジェクトID
+            
+        Returns:
+            削除されたか
+        """
+        if meta_project_id not in self.meta_projects:
+            return False
+        
+        # 依存関係グラフ更新 (削除分のみ) とリソース解放
+        self._remove_from_dependency_graph(meta_project_id)
+        del self.meta_projects[meta_project_id]
+        await self.release_resources(meta_project_id)
+        
+        self.logger.info(f"Removed meta project: {meta_project_id}")
+        return True
+    
     def _generate_meta_project_id(self, name: str) -> str:
         """メタプロジェクトID生成"""
         # 名前をハッシュ化してユニークIDを生成
@@ -372,6 +771,9 @@ class MetaProjectManager:
         """
         メタプロジェクトへのリソース配分
         
+        全リソースタイプを台帳のロック内で一括して確保する (不足分は利用可能量まで部分配分)。
+        同じメタプロジェクトへの再配分は既存の配分を置き換える
+        
         Args:
             meta_project_id: メタプロジェクトID
             
@@ -384,34 +786,83 @@ class MetaProjectManager:
         meta_project = self.meta_projects[meta_project_id]
         allocation_result = {"allocated": {}, "insufficient": {}, "warnings": []}
         
-        # 各リソースタイプについて配分を試行
+        granted = await self.resource_ledger.allocate(
+            meta_project_id, meta_project.resource_requirements, partial=True
+        )
+        
         for resource_type, required_amount in meta_project.resource_requirements.items():
-            allocation = self.resource_allocations[resource_type]
-            
-            # 利用可能量チェック
-            if allocation.available >= required_amount:
-                # 配分実行
-                allocation.allocated[meta_project_id] = required_amount
+            amount = granted[resource_type]
+            if amount + _AMOUNT_EPSILON >= required_amount:
                 allocation_result["allocated"][resource_type.value] = required_amount
-                
                 self.logger.info(f"Allocated {required_amount} {resource_type.value} to {meta_project_id}")
-            else:
-                # 不足リソース記録
-                allocation_result["insufficient"][resource_type.value] = {
-                    "required": required_amount,
-                    "available": allocation.available
-                }
-                
-                # 部分配分
-                if allocation.available > 0:
-                    allocation.allocated[meta_project_id] = allocation.available
-                    allocation_result["allocated"][resource_type.value] = allocation.available
-                    allocation_result["warnings"].append(
-                        f"Partial allocation for {resource_type.value}: {allocation.available}/{required_amount}"
-                    )
+                continue
+            
+            # 不足リソース記録 (部分配分された量が配分時点の利用可能量)
+            allocation_result["insufficient"][resource_type.value] = {
+                "required": required_amount,
+                "available": amount
+            }
+            if amount > 0:
+                allocation_result["allocated"][resource_type.value] = amount
+                allocation_result["warnings"].append(
+                    f"Partial allocation for {resource_type.value}: {amount}/{required_amount}"
+                )
         
         return allocation_result
     
+    async def reserve_resources(self, meta_project_id: str, ttl: Optional[float] = None) -> Optional[ResourceReservation]:
+        """
+        メタプロジェクトのリソース要件を一括予約 (commit_reservation で確定するまで TTL で失効)
+        
+        Args:
+            meta_project_id: メタプロジェクトID
+            ttl: 有効期間 (秒)
+            
+        Returns:
+            予約 (1つでも不足する場合は None)
+        """
+        if meta_project_id not in self.meta_projects:
+            raise ValueError(f"Meta project not found: {meta_project_id}")
+        
+        reservation = await self.resource_ledger.reserve(
+            meta_project_id, self.meta_projects[meta_project_id].resource_requirements, ttl=ttl
+        )
+        if reservation is None:
+            self.logger.warning(f"Insufficient resources to reserve for {meta_project_id}")
+        return reservation
+    
+    async def commit_reservation(self, reservation_id: str) -> Dict[str, float]:
+        """予約を配分として確定 (allocate_resources 済みの配分は予約量で置き換える)"""
+        committed = await self.resource_ledger.commit(reservation_id)
+        return {resource_type.value: amount for resource_type, amount in committed.items()}
+    
+    async def release_resources(self, meta_project_id: str) -> Dict[str, float]:
+        """メタプロジェクトの配分と予約を全て解放"""
+        released = await self.resource_ledger.release_project(meta_project_id)
+        if released:
+            self.logger.info(f"Released resources of {meta_project_id}: {sorted(rt.value for rt in released)}")
+        return {resource_type.value: amount for resource_type, amount in released.items()}
+    
+    async def finish_meta_project(self, meta_project_id: str, status: str = "completed") -> Dict[str, float]:
+        """
+        メタプロジェクト終了 (状態更新とリソース解放)
+        
+        Args:
+            meta_project_id: メタプロジェクトID
+            status: 終了状態 (completed / failed / cancelled など)
+            
+        Returns:
+            解放したリソース量
+        """
+        if meta_project_id not in self.meta_projects:
+            raise ValueError(f"Meta project not found: {meta_project_id}")
+        
+        meta_project = self.meta_projects[meta_project_id]
+        meta_project.status = status
+        meta_project.updated_at = datetime.now(timezone.utc)
+        
+        return await self.release_resources(meta_project_id)
+    
     async def get_execution_plan(self, meta_project_id: str) -> Dict[str, Any]:
         """
         実行プラン生成
@@ -427,11 +878,14 @@ class MetaProjectManager:
         
         meta_project = self.meta_projects[meta_project_id]
         
-        # 依存関係に基づく実行順序決定
-        execution_order = await self._calculate_execution_order(meta_project.sub_projects)
+        # 依存関係に基づく並行実行グループと所要時間加重のスケジュール (キャッシュ済みなら再計算しない)
+        parallel_groups = await self._get_execution_layout(meta_project)
+        capacity = self._phase_capacity(meta_project_id)
+        schedule = await self._get_schedule(meta_project, capacity)
         
-        # 並行実行可能性解析
-        parallel_groups = await self._identify_parallel_groups(execution_order, meta_project.dependencies)
+        # リソース容量を超えないようフェーズを分割
+        if self.balance_phases_by_resources:
+            parallel_groups = await self._balance_parallel_groups(parallel_groups, schedule.critical_path, capacity)
         
         # 品質ゲート設定
         quality_gates = await self._setup_quality_gates(meta_project)
@@ -441,21 +895,24 @@ class MetaProjectManager:
             "meta_project_id": meta_project_id,
             "execution_strategy": meta_project.integration_specs[0].pattern.value if meta_project.integration_specs else "sequential",
             "phases": [],
+            "critical_path": list(schedule.critical_path),
             "quality_gates": quality_gates,
             "estimated_duration": self._estimate_total_duration(meta_project),
+            "schedule": schedule.to_dict(),
             "resource_allocation": meta_project.resource_requirements,
             "rollback_points": []
         }
         
         # フェーズ構築
         for i, group in enumerate(parallel_groups):
+            members = set(group)
             phase = {
                 "phase_id": f"phase_{i+1}",
-                "projects": group,
+                "projects": list(group),
                 "execution_type": "parallel" if len(group) > 1 else "sequential",
                 "dependencies": [
                     dep for dep in meta_project.dependencies
-                    if dep.source_project in group or dep.target_project in group
+                    if dep.source_project in members or dep.target_project in members
                 ],
                 "quality_checks": [gate for gate in quality_gates if gate.get("phase") == i+1]
             }
@@ -463,56 +920,238 @@ class MetaProjectManager:
         
         return execution_plan
     
-    async def _calculate_execution_order(self, projects: List[str]) -> List[str]:
-        """実行順序計算"""
-        # サブグラフ作成
-        subgraph = self.dependency_graph.subgraph(projects)
-        
-        try:
-            # トポロジカルソート
-            return list(nx.topological_sort(subgraph))
-        except nx.NetworkXError:
-            # 循環依存がある場合は警告してプロジェクト順序をそのまま返す
-            self.logger.warning("Circular dependency detected, using original order")
-            return projects
-    
-    async def _identify_parallel_groups(
+    async def schedule_meta_project(
         self,
-        execution_order: List[str],
-        dependencies: List[ProjectDependency]
-    ) -> List[List[str]]:
-        """並行実行グループ識別"""
-        groups = []
-        remaining = execution_order.copy()
-        
-        while remaining:
-            # 依存関係のないプロジェクトを見つける
-            ready_projects = []
-            for project in remaining:
-                # このプロジェクトをブロックする依存関係があるかチェック
-                blocked = any(
-                    dep.target_project == project and dep.source_project in remaining
-                    for dep in dependencies
-                    if dep.dependency_type in [DependencyType.BLOCKS, DependencyType.REQUIRES]
-                )
-                
-                if not blocked:
-                    ready_projects.append(project)
+        meta_project_id: str,
+        capacity: Optional[Dict[ResourceType, float]] = None
+    ) -> ProjectSchedule:
+        """
+        リソース制約付き実行スケジュール作成
+        
+        Args:
+            meta_project_id: メタプロジェクトID
+            capacity: リソース容量 (省略時は配分済み量 / 利用可能量, TIME は指定不可)
             
-            if not ready_projects:
-                # デッドロック状態 - 残りを全て1つのグループに
-                groups.append(remaining)
-                break
+        Returns:
+            時間軸付き実行計画 (メイクスパン, Gantt 行, クリティカルパス)。
+            容量省略時は依存エッジ・容量・所要時間が変わるまでキャッシュしたものを返す
+        """
+        if meta_project_id not in self.meta_projects:
+            raise ValueError(f"Meta project not found: {meta_project_id}")
+        
+        meta_project = self.meta_projects[meta_project_id]
+        if capacity is None:
+            return await self._get_schedule(meta_project, self._phase_capacity(meta_project_id))
+        
+        self._check_concurrent_capacity(capacity)
+        return await self._build_schedule(meta_project, capacity, self._project_durations(meta_project))
+    
+    async def _get_schedule(self, meta_project: MetaProject, capacity: Dict[ResourceType, float]) -> ProjectSchedule:
+        """現在の容量でのスケジュール (並行グループと同じくエッジ変更で無効化, 容量・所要時間の変更でも再計算)"""
+        durations = self._project_durations(meta_project)
+        key = (
+            tuple(sorted((resource_type.value, amount) for resource_type, amount in capacity.items())),
+            tuple(durations.items())
+        )
+        cached = self._schedule_cache.get(meta_project.id)
+        if cached is not None and cached[0] == key:
+            self.graph_stats['schedule_hits'] += 1
+            return cached[1]
+        
+        self.graph_stats['schedule_misses'] += 1
+        schedule = await self._build_schedule(meta_project, capacity, durations)
+        
+        self._schedule_cache[meta_project.id] = (key, schedule)
+        self._index_layout(meta_project)
+        return schedule
+    
+    def _project_durations(self, meta_project: MetaProject) -> Dict[str, float]:
+        """サブプロジェクトごとの推定所要時間"""
+        return {
+            project: self._estimate_project_duration(meta_project, project)
+            for project in dict.fromkeys(meta_project.sub_projects)
+        }
+    
+    async def _build_schedule(
+        self,
+        meta_project: MetaProject,
+        capacity: Dict[ResourceType, float],
+        durations: Dict[str, float]
+    ) -> ProjectSchedule:
+        """リストスケジューリングの実行"""
+        projects = list(durations)
+        requirements = {}
+        for project in projects:
+            project_requirements = await self._calculate_resource_requirements([project])
+            requirements[project] = {
+                resource_type.value: project_requirements.get(resource_type, 0.0) for resource_type in capacity
+            }
+        
+        return self.scheduler.schedule(
+            projects,
+            self._blocking_edges(projects),
+            durations,
+            requirements,
+            {resource_type.value: amount for resource_type, amount in capacity.items()}
+        )
+    
+    async def what_if(
+        self,
+        meta_project_id: str,
+        capacity_changes: Dict[ResourceType, float]
+    ) -> Dict[str, Any]:
+        """
+        リソース容量変更時のスケジュール比較 (実際の配分は変更しない)
+        
+        Args:
+            meta_project_id: メタプロジェクトID
+            capacity_changes: 変更後の容量 (リソースタイプ -> 量, 指定しないタイプは現状のまま, TIME は指定不可)
             
-            # 準備完了プロジェクトを1つのグループに
-            groups.append(ready_projects)
+        Returns:
+            現状と変更後のスケジュールおよびメイクスパン差分
+        """
+        changes = {ResourceType(resource_type): amount for resource_type, amount in capacity_changes.items()}
+        self._check_concurrent_capacity(changes)
+        
+        current_capacity = self._phase_capacity(meta_project_id)
+        scenario_capacity = {**current_capacity, **changes}
+        
+        baseline = await self.schedule_meta_project(meta_project_id)
+        scenario = await self.schedule_meta_project(meta_project_id, scenario_capacity)
+        
+        return {
+            "meta_project_id": meta_project_id,
+            "capacity_changes": {resource_type.value: amount for resource_type, amount in changes.items()},
+            "baseline": baseline.to_dict(),
+            "scenario": scenario.to_dict(),
+            "makespan_delta": scenario.makespan - baseline.makespan,
+            "speedup": baseline.makespan / scenario.makespan if scenario.makespan > 0 else 1.0
+        }
+    
+    @staticmethod
+    def _is_blocking_dependency(dependency: ProjectDependency) -> bool:
+        """実行順序を制約する依存か"""
+        return dependency.dependency_type in (DependencyType.BLOCKS, DependencyType.REQUIRES)
+    
+    @staticmethod
+    def _is_blocking_edge(edge_data: Dict[str, Any]) -> bool:
+        """実行順序を制約する依存エッジか (全提供元から算出済みの属性)"""
+        return edge_data.get('blocking', True)
+    
+    def _blocking_edges(self, projects: List[str]) -> List[Tuple[str, str]]:
+        """指定プロジェクト間のブロッキング依存エッジ"""
+        member_set = set(projects)
+        edges = []
+        for project in dict.fromkeys(projects):
+            if project not in self.dependency_graph:
+                continue
+            for target, edge_data in self.dependency_graph.succ[project].items():
+                if target in member_set and self._is_blocking_edge(edge_data):
+                    edges.append((project, target))
+        return edges
+    
+    async def _identify_parallel_groups(self, projects: List[str]) -> List[List[str]]:
+        """
+        並行実行グループ識別 (依存グラフの最長パス階層化, O(P + D))
+        
+        各プロジェクトを「ブロッキング依存の最長チェーン長」の階層へ割り当てる。
+        循環依存に含まれるプロジェクトは最後のグループへまとめる
+        
+        Args:
+            projects: サブプロジェクトIDリスト
             
-            # 処理済みプロジェクトを削除
-            for project in ready_projects:
-                remaining.remove(project)
+        Returns:
+            並行グループ
+        """
+        members = list(dict.fromkeys(projects))
+        
+        # サブプロジェクト間のブロッキング依存のみ抽出
+        successors: Dict[str, List[str]] = {project: [] for project in members}
+        indegree = dict.fromkeys(members, 0)
+        for source, target in self._blocking_edges(members):
+            successors[source].append(target)
+            indegree[target] += 1
+        
+        # Kahn 法で処理しながら最長パス長 (階層) を記録
+        level = dict.fromkeys(members, 0)
+        ready = deque(project for project in members if indegree[project] == 0)
+        processed: Set[str] = set()
+        while ready:
+            project = ready.popleft()
+            processed.add(project)
+            for target in successors[project]:
+                level[target] = max(level[target], level[project] + 1)
+                indegree[target] -= 1
+                if indegree[target] == 0:
+                    ready.append(target)
+        
+        groups: List[List[str]] = [[] for _ in range(max((level[p] for p in processed), default=-1) + 1)]
+        for project in members:
+            if project in processed:
+                groups[level[project]].append(project)
+        
+        remaining = [project for project in members if project not in processed]
+        if remaining:
+            # 循環依存 - 残りを全て1つのグループに
+            self.logger.warning(f"Circular dependency detected among {remaining}, grouping them together")
+            groups.append(remaining)
         
         return groups
     
+    @staticmethod
+    def _check_concurrent_capacity(capacity: Dict[ResourceType, float]):
+        """同時使用量の上限として扱えないリソースタイプ (TIME) を拒否"""
+        if ResourceType.TIME in capacity:
+            raise ValueError("TIME is not a concurrent capacity; scheduling takes durations from the projects")
+    
+    def _phase_capacity(self, meta_project_id: str) -> Dict[ResourceType, float]:
+        """1フェーズで同時に使えるリソース量 (配分済みならその量, 未配分なら利用可能量)"""
+        self.resource_ledger.expire_reservations()
+        capacity = {}
+        for resource_type, allocation in self.resource_allocations.items():
+            # 時間は並行実行しても加算されないため容量制約の対象外
+            if resource_type == ResourceType.TIME:
+                continue
+            capacity[resource_type] = allocation.allocated.get(meta_project_id, allocation.available)
+        return capacity
+    
+    async def _balance_parallel_groups(
+        self,
+        groups: List[List[str]],
+        critical_path: List[str],
+        capacity: Dict[ResourceType, float]
+    ) -> List[List[str]]:
+        """
+        リソース容量を超える並行グループを分割
+        
+        同じ階層内のプロジェクトは互いに依存しないため、任意に分割しても依存順序は保たれる。
+        クリティカルパス (所要時間加重) 上のプロジェクトを先に配置し、First-Fit で詰める
+        """
+        on_critical_path = set(critical_path)
+        balanced: List[List[str]] = []
+        
+        for group in groups:
+            ordered = sorted(group, key=lambda p: p not in on_critical_path)
+            phases: List[Tuple[List[str], Dict[ResourceType, float]]] = []
+            
+            for project in ordered:
+                requirements = await self._calculate_resource_requirements([project])
+                for members, used in phases:
+                    if all(used[rt] + requirements[rt] <= limit for rt, limit in capacity.items()):
+                        break
+                else:
+                    if any(requirements[rt] > limit for rt, limit in capacity.items()):
+                        self.logger.warning(f"Project {project} exceeds per-phase resource capacity on its own")
+                    members, used = [], dict.fromkeys(capacity, 0.0)
+                    phases.append((members, used))
+                members.append(project)
+                for resource_type in capacity:
+                    used[resource_type] += requirements[resource_type]
+            
+            balanced.extend(members for members, _ in phases)
+        
+        return balanced
+    
     async def _setup_quality_gates(self, meta_project: MetaProject) -> List[Dict[str, Any]]:
         """品質ゲート設定"""
         gates = []
@@ -556,9 +1195,19 @@ class MetaProjectManager:
         return gates
     
     def _estimate_total_duration(self, meta_project: MetaProject) -> float:
-        """総実行時間推定"""
-        # 簡易推定: プロジェクト数と複雑度に基づく
-        base_duration = len(meta_project.sub_projects) * 60  # 基本60分/プロジェクト
+        """総実行時間推定 (全プロジェクトを順次実行した場合)"""
+        return sum(self._estimate_project_duration(meta_project, project) for project in meta_project.sub_projects)
+    
+    def _estimate_project_duration(self, meta_project: MetaProject, project: str) -> float:
+        """プロジェクト単体の実行時間推定 (metadata['project_durations'] で個別指定可能)"""
+        overrides = meta_project.metadata.get('project_durations', {})
+        if project in overrides:
+            return float(overrides[project])
+        return 60 * self._complexity_factor(meta_project)  # 基本60分/プロジェクト
+    
+    def _complexity_factor(self, meta_project: MetaProject) -> float:
+        """複雑度係数"""
+        # 簡易推定: 依存関係と統合パターンに基づく
         complexity_factor = 1.0
         
         # 依存関係の複雑度
@@ -572,7 +1221,7 @@ class MetaProjectManager:
             elif spec.pattern == IntegrationPattern.PIPELINE:
                 complexity_factor += 0.3
         
-        return base_duration * complexity_factor
+        return complexity_factor
     
     async def resolve_conflicts(self, conflicts: List[Dict[str, Any]]) -> Dict[str, Any]:
         """競合解決"""
@@ -650,11 +1299,13 @@ class MetaProjectManager:
     async def get_status(self) -> Dict[str, Any]:
         """メタプロジェクトマネージャー状態取得"""
         # リソース利用率計算
+        self.resource_ledger.expire_reservations()
         resource_utilization = {}
         for resource_type, allocation in self.resource_allocations.items():
             resource_utilization[resource_type.value] = {
                 "total": allocation.total_available,
-                "allocated": sum(allocation.allocated.values()),
+                "allocated": allocation.allocated_total,
+                "reserved": allocation.reserved_total,
                 "available": allocation.available,
                 "utilization_rate": allocation.utilization_rate
             }
@@ -665,9 +1316,12 @@ class MetaProjectManager:
             "active_projects": len([p for p in self.meta_projects.values() if p.status in ["active", "running"]]),
             "dependency_graph": {
                 "nodes": len(self.dependency_graph.nodes),
-                "edges": len(self.dependency_graph.edges)
+                "edges": len(self.dependency_graph.edges),
+                "cached_layouts": len(self._layout_cache),
+                **self.graph_stats
             },
             "resource_utilization": resource_utilization,
+            "resource_ledger": self.resource_ledger.get_stats(),
             "max_concurrent_projects": self.max_concurrent_projects
         }
     
@@ -8,18 +8,19 @@ GitHub Issue ベースのタスク管理と消し込みスタイルワークフ
 
 import asyncio
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, AsyncIterator, Iterator
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 import json
-import yaml
 from datetime import datetime, timezone
 import subprocess
 import tempfile
 import shutil
+import uuid
 
 from ...integration.claude_integration.claude_bridge import ClaudeBridge
+from ..ecosystem_logging import get_component_logger
 
 
 class ProjectType(Enum):
@@ -123,18 +124,8 @@ class ProjectOrchestrator:
         self.is_initialized = False
     
     def _setup_logging(self):
-        """ログ設定"""
-        log_dir = Path.home() / '.claude' / 'logs' / 'shunsuke-ecosystem'
-        log_dir.mkdir(parents=True, exist_ok=True)
-        
-        handler = logging.FileHandler(log_dir / 'project-orchestrator.log')
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        handler.setFormatter(formatter)
-        
-        self.logger.addHandler(handler)
-        self.logger.setLevel(logging.INFO)
+        """ログ設定 (共通ロギング基盤, ハンドラーはロガーごとに1つ)"""
+        get_component_logger(__name__, 'project-orchestrator.log')
     
     async def initialize(self):
         """オーケストレーター初期化"""
@@ -292,24 +283,34 @@ class ProjectOrchestrator:
         Returns:
             タスク情報のリスト
         """
+        return [task_dict async for task_dict in self.iter_task_breakdown(analysis)]
+    
+    async def iter_task_breakdown(self, analysis: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        タスク分解を逐次生成 (詳細化が終わったタスクから順に返す)
+        
+        Args:
+            analysis: Claude Bridge からの意図解析結果
+            
+        Yields:
+            タスク情報
+        """
         self.logger.info("Creating task breakdown from analysis")
         
         # プロジェクトタイプの推定
         project_type = await self._infer_project_type(analysis)
-        self.logger.debug(f"Inferred project type: {project_type}")
+        self.logger.debug("Inferred project type: %s", project_type)
         
         # プロジェクト仕様生成
         project_spec = await self._generate_project_spec(analysis, project_type)
         
-        # タスク分解実行
-        tasks = await self._decompose_into_tasks(project_spec)
+        # タスク分解と詳細化 (分解されたタスクから順に詳細化して返す)
+        task_count = 0
+        for task in self._iter_decomposed_tasks(project_spec):
+            task_count += 1
+            yield self._elaborate_task(task, project_spec)
         
-        # タスクの詳細化
-        detailed_tasks = await self._elaborate_tasks(tasks, project_spec)
-        
-        self.logger.info(f"Generated {len(detailed_tasks)} tasks for project: {project_spec.name}")
-        
-        return detailed_tasks
+        self.logger.info(f"Generated {task_count} tasks for project: {project_spec.name}")
     
     async def _infer_project_type(self, analysis: Dict[str, Any]) -> ProjectType:
         """プロジェクトタイプ推定"""
@@ -346,7 +347,11 @@ class ProjectOrchestrator:
         constraints = analysis.get('constraints', {})
         
         # プロジェクト名生成
-        project_name = analysis.get('suggested_name', f"{project_type.value}_project_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+        # (並行セッションでタスクIDが衝突しないよう一意なサフィックスを付与)
+        project_name = analysis.get(
+            'suggested_name',
+            f"{project_type.value}_project_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+        )
         
         # 基本仕様
         spec = ProjectSpec(
@@ -380,8 +385,20 @@ class ProjectOrchestrator:
     
     async def _decompose_into_tasks(self, project_spec: ProjectSpec) -> List[TaskSpec]:
         """プロジェクト仕様からタスク分解"""
+        return list(self._iter_decomposed_tasks(project_spec))
+    
+    def _iter_decomposed_tasks(self, project_spec: ProjectSpec) -> Iterator[TaskSpec]:
+        """
+        プロジェクト仕様からタスクを分解しながら逐次生成
+        
+        依存関係: テンプレートのタスクは定義順に直列、要件ベースのタスクは
+        テンプレート中の最後の開発タスク、成果物タスクはテンプレートの先頭タスク
+        (プロジェクト構成の準備) の完了後に実行する
+        """
         tasks = []
         task_counter = 0
+        setup_deps: List[str] = []
+        implementation_deps: List[str] = []
         
         # テンプレートベースのタスク生成
         if project_spec.project_type.value in self.templates:
@@ -396,9 +413,16 @@ class ProjectOrchestrator:
                     task_type=TaskType(task_template['type']),
                     project_id=project_spec.name,
                     priority=task_template.get('priority', 5),
+                    dependencies=[tasks[-1].id] if tasks else [],
                     required_agents=template.agent_requirements.get(task_template['type'], [])
                 )
                 tasks.append(task)
+                yield task
+                
+                if len(tasks) == 1:
+                    setup_deps = [task.id]
+                if task.task_type == TaskType.DEVELOPMENT:
+                    implementation_deps = [task.id]
         
         # 要件ベースの追加タスク
         for requirement in project_spec.requirements:
@@ -410,9 +434,11 @@ class ProjectOrchestrator:
                     description=f"Implementation task for requirement: {requirement}",
                     task_type=TaskType.TESTING,
                     project_id=project_spec.name,
-                    priority=6
+                    priority=6,
+                    dependencies=list(implementation_deps)
                 )
                 tasks.append(task)
+                yield task
             
             elif 'document' in requirement.lower():
                 task_counter += 1
@@ -422,9 +448,11 @@ class ProjectOrchestrator:
                     description=f"Documentation task for requirement: {requirement}",
                     task_type=TaskType.DOCUMENTATION,
                     project_id=project_spec.name,
-                    priority=4
+                    priority=4,
+                    dependencies=list(implementation_deps)
                 )
                 tasks.append(task)
+                yield task
         
         # 成果物ベースのタスク
         for deliverable in project_spec.deliverables:
@@ -436,75 +464,75 @@ class ProjectOrchestrator:
                     description=f"Create deliverable: {deliverable}",
                     task_type=TaskType.DEVELOPMENT,
                     project_id=project_spec.name,
-                    priority=7
+                    priority=7,
+                    dependencies=list(setup_deps)
                 )
                 tasks.append(task)
+                yield task
         
-        self.logger.debug(f"Generated {len(tasks)} tasks from project spec")
-        return tasks
+        self.logger.debug("Generated %d tasks from project spec", len(tasks))
     
     async def _elaborate_tasks(self, tasks: List[TaskSpec], project_spec: ProjectSpec) -> List[Dict[str, Any]]:
         """タスク詳細化"""
-        detailed_tasks = []
+        return [self._elaborate_task(task, project_spec) for task in tasks]
+    
+    def _elaborate_task(self, task: TaskSpec, project_spec: ProjectSpec) -> Dict[str, Any]:
+        """単一タスクの詳細化"""
+        # 成功基準の設定
+        success_criteria = []
+        if task.task_type == TaskType.DEVELOPMENT:
+            success_criteria = [
+                "Code implementation completed",
+                "Unit tests passing",
+                "Code review approved"
+            ]
+        elif task.task_type == TaskType.TESTING:
+            success_criteria = [
+                "Test cases implemented",
+                "All tests passing",
+                "Coverage threshold met"
+            ]
+        elif task.task_type == TaskType.DOCUMENTATION:
+            success_criteria = [
+                "Documentation written",
+                "Examples provided",
+                "Review completed"
+            ]
         
-        for task in tasks:
-            # 成功基準の設定
-            success_criteria = []
-            if task.task_type == TaskType.DEVELOPMENT:
-                success_criteria = [
-                    "Code implementation completed",
-                    "Unit tests passing",
-                    "Code review approved"
-                ]
-            elif task.task_type == TaskType.TESTING:
-                success_criteria = [
-                    "Test cases implemented",
-                    "All tests passing",
-                    "Coverage threshold met"
-                ]
-            elif task.task_type == TaskType.DOCUMENTATION:
-                success_criteria = [
-                    "Documentation written",
-                    "Examples provided",
-                    "Review completed"
-                ]
-            
-            task.success_criteria = success_criteria
-            
-            # エージェント要件の詳細化
-            agent_requirements = {}
-            if task.required_agents:
-                agent_requirements = {
-                    'required': task.required_agents,
-                    'preferred_count': min(len(task.required_agents), 3),
-                    'specializations': [task.task_type.value]
-                }
-            
-            # タスク辞書作成
-            task_dict = {
-                'id': task.id,
-                'name': task.name,
-                'description': task.description,
-                'type': task.task_type.value,
-                'priority': self._priority_to_string(task.priority),
-                'estimated_hours': task.estimated_hours,
-                'dependencies': task.dependencies,
-                'success_criteria': task.success_criteria,
-                'agent_requirements': agent_requirements,
-                'metadata': {
-                    'project_id': task.project_id,
-                    'project_type': project_spec.project_type.value,
-                    'created_at': task.created_at.isoformat(),
-                    'quality_criteria': project_spec.quality_criteria
-                }
+        task.success_criteria = success_criteria
+        
+        # エージェント要件の詳細化
+        agent_requirements = {}
+        if task.required_agents:
+            agent_requirements = {
+                'required': task.required_agents,
+                'preferred_count': min(len(task.required_agents), 3),
+                'specializations': [task.task_type.value]
             }
-            
-            detailed_tasks.append(task_dict)
-            
-            # タスクレジストリに登録
-            self.task_registry[task.id] = task
         
-        return detailed_tasks
+        # タスク辞書作成
+        task_dict = {
+            'id': task.id,
+            'name': task.name,
+            'description': task.description,
+            'type': task.task_type.value,
+            'priority': self._priority_to_string(task.priority),
+            'estimated_hours': task.estimated_hours,
+            'dependencies': list(task.dependencies),
+            'success_criteria': task.success_criteria,
+            'agent_requirements': agent_requirements,
+            'metadata': {
+                'project_id': task.project_id,
+                'project_type': project_spec.project_type.value,
+                'created_at': task.created_at.isoformat(),
+                'quality_criteria': project_spec.quality_criteria
+            }
+        }
+        
+        # タスクレジストリに登録
+        self.task_registry[task.id] = task
+        
+        return task_dict
     
     def _priority_to_string(self, priority: int) -> str:
         """優先度数値を文字列に変換"""
@@ -0,0 +1,284 @@
+"""
+Ultimate ShunsukeModel Ecosystem - Resource-Aware Project Scheduler
+リソース制約付きプロジェクトスケジューラー
+
+依存DAG・プロジェクトごとの所要時間・リソース容量から、時間軸付きの実行計画を作る。
+残り最長パス (bottom level) の長いプロジェクトを優先するリストスケジューリングで、
+容量の空いた時点で依存が充足済みのプロジェクトを順に開始してメイクスパンを短くする。
+結果は Gantt 形式の行データ / テキストとして出力できる
+"""
+
+import heapq
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Iterable, Tuple
+
+
+# 容量比較の許容誤差
+_EPSILON = 1e-9
+
+
+@dataclass
+class ScheduledProject:
+    """スケジュール済みプロジェクト"""
+    project: str
+    start: float
+    finish: float
+    resources: Dict[str, float] = field(default_factory=dict)
+    on_critical_path: bool = False
+
+    @property
+    def duration(self) -> float:
+        """所要時間"""
+        return self.finish - self.start
+
+
+@dataclass
+class ProjectSchedule:
+    """時間軸付き実行計画"""
+    entries: List[ScheduledProject]
+    makespan: float
+    capacity: Dict[str, float]
+    critical_path: List[str] = field(default_factory=list)
+    critical_path_length: float = 0.0
+    warnings: List[str] = field(default_factory=list)
+
+    def peak_usage(self) -> Dict[str, float]:
+        """リソースタイプ別の同時使用量の最大値"""
+        events: List[Tuple[float, int, Dict[str, float]]] = []
+        for entry in self.entries:
+            events.append((entry.start, 1, entry.resources))
+            events.append((entry.finish, 0, entry.resources))
+        # 同時刻は終了 (0) を先に処理
+        events.sort(key=lambda event: (event[0], event[1]))
+
+        usage = dict.fromkeys(self.capacity, 0.0)
+        peak = dict.fromkeys(self.capacity, 0.0)
+        for _, starting, resources in events:
+            sign = 1 if starting else -1
+            for resource, amount in resources.items():
+                usage[resource] = usage.get(resource, 0.0) + sign * amount
+                if usage[resource] > peak.get(resource, 0.0):
+                    peak[resource] = usage[resource]
+        return peak
+
+    def utilization(self) -> Dict[str, float]:
+        """メイクスパン全体での平均利用率"""
+        result = {}
+        for resource, limit in self.capacity.items():
+            work = sum(entry.resources.get(resource, 0.0) * entry.duration for entry in self.entries)
+            result[resource] = work / (limit * self.makespan) if limit > 0 and self.makespan > 0 else 0.0
+        return result
+
+    def to_gantt(self) -> List[Dict[str, Any]]:
+        """Gantt 形式の行データ (開始時刻順, 同時実行は別レーン)"""
+        rows = []
+        lanes: List[float] = []
+        for entry in sorted(self.entries, key=lambda e: (e.start, e.project)):
+            # 空いている最初のレーンへ割り当て
+            lane = next((i for i, free_at in enumerate(lanes) if free_at <= entry.start + _EPSILON), len(lanes))
+            if lane == len(lanes):
+                lanes.append(entry.finish)
+            else:
+                lanes[lane] = entry.finish
+            rows.append({
+                "project": entry.project,
+                "start": entry.start,
+                "finish": entry.finish,
+                "duration": entry.duration,
+                "lane": lane,
+                "critical": entry.on_critical_path,
+                "resources": dict(entry.resources)
+            })
+        return rows
+
+    def render_gantt(self, width: int = 60) -> str:
+        """テキスト形式の Gantt チャート (クリティカルパスは '#', その他は '=')"""
+        if not self.entries or self.makespan <= 0:
+            return ""
+        scale = width / self.makespan
+        name_width = max(len(entry.project) for entry in self.entries)
+        lines = []
+        for row in self.to_gantt():
+            offset = int(round(row["start"] * scale))
+            length = max(1, int(round(row["finish"] * scale)) - offset)
+            bar = ('#' if row["critical"] else '=') * length
+            lines.append(f"{row['project']:<{name_width}} |{' ' * offset}{bar:<{width - offset}}| {row['start']:.0f}-{row['finish']:.0f}")
+        return '\n'.join(lines)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """辞書変換"""
+        return {
+            "makespan": self.makespan,
+            "critical_path": list(self.critical_path),
+            "critical_path_length": self.critical_path_length,
+            "resource_delay": self.makespan - self.critical_path_length,
+            "capacity": dict(self.capacity),
+            "peak_usage": self.peak_usage(),
+            "utilization": self.utilization(),
+            "gantt": self.to_gantt(),
+            "warnings": list(self.warnings)
+        }
+
+
+class ResourceScheduler:
+    """
+    リソース制約付きリストスケジューラー
+
+    主要機能:
+    1. 依存DAGの残り最長パス (bottom level) による優先度付け
+    2. 容量を超えない範囲での開始 (優先度の低いプロジェクトによる隙間の充填を含む)
+    3. 所要時間で重み付けしたクリティカルパス算出
+    4. 単独で容量を超えるプロジェクトの直列実行と警告
+    """
+
+    def __init__(self, logger: Optional[logging.Logger] = None):
+        """初期化"""
+        self.logger = logger or logging.getLogger(__name__)
+
+    def schedule(
+        self,
+        projects: List[str],
+        edges: Iterable[Tuple[str, str]],
+        durations: Dict[str, float],
+        requirements: Dict[str, Dict[str, float]],
+        capacity: Dict[str, float]
+    ) -> ProjectSchedule:
+        """
+        スケジュール作成
+
+        Args:
+            projects: プロジェクトIDリスト (同優先度では先頭ほど先に開始)
+            edges: (先行プロジェクト, 後続プロジェクト) の依存エッジ
+            durations: プロジェクトごとの所要時間
+            requirements: プロジェクトごとのリソース使用量 (実行中は占有)
+            capacity: リソースタイプごとの同時使用上限
+
+        Returns:
+            時間軸付き実行計画
+        """
+        members = list(dict.fromkeys(projects))
+        rank = {project: i for i, project in enumerate(members)}
+        warnings: List[str] = []
+
+        successors: Dict[str, List[str]] = {project: [] for project in members}
+        for source, target in edges:
+            if source in rank and target in rank and target not in successors[source]:
+                successors[source].append(target)
+
+        order = self._topological_order(members, successors)
+        if order is None:
+            # 循環依存 - 入力順で後ろ向きのエッジを無視して非循環化
+            warnings.append("Circular dependency detected; ignoring edges against the given project order")
+            self.logger.warning(warnings[-1])
+            successors = {
+                project: [target for target in targets if rank[target] > rank[project]]
+                for project, targets in successors.items()
+            }
+            order = self._topological_order(members, successors)
+
+        # 残り最長パス (自身の所要時間を含む)
+        bottom_level: Dict[str, float] = {}
+        for project in reversed(order):
+            bottom_level[project] = durations.get(project, 0.0) + max(
+                (bottom_level[target] for target in successors[project]), default=0.0
+            )
+
+        waiting = dict.fromkeys(members, 0)
+        for targets in successors.values():
+            for target in targets:
+                waiting[target] += 1
+
+        demand = {project: {r: requirements.get(project, {}).get(r, 0.0) for r in capacity} for project in members}
+        oversized = {
+            project for project in members
+            if any(demand[project][r] > limit + _EPSILON for r, limit in capacity.items())
+        }
+        for project in sorted(oversized, key=rank.__getitem__):
+            warnings.append(f"{project} exceeds capacity on its own; scheduled while nothing else runs")
+            self.logger.warning(warnings[-1])
+
+        ready = [project for project in members if waiting[project] == 0]
+        running: List[Tuple[float, int, str]] = []
+        usage = dict.fromkeys(capacity, 0.0)
+        entries: Dict[str, ScheduledProject] = {}
+        now = 0.0
+
+        while ready or running:
+            # 優先度順に、容量内に収まるものを全て開始
+            ready.sort(key=lambda p: (-bottom_level[p], rank[p]))
+            deferred = []
+            for project in ready:
+                if project in oversized:
+                    fits = not running
+                else:
+                    fits = all(usage[r] + demand[project][r] <= limit + _EPSILON for r, limit in capacity.items())
+                if not fits:
+                    deferred.append(project)
+                    continue
+                finish = now + durations.get(project, 0.0)
+                entries[project] = ScheduledProject(project, now, finish, {r: a for r, a in demand[project].items() if a})
+                heapq.heappush(running, (finish, rank[project], project))
+                for r in capacity:
+                    usage[r] += demand[project][r]
+            ready = deferred
+
+            if not running:
+                break
+
+            # 次の終了時刻まで進め、同時刻に終わるものをまとめて解放
+            now = running[0][0]
+            while running and running[0][0] <= now + _EPSILON:
+                _, _, project = heapq.heappop(running)
+                for r in capacity:
+                    usage[r] -= demand[project][r]
+                for target in successors[project]:
+                    waiting[target] -= 1
+                    if waiting[target] == 0:
+                        ready.append(target)
+
+        critical_path = self._critical_path(order, successors, bottom_level)
+        for project in critical_path:
+            entries[project].on_critical_path = True
+
+        scheduled = [entries[project] for project in members if project in entries]
+        return ProjectSchedule(
+            entries=scheduled,
+            makespan=max((entry.finish for entry in scheduled), default=0.0),
+            capacity=dict(capacity),
+            critical_path=critical_path,
+            critical_path_length=bottom_level[critical_path[0]] if critical_path else 0.0,
+            warnings=warnings
+        )
+
+    @staticmethod
+    def _topological_order(members: List[str], successors: Dict[str, List[str]]) -> Optional[List[str]]:
+        """トポロジカル順 (循環がある場合は None)"""
+        indegree = dict.fromkeys(members, 0)
+        for targets in successors.values():
+            for target in targets:
+                indegree[target] += 1
+
+        order = [project for project in members if indegree[project] == 0]
+        for project in order:
+            for target in successors[project]:
+                indegree[target] -= 1
+                if indegree[target] == 0:
+                    order.append(target)
+        return order if len(order) == len(members) else None
+
+    @staticmethod
+    def _critical_path(
+        order: List[str],
+        successors: Dict[str, List[str]],
+        bottom_level: Dict[str, float]
+    ) -> List[str]:
+        """所要時間で重み付けした最長依存チェーン"""
+        if not order:
+            return []
+        node: Optional[str] = max(order, key=bottom_level.__getitem__)
+        path = []
+        while node is not None:
+            path.append(node)
+            node = max(successors[node], key=bottom_level.__getitem__, default=None)
+        return path
@@ -11,7 +11,6 @@ import logging
 from typing import Dict, List, Any, Optional, Callable, Union
 from dataclasses import dataclass, field
 from enum import Enum
-from pathlib import Path
 import json
 import yaml
 import uuid
@@ -21,6 +20,7 @@ import zlib
 import base64
 
 from ..coordinator.agent_coordinator import AgentMessage
+from ...core.ecosystem_logging import get_component_logger
 
 
 class MessageType(Enum):
@@ -390,27 +390,16 @@ class CommunicationProtocol:
         }
         
         # ログ設定
-        self.logger = logging.getLogger(f"{__name__}.{agent_id}")
-        self._setup_logging()
+        self.logger = self._setup_logging()
         
         # 実行状態
         self.is_running = False
         self._background_tasks = set()
         self._shutdown_event = asyncio.Event()
     
-    def _setup_logging(self):
-        """ログ設定"""
-        log_dir = Path.home() / '.claude' / 'logs' / 'shunsuke-ecosystem'
-        log_dir.mkdir(parents=True, exist_ok=True)
-        
-        handler = logging.FileHandler(log_dir / f'communication-{self.agent_id}.log')
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        handler.setFormatter(formatter)
-        
-        self.logger.addHandler(handler)
-        self.logger.setLevel(logging.INFO)
+    def _setup_logging(self) -> logging.Logger:
+        """ログ設定 (エージェントごとのロガーとファイル)"""
+        return get_component_logger(f"{__name__}.{self.agent_id}", f"communication-{self.agent_id}.log")
     
     async def initialize(self):
         """通信プロトコル初期化"""
@@ -501,7 +490,7 @@ class CommunicationProtocol:
         await self.reliability_manager.track_message(message)
         
         self.stats['messages_sent'] += 1
-        self.logger.debug(f"Message queued for sending: {message_id} to {receiver}")
+        self.logger.debug("Message queued for sending: %s to %s", message_id, receiver)
         
         return message_id
     
@@ -650,7 +639,7 @@ class CommunicationProtocol:
             # メッセージ配信（実際の実装では外部通信を行う）
             await self._actual_send(message, route)
             
-            self.logger.debug(f"Message delivered: {message.header.id}")
+            self.logger.debug("Message delivered: %s", message.header.id)
             
         except Exception as e:
             self.logger.error(f"Message delivery failed: {e}")
@@ -667,7 +656,7 @@ class CommunicationProtocol:
         # 送信をシミュレート
         await asyncio.sleep(0.01)
         
-        self.logger.debug(f"Sent {len(wire_data)} bytes to {route.next_hop}")
+        self.logger.debug("Sent %d bytes to %s", len(wire_data), route.next_hop)
     
     async def _handle_message(self, message: ProtocolMessage):
         """メッセージハンドリング"""
@@ -710,7 +699,7 @@ class CommunicationProtocol:
             delivery_mode=DeliveryMode.FIRE_AND_FORGET
         )
         
-        self.logger.debug(f"Sent ACK for message: {original_message.header.id}")
+        self.logger.debug("Sent ACK for message: %s", original_message.header.id)
     
     async def _handle_health_check(self, message: ProtocolMessage):
         """ヘルスチェックハンドラー"""
@@ -733,7 +722,7 @@ class CommunicationProtocol:
         original_message_id = message.payload.get('original_message_id')
         if original_message_id:
             await self.reliability_manager.acknowledge_message(original_message_id)
-            self.logger.debug(f"Received ACK for message: {original_message_id}")
+            self.logger.debug("Received ACK for message: %s", original_message_id)
     
     async def _handle_error(self, message: ProtocolMessage):
         """エラーハンドラー"""
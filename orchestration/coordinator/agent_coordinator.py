@@ -7,13 +7,15 @@ AIエージェント協調システム
 """
 
 import asyncio
+import inspect
 import logging
-from typing import Dict, List, Any, Optional, Set, Callable
+import time
+from typing import Dict, List, Any, Optional, Set, Callable, Deque, Tuple
 from dataclasses import dataclass, field
+from collections import deque
 from enum import Enum
 from pathlib import Path
 import json
-import yaml
 from datetime import datetime, timezone
 import uuid
 
@@ -23,6 +25,23 @@ from ...agents.doc_architect.doc_architect_agent import DocArchitectAgent
 from ...agents.quality_guardian.quality_guardian_agent import QualityGuardianAgent
 from ...agents.review_libero.review_libero_agent import ReviewLiberoAgent
 
+from ...core.ecosystem_logging import get_component_logger
+
+from .task_scheduler import WorkStealingScheduler, ScheduledTask
+from .autoscaler import AgentAutoscaler, ScalingPolicy, PoolMetrics, ScalingDecision
+from .task_archive import TaskArchive
+from .shared_context import SharedContext, BlobStore
+from .heartbeat import DeadlineIndex, ResourceSampler
+from .hedging import HedgingPolicy, LatencyTracker
+from .result_cache import AgentResultCache, FingerprintMemo, make_cache_key
+from .message_bus import MessageBus
+from .placement import PlacementPolicy, PlacementLog, create_placement_policy, locality_key_of
+from .instrumentation import CoordinatorMetrics, LoopMonitor
+
+
+# タスクごとの通信ログ保持件数 (リングバッファ)
+DEFAULT_COMMUNICATION_LOG_LIMIT = 100
+
 
 class AgentType(Enum):
     """エージェントタイプ"""
@@ -63,6 +82,8 @@ class AgentCapability:
     execution_time_estimate: float = 60.0  # seconds
     success_rate: float = 0.9
     dependencies: List[str] = field(default_factory=list)
+    cacheable: bool = False  # 同一入力に対して結果を再利用できるか
+    cache_ttl: Optional[float] = None  # 結果キャッシュの有効期間 (秒, None は既定値)
 
 
 @dataclass
@@ -94,11 +115,16 @@ class CollaborativeTask:
     dependencies: List[str] = field(default_factory=list)
     deadline: Optional[datetime] = None
     status: str = "pending"
+    locality_key: Optional[str] = None  # プロジェクト / パス (配置ポリシー用)
+    capability: Optional[str] = None  # 使用する能力名 (結果キャッシュ可否の判定用)
     progress: float = 0.0
     results: Dict[str, Any] = field(default_factory=dict)
-    communication_log: List[Dict[str, Any]] = field(default_factory=list)
+    communication_log: Deque[Dict[str, Any]] = field(
+        default_factory=lambda: deque(maxlen=DEFAULT_COMMUNICATION_LOG_LIMIT)
+    )
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    submitted_at: float = field(default_factory=time.monotonic)  # キュー待ち時間計測用
 
 
 @dataclass
@@ -131,9 +157,16 @@ class AgentCoordinator:
         self.config = config
         self.agents: Dict[str, AgentInstance] = {}
         self.tasks: Dict[str, CollaborativeTask] = {}
-        self.message_queue: asyncio.Queue = asyncio.Queue()
         self.communication_channels: Dict[str, asyncio.Queue] = {}
         
+        # 優先レーン付き有界メッセージバス (エラー > ステータス > パフォーマンス)
+        bus_config = config.get('message_bus', {})
+        self.message_bus = MessageBus(
+            lane_capacity=bus_config.get('lane_capacity'),
+            default_capacity=bus_config.get('capacity', 1000)
+        )
+        self.message_batch_size = bus_config.get('batch_size', 64)
+        
         # ログ設定
         self.logger = logging.getLogger(__name__)
         self._setup_logging()
@@ -142,8 +175,90 @@ class AgentCoordinator:
         self.max_concurrent_tasks = config.get('max_concurrent_tasks', 10)
         self.agent_timeout = config.get('agent_timeout', 300)  # 5 minutes
         self.heartbeat_interval = config.get('heartbeat_interval', 30)  # 30 seconds
+        self.heartbeat_timeout = config.get('heartbeat_timeout', self.heartbeat_interval * 2)
+        self.resource_sample_interval = config.get('resource_sample_interval', 60)  # 1 minute
         self.auto_scaling_enabled = config.get('auto_scaling', True)
         
+        # タスク保持ポリシー: アクティブタスクのみメモリに保持し、完了タスクはアーカイブへ移動
+        retention_config = config.get('task_retention', {})
+        self.communication_log_limit = retention_config.get('communication_log_limit', DEFAULT_COMMUNICATION_LOG_LIMIT)
+        self.archive_completed_tasks = retention_config.get('archive_completed', True)
+        self.task_archive = TaskArchive(
+            Path(retention_config.get(
+                'archive_dir',
+                Path.home() / '.claude' / 'shunsuke-ecosystem' / 'task-archive'
+            )),
+            segment_max_bytes=retention_config.get('segment_max_bytes', 8 * 1024 * 1024),
+            max_segments=retention_config.get('max_segments', 32)
+        )
+        
+        # ステータス別タスク数 (get_status を O(1) に保つための累積カウンター)
+        self.task_status_counts: Dict[str, int] = {}
+        
+        # ハートビート期限インデックスとリソースサンプラー
+        self.heartbeat_index = DeadlineIndex(self.heartbeat_timeout)
+        self.resource_sampler = ResourceSampler()
+        
+        # ワークスティーリングスケジューラー
+        self.scheduler = WorkStealingScheduler(
+            max_concurrent_tasks=self.max_concurrent_tasks,
+            is_agent_available=self._is_agent_available,
+            launch=self._launch_scheduled_task
+        )
+        
+        # オートスケーラー (エージェントタイプ別のポリシーは _create_agent_instances で設定)
+        self.autoscaler = AgentAutoscaler({})
+        self.autoscaling_interval = config.get('auto_scaling_interval', 5.0)
+        self._agent_templates: Dict[AgentType, Dict[str, Any]] = {}
+        self._agent_sequence: Dict[AgentType, int] = {}
+        
+        # ストラグラー対策のヘッジ実行 (既定では無効)
+        self.hedging_policy = HedgingPolicy.from_config(config.get('hedging', {}))
+        self.latency_tracker = LatencyTracker(config.get('latency_window', 200))
+        self.hedging_stats = {'launched': 0, 'won': 0, 'cancelled': 0}
+        
+        # エージェント配分の排他制御
+        self._allocation_lock = asyncio.Lock()
+        
+        # エージェント配置ポリシー (既定はローカリティ考慮型)
+        placement_config = dict(config.get('placement', {}))
+        self.placement_log = PlacementLog(placement_config.pop('log_size', 1000))
+        self.placement_policy: PlacementPolicy = create_placement_policy(placement_config)
+        
+        # エージェント結果キャッシュ (既定では無効)
+        cache_config = config.get('result_cache', {})
+        self.result_cache: Optional[AgentResultCache] = None
+        if cache_config.get('enabled', False):
+            disk_dir = cache_config.get('disk_dir')
+            self.result_cache = AgentResultCache(
+                max_entries=cache_config.get('max_entries', 1024),
+                default_ttl=cache_config.get('ttl', 600.0),
+                disk_dir=Path(disk_dir).expanduser() if disk_dir else None
+            )
+        self.fingerprints = FingerprintMemo(cache_config.get('fingerprint_ttl', 2.0))
+        
+        # 計測 (イベントループ遅延・戦略別レイテンシ・エージェント別待ち/実行時間)
+        instrumentation_config = config.get('instrumentation', {})
+        self.instrumentation_enabled = instrumentation_config.get('enabled', True)
+        self.metrics_snapshot_interval = instrumentation_config.get('snapshot_interval', 60)
+        self.metrics = CoordinatorMetrics(
+            loop_monitor=LoopMonitor(
+                interval=instrumentation_config.get('loop_lag_interval', 0.5),
+                slow_threshold=instrumentation_config.get('slow_callback_threshold', 0.1),
+                capture_asyncio_debug=instrumentation_config.get('asyncio_debug', False)
+            ) if self.instrumentation_enabled else None,
+            snapshot_path=Path(instrumentation_config.get(
+                'snapshot_path',
+                Path.home() / '.claude' / 'shunsuke-ecosystem' / 'coordinator-metrics.json'
+            )).expanduser() if self.instrumentation_enabled else None
+        )
+        
+        # ステージ間コンテキストでブロブ化する出力サイズの閾値
+        self.context_inline_threshold = config.get('context_inline_threshold', 64 * 1024)
+        
+        # エージェントクラス -> execute_task が blob_store 引数を受け取るか
+        self._blob_store_support: Dict[type, bool] = {}
+        
         # 協調戦略
         self.collaboration_strategies = {
             'sequential': self._execute_sequential,
@@ -158,24 +273,18 @@ class AgentCoordinator:
         self._background_tasks = set()
     
     def _setup_logging(self):
-        """ログ設定"""
-        log_dir = Path.home() / '.claude' / 'logs' / 'shunsuke-ecosystem'
-        log_dir.mkdir(parents=True, exist_ok=True)
-        
-        handler = logging.FileHandler(log_dir / 'agent-coordinator.log')
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        handler.setFormatter(formatter)
-        
-        self.logger.addHandler(handler)
-        self.logger.setLevel(logging.INFO)
+        """ログ設定 (共通ロギング基盤, ハンドラーはロガーごとに1つ)"""
+        get_component_logger(__name__, 'agent-coordinator.log')
     
     async def initialize(self):
         """エージェント協調システム初期化"""
         try:
             self.logger.info("Agent Coordinator initialization started")
             
+            # タスクアーカイブを開く
+            if self.archive_completed_tasks:
+                self.task_archive.open()
+            
             # エージェントインスタンス作成
             await self._create_agent_instances()
             
@@ -206,13 +315,15 @@ class AgentCoordinator:
                         name="web_content_analysis",
                         description="Web content extraction and analysis",
                         complexity_level=5,
-                        execution_time_estimate=120.0
+                        execution_time_estimate=120.0,
+                        cacheable=True
                     ),
                     AgentCapability(
                         name="context_structuring",
                         description="Hierarchical context structure creation",
                         complexity_level=6,
-                        execution_time_estimate=90.0
+                        execution_time_estimate=90.0,
+                        cacheable=True
                     )
                 ]
             },
@@ -257,7 +368,8 @@ class AgentCoordinator:
                         name="quality_analysis",
                         description="Comprehensive quality assessment",
                         complexity_level=7,
-                        execution_time_estimate=100.0
+                        execution_time_estimate=100.0,
+                        cacheable=True
                     ),
                     AgentCapability(
                         name="test_generation",
@@ -286,34 +398,89 @@ class AgentCoordinator:
             }
         }
         
+        # スケーリングポリシーの既定値
+        default_policy = ScalingPolicy.from_config(self.config.get('auto_scaling_policy', {}))
+        
         # エージェントインスタンス生成
         for agent_type, config in default_agents.items():
-            count = agent_configs.get(agent_type.value, {}).get('count', config['count'])
+            type_config = agent_configs.get(agent_type.value, {})
+            count = type_config.get('count', config['count'])
             
-            for i in range(count):
-                agent_id = f"{agent_type.value}_{i+1}"
-                
-                # エージェントオブジェクト作成
-                agent_object = await self._create_agent_object(agent_type, agent_id)
-                
-                # エージェントインスタンス作成
-                instance = AgentInstance(
-                    id=agent_id,
-                    agent_type=agent_type,
-                    capabilities=config['capabilities'].copy(),
-                    agent_object=agent_object,
-                    configuration=agent_configs.get(agent_type.value, {})
-                )
-                
-                self.agents[agent_id] = instance
-                
-                # 通信チャネル作成
-                self.communication_channels[agent_id] = asyncio.Queue()
-                
-                self.logger.info(f"Created agent instance: {agent_id}")
+            self._agent_templates[agent_type] = {
+                'capabilities': config['capabilities'],
+                'configuration': type_config
+            }
+            self.autoscaler.policies[agent_type.value] = ScalingPolicy.from_config(
+                {'min': type_config.get('min', count), 'max': type_config.get('max', max(count, default_policy.max_agents)), **type_config},
+                defaults=default_policy
+            )
+            
+            for _ in range(count):
+                await self._spawn_agent(agent_type)
         
         self.logger.info(f"Created {len(self.agents)} agent instances")
     
+    async def _spawn_agent(self, agent_type: AgentType) -> AgentInstance:
+        """エージェントインスタンスを1つ追加"""
+        template = self._agent_templates[agent_type]
+        sequence = self._agent_sequence.get(agent_type, 0) + 1
+        self._agent_sequence[agent_type] = sequence
+        agent_id = f"{agent_type.value}_{sequence}"
+        
+        # エージェントオブジェクト作成
+        agent_object = await self._create_agent_object(agent_type, agent_id)
+        
+        # エージェントインスタンス作成
+        instance = AgentInstance(
+            id=agent_id,
+            agent_type=agent_type,
+            capabilities=template['capabilities'].copy(),
+            agent_object=agent_object,
+            configuration=template['configuration']
+        )
+        
+        self.agents[agent_id] = instance
+        
+        # 通信チャネル作成
+        self.communication_channels[agent_id] = asyncio.Queue()
+        
+        self.scheduler.register_agent(agent_id, agent_type)
+        
+        # ワーカープロセスを持つエージェントはリソースサンプリング対象に登録
+        self.resource_sampler.register(
+            agent_id,
+            template['configuration'].get('pid', getattr(agent_object, 'pid', None))
+        )
+        
+        self.logger.info(f"Created agent instance: {agent_id}")
+        return instance
+    
+    async def _retire_agent(self, agent_id: str) -> bool:
+        """アイドル状態のエージェントインスタンスを1つ削除"""
+        agent = self.agents.get(agent_id)
+        if agent is None or agent.status != AgentStatus.IDLE:
+            return False
+        
+        # 新規ディスパッチ対象から外し、ローカルキューを兄弟エージェントへ移す
+        agent.status = AgentStatus.OFFLINE
+        self.scheduler.unregister_agent(agent_id)
+        self.heartbeat_index.discard(agent_id)
+        self.resource_sampler.unregister(agent_id)
+        self.placement_policy.forget(agent_id)
+        self.metrics.forget_agent(agent_id)
+        
+        if agent.agent_object and hasattr(agent.agent_object, 'shutdown'):
+            try:
+                await agent.agent_object.shutdown()
+            except Exception as e:
+                self.logger.error(f"Error shutting down agent {agent_id}: {e}")
+        
+        del self.agents[agent_id]
+        self.communication_channels.pop(agent_id, None)
+        
+        self.logger.info(f"Retired agent instance: {agent_id}")
+        return True
+    
     async def _create_agent_object(self, agent_type: AgentType, agent_id: str):
         """エージェントオブジェクト作成"""
         # エージェントタイプに応じて実際のエージェントオブジェクトを作成
@@ -353,6 +520,19 @@ class AgentCoordinator:
         scheduler_task = asyncio.create_task(self._task_scheduler())
         self._background_tasks.add(scheduler_task)
         
+        # オートスケーリング
+        if self.auto_scaling_enabled:
+            autoscaling_task = asyncio.create_task(self._autoscaling_monitor())
+            self._background_tasks.add(autoscaling_task)
+        
+        # 計測
+        if self.instrumentation_enabled:
+            loop_monitor_task = asyncio.create_task(self.metrics.loop_monitor.run(self._shutdown_event))
+            self._background_tasks.add(loop_monitor_task)
+            
+            snapshot_task = asyncio.create_task(self._metrics_snapshot_writer())
+            self._background_tasks.add(snapshot_task)
+        
         self.logger.info("Background tasks started")
     
     async def allocate_agents_to_tasks(self, task_requests: List[Dict[str, Any]]) -> Dict[str, List[str]]:
@@ -367,25 +547,29 @@ class AgentCoordinator:
         """
         allocation = {}
         
-        for task_request in task_requests:
-            task_id = task_request['id']
-            requirements = task_request.get('requirements', {})
-            
-            # 必要なエージェントタイプを特定
-            required_types = self._determine_required_agent_types(requirements)
-            
-            # 利用可能なエージェントを検索
-            allocated_agents = []
-            for agent_type in required_types:
-                available_agent = await self._find_available_agent(agent_type)
-                if available_agent:
-                    allocated_agents.append(available_agent.id)
-                    available_agent.status = AgentStatus.BUSY
-                    available_agent.current_task = task_id
-                    
-                    self.logger.info(f"Allocated agent {available_agent.id} to task {task_id}")
-            
-            allocation[task_id] = allocated_agents
+        # 複数セッションからの同時配分で同じエージェントを二重に割り当てないよう直列化
+        async with self._allocation_lock:
+            for task_request in task_requests:
+                task_id = task_request['id']
+                requirements = task_request.get('requirements', {})
+                
+                # 必要なエージェントタイプを特定
+                required_types = self._determine_required_agent_types(requirements)
+                locality_key = locality_key_of(task_request)
+                
+                # 利用可能なエージェントを検索
+                allocated_agents = []
+                for agent_type in required_types:
+                    available_agent = await self._find_available_agent(agent_type, locality_key, task_id)
+                    if available_agent:
+                        allocated_agents.append(available_agent.id)
+                        available_agent.status = AgentStatus.BUSY
+                        available_agent.current_task = task_id
+                        self._touch_agent(available_agent)
+                        
+                        self.logger.info("Allocated agent %s to task %s", available_agent.id, task_id)
+                
+                allocation[task_id] = allocated_agents
         
         return allocation
     
@@ -417,8 +601,13 @@ class AgentCoordinator:
         
         return required_types
     
-    async def _find_available_agent(self, agent_type: AgentType) -> Optional[AgentInstance]:
-        """利用可能なエージェントを検索"""
+    async def _find_available_agent(
+        self,
+        agent_type: AgentType,
+        locality_key: Optional[str] = None,
+        task_id: Optional[str] = None
+    ) -> Optional[AgentInstance]:
+        """利用可能なエージェントを検索 (配置ポリシーで選択)"""
         candidates = [
             agent for agent in self.agents.values()
             if agent.agent_type == agent_type and agent.status == AgentStatus.IDLE
@@ -427,8 +616,39 @@ class AgentCoordinator:
         if not candidates:
             return None
         
-        # パフォーマンスメトリクスに基づいて最適なエージェントを選択
-        return min(candidates, key=lambda a: a.resource_usage.get('cpu', 0))
+        agent, reason = self.placement_policy.select(candidates, locality_key)
+        self._record_placement(agent, reason, locality_key, task_id, len(candidates))
+        return agent
+    
+    def _record_placement(
+        self,
+        agent: AgentInstance,
+        reason: str,
+        locality_key: Optional[str],
+        task_id: Optional[str],
+        candidate_count: int
+    ):
+        """配置判断を記録"""
+        self.placement_policy.record(agent.id, locality_key)
+        decision = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "task_id": task_id,
+            "agent_id": agent.id,
+            "agent_type": agent.agent_type.value,
+            "locality_key": locality_key,
+            "reason": reason,
+            "candidates": candidate_count,
+            "cpu": agent.resource_usage.get('cpu', 0)
+        }
+        self.placement_log.append(decision)
+        self.logger.info(
+            "Placement decision: %s -> %s (%s)", task_id, agent.id, reason,
+            extra={"placement": decision}
+        )
+    
+    def get_placement_log(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """直近の配置判断"""
+        return self.placement_log.recent(limit)
     
     async def execute_task_with_agents(
         self,
@@ -456,17 +676,173 @@ class AgentCoordinator:
             name=task_spec.get('name', 'Unnamed Task'),
             description=task_spec.get('description', ''),
             assigned_agents=agents,
-            priority=TaskPriority(task_spec.get('priority', 3))
+            priority=TaskPriority(task_spec.get('priority', 3)),
+            locality_key=locality_key_of(task_spec),
+            capability=task_spec.get('capability'),
+            communication_log=deque(maxlen=self.communication_log_limit)
         )
         
-        self.tasks[task_id] = task
+        self._register_task(task)
+        
+        # 同時実行数の上限を適用
+        await self.scheduler.acquire_slot()
+        try:
+            return await self._run_collaborative_task(task, agents)
+        finally:
+            self.scheduler.release_slot()
+    
+    async def submit_task(
+        self,
+        task_id: str,
+        task_spec: Dict[str, Any],
+        required_agents: Optional[List[AgentType]] = None
+    ) -> asyncio.Future:
+        """
+        スケジューラー経由でタスクを投入
+        
+        Args:
+            task_id: タスクID
+            task_spec: タスク仕様
+            required_agents: 必要なエージェントタイプ (省略時は要求内容から推定)
+            
+        Returns:
+            実行結果を受け取る Future
+        """
+        if required_agents is None:
+            required_agents = self._determine_required_agent_types(task_spec.get('requirements', task_spec))
+        
+        task = CollaborativeTask(
+            id=task_id,
+            name=task_spec.get('name', 'Unnamed Task'),
+            description=task_spec.get('description', ''),
+            required_agents=list(required_agents),
+            priority=TaskPriority(task_spec.get('priority', 3)),
+            locality_key=locality_key_of(task_spec),
+            capability=task_spec.get('capability'),
+            communication_log=deque(maxlen=self.communication_log_limit)
+        )
+        
+        # 投入が拒否された (ValueError) タスクは登録しない (ディスパッチは次のスケジューラー周回のため登録は後でよい)
+        future = asyncio.get_running_loop().create_future()
+        self.scheduler.submit(ScheduledTask(
+            task_id=task_id,
+            agent_types=task.required_agents,
+            task_spec=task_spec,
+            priority=task.priority.value,
+            future=future
+        ))
+        self._register_task(task)
+        
+        self.logger.debug("Task submitted to scheduler: %s", task_id)
+        return future
+    
+    def _register_task(self, task: CollaborativeTask):
+        """タスク登録"""
+        self.tasks[task.id] = task
+        self.task_status_counts[task.status] = self.task_status_counts.get(task.status, 0) + 1
+    
+    def _set_task_status(self, task: CollaborativeTask, status: str):
+        """タスクステータス更新 (カウンター同期)"""
+        if task.status == status:
+            return
+        self.task_status_counts[task.status] = self.task_status_counts.get(task.status, 0) - 1
+        self.task_status_counts[status] = self.task_status_counts.get(status, 0) + 1
+        task.status = status
+        task.updated_at = datetime.now(timezone.utc)
+    
+    def _archive_task(self, task: CollaborativeTask):
+        """終了したタスクをメモリからアーカイブへ移動"""
+        if not self.archive_completed_tasks:
+            return
+        
+        try:
+            self.task_archive.append({
+                "id": task.id,
+                "name": task.name,
+                "description": task.description,
+                "priority": task.priority.value,
+                "required_agents": [a.value for a in task.required_agents],
+                "assigned_agents": task.assigned_agents,
+                "status": task.status,
+                "progress": task.progress,
+                "locality_key": task.locality_key,
+                "results": task.results,
+                "communication_log": list(task.communication_log),
+                "created_at": task.created_at.isoformat(),
+                "updated_at": task.updated_at.isoformat()
+            })
+        except Exception as e:
+            # アーカイブ失敗時はメモリに残す
+            self.logger.error(f"Failed to archive task {task.id}: {e}")
+            return
+        
+        self.tasks.pop(task.id, None)
+    
+    def get_task(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """タスク情報取得 (アクティブタスク → アーカイブの順に検索)"""
+        task = self.tasks.get(task_id)
+        if task is not None:
+            return {
+                "id": task.id,
+                "name": task.name,
+                "status": task.status,
+                "progress": task.progress,
+                "assigned_agents": task.assigned_agents,
+                "communication_log": list(task.communication_log),
+                "created_at": task.created_at.isoformat(),
+                "updated_at": task.updated_at.isoformat()
+            }
+        return self.task_archive.get(task_id)
+    
+    def _is_agent_available(self, agent_id: str) -> bool:
+        """エージェントが新規タスクを受け付け可能か"""
+        agent = self.agents.get(agent_id)
+        return agent is not None and agent.status == AgentStatus.IDLE
+    
+    def _launch_scheduled_task(self, entry: ScheduledTask, agent_ids: List[str]):
+        """スケジューラーが選択したエージェントでタスクを起動"""
+        for agent_id in agent_ids:
+            agent = self.agents[agent_id]
+            agent.status = AgentStatus.BUSY
+            agent.current_task = entry.task_id
+            self._touch_agent(agent)
+        
+        task = self.tasks[entry.task_id]
+        task.assigned_agents = list(agent_ids)
+        for agent_id in agent_ids:
+            self.placement_policy.record(agent_id, task.locality_key)
+        
+        runner = asyncio.create_task(self._run_scheduled_task(entry, task, agent_ids))
+        self._background_tasks.add(runner)
+        runner.add_done_callback(self._background_tasks.discard)
+        
+        self.logger.info("Dispatched task %s to agents %s", entry.task_id, agent_ids)
+    
+    async def _run_scheduled_task(self, entry: ScheduledTask, task: CollaborativeTask, agent_ids: List[str]):
+        """スケジュール済みタスク実行"""
+        try:
+            result = await self._run_collaborative_task(task, agent_ids)
+            if entry.future and not entry.future.done():
+                entry.future.set_result(result)
+        except Exception as e:
+            if entry.future and not entry.future.done():
+                entry.future.set_exception(e)
+        finally:
+            self.scheduler.task_finished()
+    
+    async def _run_collaborative_task(self, task: CollaborativeTask, agents: List[str]) -> Dict[str, Any]:
+        """協調タスク実行本体"""
+        task_id = task.id
+        self._set_task_status(task, "running")
         
         try:
             # 協調戦略の決定
             strategy = self._determine_collaboration_strategy(task, agents)
             
             # タスク実行
+            strategy_started = time.monotonic()
             result = await self.collaboration_strategies[strategy](task)
+            self.metrics.observe_strategy(strategy, time.monotonic() - strategy_started)
             
             # 結果の統合
             final_result = await self._integrate_results(task, result)
@@ -474,16 +850,18 @@ class AgentCoordinator:
             # エージェントステータス更新
             await self._release_agents(agents)
             
-            task.status = "completed"
             task.progress = 1.0
-            task.updated_at = datetime.now(timezone.utc)
+            self._set_task_status(task, "completed")
+            
+            execution_time = (task.updated_at - task.created_at).total_seconds()
+            self._archive_task(task)
             
             return {
                 "success": True,
                 "task_id": task_id,
                 "result": final_result,
                 "agents_used": agents,
-                "execution_time": (task.updated_at - task.created_at).total_seconds()
+                "execution_time": execution_time
             }
             
         except Exception as e:
@@ -491,8 +869,8 @@ class AgentCoordinator:
             
             # エラー時のクリーンアップ
             await self._release_agents(agents)
-            task.status = "failed"
-            task.updated_at = datetime.now(timezone.utc)
+            self._set_task_status(task, "failed")
+            self._archive_task(task)
             
             return {
                 "success": False,
@@ -521,16 +899,24 @@ class AgentCoordinator:
         # 混合 -> 階層的
         return 'hierarchical'
     
+    def _new_stage_context(self) -> SharedContext:
+        """ステージ間で共有する空のコンテキスト (ブロブストアは協調タスク単位)"""
+        return SharedContext.empty(BlobStore(self.context_inline_threshold))
+    
     async def _execute_sequential(self, task: CollaborativeTask) -> Dict[str, Any]:
         """順次実行戦略"""
         results = {}
+        previous_results = self._new_stage_context()
+        ready_at = task.submitted_at
         
         for agent_id in task.assigned_agents:
             agent = self.agents[agent_id]
             
-            # エージェントにタスクを送信
-            result = await self._send_task_to_agent(agent, task, results)
+            # エージェントにタスクを送信 (前段までの結果は不変コンテキストとして参照渡し)
+            result = await self._send_task_to_agent(agent, task, previous_results, ready_at)
             results[agent_id] = result
+            previous_results = previous_results.with_updates({agent_id: result})
+            ready_at = time.monotonic()
             
             # 進捗更新
             task.progress = len(results) / len(task.assigned_agents)
@@ -539,44 +925,44 @@ class AgentCoordinator:
     
     async def _execute_parallel(self, task: CollaborativeTask) -> Dict[str, Any]:
         """並列実行戦略"""
-        # 全エージェントに並行してタスクを送信
-        tasks = []
-        for agent_id in task.assigned_agents:
-            agent = self.agents[agent_id]
-            agent_task = asyncio.create_task(
-                self._send_task_to_agent(agent, task, {})
-            )
-            tasks.append((agent_id, agent_task))
+        # 全エージェントに並行してタスクを送信 (遅延エージェントはヘッジ実行)
+        agent_ids = list(task.assigned_agents)
+        outcomes = await asyncio.gather(
+            *(
+                self._send_task_with_hedging(self.agents[agent_id], task, SharedContext.empty())
+                for agent_id in agent_ids
+            ),
+            return_exceptions=True
+        )
         
         # 結果を収集
         results = {}
-        for agent_id, agent_task in tasks:
-            try:
-                result = await agent_task
-                results[agent_id] = result
-            except Exception as e:
-                self.logger.error(f"Agent {agent_id} failed: {e}")
-                results[agent_id] = {"success": False, "error": str(e)}
+        for agent_id, outcome in zip(agent_ids, outcomes):
+            if isinstance(outcome, Exception):
+                self.logger.error(f"Agent {agent_id} failed: {outcome}")
+                results[agent_id] = {"success": False, "error": str(outcome)}
+            else:
+                results[agent_id] = outcome
         
         return results
     
     async def _execute_pipeline(self, task: CollaborativeTask) -> Dict[str, Any]:
         """パイプライン実行戦略"""
         results = {}
-        pipeline_data = {}
+        pipeline_data = self._new_stage_context()
+        ready_at = task.submitted_at
         
         for i, agent_id in enumerate(task.assigned_agents):
             agent = self.agents[agent_id]
             
-            # 前段の結果を入力として使用
-            input_data = pipeline_data if i > 0 else {}
-            
-            result = await self._send_task_to_agent(agent, task, input_data)
+            # 前段の結果を入力として使用 (構造共有されたスナップショットを参照渡し)
+            result = await self._send_task_to_agent(agent, task, pipeline_data, ready_at)
             results[agent_id] = result
+            ready_at = time.monotonic()
             
-            # 次段への出力を準備
+            # 次段への出力を準備 (差分レイヤーのみ追加)
             if result.get('success', False):
-                pipeline_data.update(result.get('output', {}))
+                pipeline_data = pipeline_data.with_updates(result.get('output', {}))
             
             task.progress = (i + 1) / len(task.assigned_agents)
         
@@ -604,38 +990,127 @@ class AgentCoordinator:
         ]
         
         results = {}
-        accumulated_data = {}
+        accumulated_data = self._new_stage_context()
+        ready_at = task.submitted_at
         
         for agent_type in hierarchy_order:
             if agent_type in agent_groups:
-                # このタイプのエージェントを並列実行
+                # このタイプのエージェントを並列実行 (遅延エージェントはヘッジ実行)
                 group_agents = agent_groups[agent_type]
-                group_tasks = []
+                group_results = await asyncio.gather(*(
+                    self._send_task_with_hedging(self.agents[agent_id], task, accumulated_data, ready_at)
+                    for agent_id in group_agents
+                ))
+                ready_at = time.monotonic()
                 
-                for agent_id in group_agents:
-                    agent = self.agents[agent_id]
-                    agent_task = asyncio.create_task(
-                        self._send_task_to_agent(agent, task, accumulated_data)
-                    )
-                    group_tasks.append((agent_id, agent_task))
-                
-                # グループ結果を収集
-                for agent_id, agent_task in group_tasks:
-                    result = await agent_task
+                # グループ結果を収集 (グループ内の全エージェントは同じスナップショットを参照)
+                group_output = {}
+                for agent_id, result in zip(group_agents, group_results):
                     results[agent_id] = result
                     
                     if result.get('success', False):
-                        accumulated_data.update(result.get('output', {}))
+                        group_output.update(result.get('output', {}))
+                
+                accumulated_data = accumulated_data.with_updates(group_output)
         
         return results
     
+    async def _send_task_with_hedging(
+        self,
+        agent: AgentInstance,
+        task: CollaborativeTask,
+        context_data: SharedContext,
+        ready_at: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """ヘッジ付きタスク送信 (タイプ別 p90 超過時に同タイプの空きエージェントで再実行)"""
+        primary_started = time.monotonic()
+        primary = asyncio.create_task(self._send_task_to_agent(agent, task, context_data, ready_at))
+        
+        delay = self.latency_tracker.hedge_delay(agent.agent_type, self.hedging_policy)
+        if delay is None:
+            return await primary
+        
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done:
+            return primary.result()
+        
+        backup_agent = await self._find_available_agent(agent.agent_type, task.locality_key, task.id)
+        if backup_agent is None:
+            return await primary
+        
+        backup_agent.status = AgentStatus.BUSY
+        backup_agent.current_task = task.id
+        self._touch_agent(backup_agent)
+        self.hedging_stats['launched'] += 1
+        self.logger.info(
+            f"Hedging task {task.id}: {agent.id} exceeded {delay:.2f}s, launching backup on {backup_agent.id}"
+        )
+        
+        backup = asyncio.create_task(
+            self._send_task_to_agent(backup_agent, task, context_data, time.monotonic())
+        )
+        pending = {primary, backup}
+        result = None
+        
+        try:
+            # 最初に成功した結果を採用 (先に失敗した場合はもう一方を待つ)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for finished in done:
+                    candidate = finished.result()
+                    if result is None or (candidate.get('success', False) and not result.get('success', False)):
+                        result = candidate
+                        if finished is backup:
+                            result = {**candidate, "hedged_for": agent.id}
+                if result.get('success', False):
+                    break
+            
+            if result.get('hedged_for'):
+                self.hedging_stats['won'] += 1
+            return result
+        
+        finally:
+            # 敗者をキャンセルしてバックアップエージェントを解放
+            for loser in pending:
+                loser.cancel()
+                self.hedging_stats['cancelled'] += 1
+                if loser is primary:
+                    # 遅延した元の実行こそがストラグラー - 経過時間を下限値として分布へ反映
+                    self.latency_tracker.record_censored(agent.agent_type, time.monotonic() - primary_started)
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            await self._release_agents([backup_agent.id])
+    
     async def _send_task_to_agent(
         self,
         agent: AgentInstance,
         task: CollaborativeTask,
-        context_data: Dict[str, Any]
+        context_data: SharedContext,
+        ready_at: Optional[float] = None
     ) -> Dict[str, Any]:
-        """エージェントにタスクを送信"""
+        """
+        エージェントにタスクを送信
+        
+        Args:
+            agent: 送信先エージェント
+            task: 協調タスク
+            context_data: 前段までの共有コンテキスト
+            ready_at: このステージが実行可能になった時刻 (キュー待ち時間の起点, 省略時はタスク投入時刻)
+        """
+        cache_key, cache_ttl = await self._result_cache_key(agent, task, context_data)
+        if cache_key is not None:
+            cached = await self.result_cache.aget(cache_key)
+            if cached is not None:
+                task.communication_log.append({
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "sender": "coordinator",
+                    "receiver": agent.id,
+                    "action": "task_sent",
+                    "result": "cache_hit"
+                })
+                return {**cached, "agent_id": agent.id, "cache_hit": True}
+        
+        started = time.monotonic()
         try:
             # タスクメッセージ作成
             message = AgentMessage(
@@ -647,7 +1122,8 @@ class AgentCoordinator:
                     "task_id": task.id,
                     "task_name": task.name,
                     "task_description": task.description,
-                    "context_data": context_data,
+                    # 大きな出力はブロブ参照 ({"$blob": digest}) のまま渡し、ステージごとに複製しない
+                    "context_data": context_data.to_message_dict(),
                     "priority": task.priority.value
                 },
                 requires_response=True,
@@ -656,11 +1132,19 @@ class AgentCoordinator:
             
             # エージェントの実行メソッドを呼び出し
             if agent.agent_object and hasattr(agent.agent_object, 'execute_task'):
-                result = await agent.agent_object.execute_task(message.content)
+                if self._accepts_blob_store(agent.agent_object):
+                    result = await agent.agent_object.execute_task(message.content, blob_store=context_data.blob_store)
+                else:
+                    result = await agent.agent_object.execute_task(message.content)
             else:
                 # モックエージェントの場合
                 result = await self._mock_agent_execution(agent, message.content)
             
+            finished = time.monotonic()
+            self._record_latency(agent, finished - started)
+            queue_wait = started - (task.submitted_at if ready_at is None else ready_at)
+            self.metrics.observe_agent(agent.id, queue_wait, finished - started)
+            
             # 通信ログに記録
             task.communication_log.append({
                 "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -670,6 +1154,9 @@ class AgentCoordinator:
                 "result": "success"
             })
             
+            if cache_key is not None and result.get('success', False):
+                await self.result_cache.aput(cache_key, result, cache_ttl)
+            
             return result
             
         except Exception as e:
@@ -680,6 +1167,70 @@ class AgentCoordinator:
                 "agent_id": agent.id
             }
     
+    def _accepts_blob_store(self, agent_object: Any) -> bool:
+        """execute_task がブロブ参照解決用の blob_store 引数を受け取るか (クラスごとにキャッシュ)"""
+        agent_class = type(agent_object)
+        accepts = self._blob_store_support.get(agent_class)
+        if accepts is None:
+            try:
+                parameters = inspect.signature(agent_object.execute_task).parameters
+            except (TypeError, ValueError):
+                parameters = {}
+            accepts = self._blob_store_support[agent_class] = (
+                'blob_store' in parameters
+                or any(p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters.values())
+            )
+        return accepts
+    
+    async def _result_cache_key(
+        self,
+        agent: AgentInstance,
+        task: CollaborativeTask,
+        context_data: SharedContext
+    ) -> Tuple[Optional[str], Optional[float]]:
+        """
+        結果キャッシュのキーとTTL (キャッシュ対象外なら (None, None))
+        
+        タスクが使用する能力 (task_spec の capability) がキャッシュ可能な場合のみ対象とする。
+        使用する能力が指定されていない場合は、エージェントの全能力がキャッシュ可能な場合に限る。
+        ローカリティキーがパスの場合はその状態指紋をキーに含め、ファイル変更で別キーになるようにする
+        """
+        if self.result_cache is None:
+            return None, None
+        
+        if task.capability is not None:
+            used = [cap for cap in agent.capabilities if cap.name == task.capability]
+        else:
+            used = agent.capabilities
+        if not used or not all(cap.cacheable for cap in used):
+            return None, None
+        
+        ttls = [cap.cache_ttl for cap in used if cap.cache_ttl is not None]
+        fingerprint = None
+        if task.locality_key:
+            # パスでないキー (project_id など) は None になる。ディレクトリの指紋は短時間メモ化
+            fingerprint = await self.fingerprints.fingerprint(task.locality_key)
+        
+        key = make_cache_key(agent.agent_type.value, {
+            "task_name": task.name,
+            "task_description": task.description,
+            "context_data": context_data,
+            "locality": task.locality_key,
+            "locality_fingerprint": fingerprint
+        })
+        return key, (min(ttls) if ttls else None)
+    
+    def _record_latency(self, agent: AgentInstance, latency: float):
+        """実行レイテンシ記録 (エージェント別指標とタイプ別分布)"""
+        self.latency_tracker.record(agent.agent_type, latency)
+        
+        metrics = agent.performance_metrics
+        count = metrics.get('executions', 0.0) + 1
+        metrics['executions'] = count
+        metrics['last_latency'] = latency
+        metrics['avg_latency'] = metrics.get('avg_latency', 0.0) + (latency - metrics.get('avg_latency', 0.0)) / count
+        metrics['type_latency_p90'] = self.latency_tracker.percentile(agent.agent_type, 0.9)
+    
     async def _mock_agent_execution(self, agent: AgentInstance, task_content: Dict[str, Any]) -> Dict[str, Any]:
         """モックエージェント実行"""
         # デモ用の簡易実行
@@ -714,10 +1265,12 @@ class AgentCoordinator:
         successful_results = [r for r in agent_results.values() if r.get('success', False)]
         
         if successful_results:
-            # 出力データを統合
+            # 出力データを統合 (差分レイヤーを積み上げ、最後に1回だけ展開)
+            combined = SharedContext.empty()
             for result in successful_results:
                 if 'output' in result:
-                    integrated_result["combined_output"].update(result['output'])
+                    combined = combined.with_updates(result['output'])
+            integrated_result["combined_output"] = combined.to_dict()
             
             # 品質メトリクス計算
             success_rate = len(successful_results) / len(agent_results)
@@ -744,27 +1297,27 @@ class AgentCoordinator:
                 agent = self.agents[agent_id]
                 agent.status = AgentStatus.IDLE
                 agent.current_task = None
-                agent.last_activity = datetime.now(timezone.utc)
+                self._touch_agent(agent)
                 
-                self.logger.debug(f"Released agent: {agent_id}")
+                self.logger.debug("Released agent: %s", agent_id)
+        
+        # 解放されたエージェントで待機タスクを即座にディスパッチ
+        self.scheduler.notify()
+    
+    async def post_message(self, message: AgentMessage):
+        """コーディネーターへメッセージ投入 (バスが満杯なら待機)"""
+        await self.message_bus.put(message)
     
     async def _process_messages(self):
-        """メッセージ処理"""
+        """メッセージ処理 (優先順のバッチ単位)"""
         while not self._shutdown_event.is_set():
-            try:
-                # メッセージキューからメッセージを取得 (タイムアウト付き)
-                message = await asyncio.wait_for(
-                    self.message_queue.get(),
-                    timeout=1.0
-                )
-                
-                # メッセージ処理
-                await self._handle_message(message)
-                
-            except asyncio.TimeoutError:
-                continue
-            except Exception as e:
-                self.logger.error(f"Message processing error: {e}")
+            batch = await self.message_bus.get_batch(self.message_batch_size, timeout=1.0)
+            
+            for message in batch:
+                try:
+                    await self._handle_message(message)
+                except Exception as e:
+                    self.logger.error(f"Message processing error: {e}")
     
     async def _handle_message(self, message: AgentMessage):
         """メッセージ処理"""
@@ -795,7 +1348,7 @@ class AgentCoordinator:
             if 'resource_usage' in status_data:
                 agent.resource_usage.update(status_data['resource_usage'])
             
-            agent.last_activity = datetime.now(timezone.utc)
+            self._touch_agent(agent)
     
     async def _handle_performance_report(self, message: AgentMessage):
         """パフォーマンスレポート処理"""
@@ -817,63 +1370,129 @@ class AgentCoordinator:
         if agent_id in self.agents:
             self.agents[agent_id].status = AgentStatus.ERROR
     
+    def _touch_agent(self, agent: AgentInstance):
+        """エージェントの活動時刻更新とハートビート期限の再設定"""
+        agent.last_activity = datetime.now(timezone.utc)
+        
+        # 応答が期待されるのは作業中のエージェントのみ (アイドル状態は監視対象外)
+        if agent.status in (AgentStatus.BUSY, AgentStatus.WAITING):
+            self.heartbeat_index.touch(agent.id)
+        else:
+            self.heartbeat_index.discard(agent.id)
+    
     async def _heartbeat_monitor(self):
-        """ハートビート監視"""
+        """ハートビート監視 (期限切れエージェントのみ検査)"""
         while not self._shutdown_event.is_set():
             try:
-                current_time = datetime.now(timezone.utc)
-                timeout_threshold = current_time - timedelta(seconds=self.heartbeat_interval * 2)
-                
-                # タイムアウトエージェントをチェック
-                for agent in self.agents.values():
-                    if agent.last_activity < timeout_threshold and agent.status != AgentStatus.OFFLINE:
+                for agent_id in self.heartbeat_index.pop_expired():
+                    agent = self.agents.get(agent_id)
+                    if agent and agent.status not in (AgentStatus.OFFLINE, AgentStatus.IDLE):
                         self.logger.warning(f"Agent {agent.id} appears to be unresponsive")
                         agent.status = AgentStatus.ERROR
                 
-                await asyncio.sleep(self.heartbeat_interval)
+                # 次の期限まで待機 (最大 heartbeat_interval)
+                next_deadline = self.heartbeat_index.next_deadline()
+                delay = self.heartbeat_interval
+                if next_deadline is not None:
+                    delay = min(delay, max(0.0, next_deadline - time.monotonic()))
+                
+                await asyncio.sleep(delay)
                 
             except Exception as e:
                 self.logger.error(f"Heartbeat monitor error: {e}")
+                await asyncio.sleep(self.heartbeat_interval)
     
     async def _performance_monitor(self):
-        """パフォーマンス監視"""
+        """パフォーマンス監視 (ワーカープロセスのバッチサンプリング)"""
         while not self._shutdown_event.is_set():
             try:
-                # パフォーマンスメトリクス収集
-                for agent in self.agents.values():
-                    if agent.status == AgentStatus.BUSY:
-                        # CPU使用率等の更新 (実際の実装では外部モニタリングツールと連携)
-                        agent.resource_usage['cpu'] = agent.resource_usage.get('cpu', 0) + 0.1
+                samples = self.resource_sampler.sample()
+                
+                for agent_id, usage in samples.items():
+                    agent = self.agents.get(agent_id)
+                    if agent:
+                        agent.resource_usage.update(usage)
                 
-                await asyncio.sleep(60)  # 1分間隔
+                await asyncio.sleep(self.resource_sample_interval)
                 
             except Exception as e:
                 self.logger.error(f"Performance monitor error: {e}")
+                await asyncio.sleep(self.resource_sample_interval)
+    
+    async def _metrics_snapshot_writer(self):
+        """メトリクススナップショットの定期書き出し"""
+        while not self._shutdown_event.is_set():
+            try:
+                await asyncio.sleep(self.metrics_snapshot_interval)
+                self.metrics.write_snapshot()
+            except Exception as e:
+                self.logger.error(f"Metrics snapshot error: {e}")
     
     async def _task_scheduler(self):
-        """タスクスケジューラー"""
+        """タスクスケジューラー (イベント駆動)"""
         while not self._shutdown_event.is_set():
             try:
-                # 待機中のタスクをチェック
-                pending_tasks = [t for t in self.tasks.values() if t.status == "pending"]
+                # 投入・エージェント解放・スロット解放で起床 (取りこぼし対策としてタイムアウト付き)
+                try:
+                    await asyncio.wait_for(self.scheduler.wakeup.wait(), timeout=self.heartbeat_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self.scheduler.wakeup.clear()
                 
-                for task in pending_tasks:
-                    # リソースが利用可能かチェック
-                    if await self._can_execute_task(task):
-                        task.status = "ready"
-                        self.logger.info(f"Task {task.id} is ready for execution")
+                if self._shutdown_event.is_set():
+                    break
                 
-                await asyncio.sleep(10)  # 10秒間隔
+                self.scheduler.dispatch_ready()
                 
             except Exception as e:
                 self.logger.error(f"Task scheduler error: {e}")
     
-    async def _can_execute_task(self, task: CollaborativeTask) -> bool:
-        """タスク実行可能性チェック"""
-        # 必要なエージェントが利用可能かチェック
-        available_agents = [a for a in self.agents.values() if a.status == AgentStatus.IDLE]
+    async def _autoscaling_monitor(self):
+        """オートスケーリング監視"""
+        while not self._shutdown_event.is_set():
+            try:
+                for agent_type in list(self._agent_templates):
+                    decision = self.autoscaler.evaluate(agent_type.value, self._collect_pool_metrics(agent_type))
+                    if decision:
+                        await self._apply_scaling_decision(agent_type, decision)
+                
+                await asyncio.sleep(self.autoscaling_interval)
+                
+            except Exception as e:
+                self.logger.error(f"Autoscaling monitor error: {e}")
+                await asyncio.sleep(self.autoscaling_interval)
+    
+    def _collect_pool_metrics(self, agent_type: AgentType) -> PoolMetrics:
+        """タイプ別プールの観測値収集"""
+        pool = [
+            a for a in self.agents.values()
+            if a.agent_type == agent_type and a.status != AgentStatus.OFFLINE
+        ]
+        return PoolMetrics(
+            total_agents=len(pool),
+            busy_agents=len([a for a in pool if a.status == AgentStatus.BUSY]),
+            backlog=self.scheduler.queued_count(agent_type),
+            oldest_wait=self.scheduler.oldest_wait_time(agent_type)
+        )
+    
+    async def _apply_scaling_decision(self, agent_type: AgentType, decision: ScalingDecision):
+        """スケーリング判断の適用"""
+        self.logger.info(
+            f"Autoscaling {agent_type.value}: {decision.action} "
+            f"{decision.from_count} -> {decision.to_count} ({decision.reason})"
+        )
         
-        return len(available_agents) >= len(task.required_agents)
+        if decision.action == "scale_up":
+            for _ in range(decision.to_count - decision.from_count):
+                await self._spawn_agent(agent_type)
+        else:
+            # 最も長くアイドル状態のエージェントから削除
+            idle_agents = sorted(
+                (a for a in self.agents.values() if a.agent_type == agent_type and a.status == AgentStatus.IDLE),
+                key=lambda a: a.last_activity
+            )
+            for agent in idle_agents[:decision.from_count - decision.to_count]:
+                await self._retire_agent(agent.id)
     
     async def get_status(self) -> Dict[str, Any]:
         """エージェント協調システム状態取得"""
@@ -887,10 +1506,46 @@ class AgentCoordinator:
             "initialized": self.is_initialized,
             "total_agents": len(self.agents),
             "agent_status": agent_status_counts,
-            "active_tasks": len([t for t in self.tasks.values() if t.status in ["pending", "running"]]),
-            "completed_tasks": len([t for t in self.tasks.values() if t.status == "completed"]),
+            "active_tasks": self.task_status_counts.get("pending", 0) + self.task_status_counts.get("running", 0),
+            "completed_tasks": self.task_status_counts.get("completed", 0),
+            "failed_tasks": self.task_status_counts.get("failed", 0),
+            "tasks_in_memory": len(self.tasks),
+            "task_archive": self.task_archive.get_stats(),
             "communication_channels": len(self.communication_channels),
-            "message_queue_size": self.message_queue.qsize()
+            "message_queue_size": self.message_bus.qsize(),
+            "message_bus": self.message_bus.get_stats(),
+            "scheduler": self.scheduler.get_stats(),
+            "heartbeat": {
+                "timeout": self.heartbeat_timeout,
+                "tracked_agents": len(self.heartbeat_index)
+            },
+            "resource_sampling": self.resource_sampler.get_stats(),
+            "placement": {
+                **self.placement_policy.get_stats(),
+                "decisions": len(self.placement_log),
+                "reasons": dict(self.placement_log.reasons)
+            },
+            "instrumentation": {
+                "enabled": self.instrumentation_enabled,
+                "snapshot_path": str(self.metrics.snapshot_path) if self.metrics.snapshot_path else None,
+                **self.metrics.snapshot()
+            },
+            "result_cache": {
+                "enabled": self.result_cache is not None,
+                **(self.result_cache.get_stats() if self.result_cache else {})
+            },
+            "hedging": {
+                "enabled": self.hedging_policy.enabled,
+                **self.hedging_stats,
+                "latency": {
+                    agent_type.value: self.latency_tracker.summary(agent_type)
+                    for agent_type in self._agent_templates
+                }
+            },
+            "auto_scaling": {
+                "enabled": self.auto_scaling_enabled,
+                **self.autoscaler.get_status()
+            }
         }
     
     async def shutdown(self):
@@ -899,11 +1554,18 @@ class AgentCoordinator:
         
         # シャットダウンイベント設定
         self._shutdown_event.set()
+        self.scheduler.notify()
+        
+        # スケジュール待ちタスクのキャンセル
+        for entry in self.scheduler.drain():
+            self._set_task_status(self.tasks[entry.task_id], "cancelled")
+            if entry.future and not entry.future.done():
+                entry.future.cancel()
         
         # アクティブなタスクの保存
-        active_tasks = [t for t in self.tasks.values() if t.status in ["pending", "running"]]
+        active_tasks = self.task_status_counts.get("pending", 0) + self.task_status_counts.get("running", 0)
         if active_tasks:
-            self.logger.warning(f"Shutting down with {len(active_tasks)} active tasks")
+            self.logger.warning(f"Shutting down with {active_tasks} active tasks")
         
         # エージェントシャットダウン
         for agent in self.agents.values():
@@ -917,6 +1579,15 @@ class AgentCoordinator:
         if self._background_tasks:
             await asyncio.gather(*self._background_tasks, return_exceptions=True)
         
+        await self.task_archive.flush()
+        self.task_archive.close()
+        
+        if self.instrumentation_enabled:
+            try:
+                self.metrics.write_snapshot()
+            except Exception as e:
+                self.logger.error(f"Metrics snapshot error: {e}")
+        
         self.is_initialized = False
         self.logger.info("Agent Coordinator shutdown completed")
 
@@ -928,8 +1599,8 @@ class MockAgent:
         self.agent_id = agent_id
         self.agent_type = agent_type
     
-    async def execute_task(self, task_content: Dict[str, Any]) -> Dict[str, Any]:
-        """タスク実行"""
+    async def execute_task(self, task_content: Dict[str, Any], blob_store: Optional[BlobStore] = None) -> Dict[str, Any]:
+        """タスク実行 (context_data 内のブロブ参照は blob_store.resolve() で解決できる)"""
         await asyncio.sleep(0.5)  # 処理時間をシミュレート
         
         return {
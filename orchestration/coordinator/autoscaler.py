@@ -0,0 +1,208 @@
+"""
+Ultimate ShunsukeModel Ecosystem - Agent Pool Autoscaler
+エージェントプール自動スケーラー
+
+タイプ別のバックログ、待ち時間、エージェント利用率を監視し、
+ヒステリシスとクールダウンを伴ってエージェント数の増減を判断する
+"""
+
+import math
+import time
+from typing import Dict, Any, Optional
+from dataclasses import dataclass, field
+from collections import deque
+
+
+@dataclass
+class ScalingPolicy:
+    """スケーリングポリシー"""
+    min_agents: int = 1
+    max_agents: int = 4
+    scale_up_backlog_per_agent: float = 1.0  # エージェントあたり待機タスク数
+    scale_up_wait_seconds: float = 5.0  # 最古待機タスクの待ち時間
+    scale_up_utilization: float = 0.85
+    scale_down_utilization: float = 0.3
+    stable_evaluations: int = 2  # 判定を確定させる連続観測回数
+    cooldown_seconds: float = 60.0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], defaults: Optional['ScalingPolicy'] = None) -> 'ScalingPolicy':
+        """設定辞書からポリシー作成"""
+        base = defaults or cls()
+        values = {name: config.get(name, getattr(base, name)) for name in cls.__dataclass_fields__}
+        # エージェント設定の 'min' / 'max' も受け付ける
+        values['min_agents'] = config.get('min', values['min_agents'])
+        values['max_agents'] = config.get('max', values['max_agents'])
+        policy = cls(**values)
+        policy.max_agents = max(policy.max_agents, policy.min_agents)
+        return policy
+
+
+@dataclass
+class PoolMetrics:
+    """エージェントプールの観測値"""
+    total_agents: int
+    busy_agents: int
+    backlog: int
+    oldest_wait: float
+
+    @property
+    def utilization(self) -> float:
+        """利用率"""
+        return self.busy_agents / self.total_agents if self.total_agents else 1.0
+
+
+@dataclass
+class ScalingDecision:
+    """スケーリング判断"""
+    agent_type: str
+    action: str  # "scale_up" / "scale_down"
+    from_count: int
+    to_count: int
+    reason: str
+    metrics: Dict[str, float] = field(default_factory=dict)
+    timestamp: float = field(default_factory=time.time)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """辞書形式に変換"""
+        return {
+            "agent_type": self.agent_type,
+            "action": self.action,
+            "from_count": self.from_count,
+            "to_count": self.to_count,
+            "reason": self.reason,
+            "metrics": self.metrics,
+            "timestamp": self.timestamp
+        }
+
+
+class AgentAutoscaler:
+    """
+    エージェントプール自動スケーラー
+
+    主要機能:
+    1. バックログ / 待ち時間 / 利用率に基づくスケールアップ判定
+    2. 低利用率が継続した場合のスケールダウン判定
+    3. 連続観測によるヒステリシスとタイプ別クールダウン
+    4. 判断履歴の保持
+    """
+
+    def __init__(self, policies: Dict[str, ScalingPolicy], history_size: int = 50):
+        """初期化"""
+        self.policies = policies
+        self.history: deque = deque(maxlen=history_size)
+        self._pressure: Dict[str, int] = {}  # +N: 連続スケールアップ兆候, -N: 連続スケールダウン兆候
+        self._last_scaled: Dict[str, float] = {}
+        self.total_decisions = 0
+
+    def policy_for(self, agent_type: str) -> ScalingPolicy:
+        """タイプ別ポリシー取得"""
+        if agent_type not in self.policies:
+            self.policies[agent_type] = ScalingPolicy()
+        return self.policies[agent_type]
+
+    def evaluate(self, agent_type: str, metrics: PoolMetrics, now: Optional[float] = None) -> Optional[ScalingDecision]:
+        """プール状態を評価してスケーリング判断を返す"""
+        now = time.monotonic() if now is None else now
+        policy = self.policy_for(agent_type)
+        total = metrics.total_agents
+
+        # 最小/最大の範囲外は即時補正
+        if total < policy.min_agents:
+            return self._decide(agent_type, "scale_up", total, policy.min_agents, "below minimum pool size", metrics, now)
+        if total > policy.max_agents:
+            return self._decide(agent_type, "scale_down", total, policy.max_agents, "above maximum pool size", metrics, now)
+
+        signal = self._signal(policy, metrics)
+        pressure = self._pressure.get(agent_type, 0)
+        if signal > 0:
+            pressure = pressure + 1 if pressure > 0 else 1
+        elif signal < 0:
+            pressure = pressure - 1 if pressure < 0 else -1
+        else:
+            pressure = 0
+        self._pressure[agent_type] = pressure
+
+        if abs(pressure) < policy.stable_evaluations:
+            return None
+
+        # クールダウン中は判断しない
+        if now - self._last_scaled.get(agent_type, float('-inf')) < policy.cooldown_seconds:
+            return None
+
+        if pressure > 0 and total < policy.max_agents:
+            # バックログを捌ける台数まで一度に追加 (上限まで)
+            needed = math.ceil(metrics.backlog / max(policy.scale_up_backlog_per_agent, 1e-9))
+            idle = total - metrics.busy_agents
+            target = min(policy.max_agents, total + max(1, needed - idle))
+            return self._decide(agent_type, "scale_up", total, target, self._reason(policy, metrics), metrics, now)
+
+        if pressure < 0 and total > policy.min_agents:
+            return self._decide(agent_type, "scale_down", total, total - 1, "sustained low utilization", metrics, now)
+
+        return None
+
+    def _signal(self, policy: ScalingPolicy, metrics: PoolMetrics) -> int:
+        """+1: スケールアップ兆候, -1: スケールダウン兆候, 0: 安定"""
+        backlog_per_agent = metrics.backlog / metrics.total_agents if metrics.total_agents else float(metrics.backlog)
+
+        if metrics.backlog > 0 and (
+            backlog_per_agent >= policy.scale_up_backlog_per_agent
+            or metrics.oldest_wait >= policy.scale_up_wait_seconds
+            or metrics.utilization >= policy.scale_up_utilization
+        ):
+            return 1
+
+        if metrics.backlog == 0 and metrics.utilization <= policy.scale_down_utilization:
+            return -1
+
+        return 0
+
+    def _reason(self, policy: ScalingPolicy, metrics: PoolMetrics) -> str:
+        """スケールアップ理由"""
+        if metrics.oldest_wait >= policy.scale_up_wait_seconds:
+            return f"queue wait {metrics.oldest_wait:.1f}s exceeds {policy.scale_up_wait_seconds}s"
+        if metrics.utilization >= policy.scale_up_utilization:
+            return f"utilization {metrics.utilization:.0%} with {metrics.backlog} queued tasks"
+        return f"backlog of {metrics.backlog} tasks"
+
+    def _decide(
+        self,
+        agent_type: str,
+        action: str,
+        from_count: int,
+        to_count: int,
+        reason: str,
+        metrics: PoolMetrics,
+        now: float
+    ) -> ScalingDecision:
+        """判断を記録"""
+        self._pressure[agent_type] = 0
+        self._last_scaled[agent_type] = now
+
+        decision = ScalingDecision(
+            agent_type=agent_type,
+            action=action,
+            from_count=from_count,
+            to_count=to_count,
+            reason=reason,
+            metrics={
+                "backlog": metrics.backlog,
+                "oldest_wait": round(metrics.oldest_wait, 3),
+                "utilization": round(metrics.utilization, 3)
+            }
+        )
+        self.history.append(decision)
+        self.total_decisions += 1
+        return decision
+
+    def get_status(self) -> Dict[str, Any]:
+        """スケーラー状態取得"""
+        return {
+            "policies": {
+                agent_type: {"min_agents": p.min_agents, "max_agents": p.max_agents}
+                for agent_type, p in self.policies.items()
+            },
+            "recent_decisions": [d.to_dict() for d in list(self.history)[-10:]],
+            "total_decisions": self.total_decisions
+        }
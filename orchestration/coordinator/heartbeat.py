@@ -0,0 +1,155 @@
+"""
+Ultimate ShunsukeModel Ecosystem - Heartbeat Deadline Index
+ハートビート期限インデックスとリソースサンプラー
+
+エージェントのハートビート期限 (last_activity + timeout) を最小ヒープで管理し、
+期限切れが近いエージェントのみを検査する。リソース使用量は
+ワーカープロセスのPIDを1回のパスでまとめてサンプリングする
+"""
+
+import heapq
+import time
+import logging
+from typing import Dict, List, Any, Optional, Tuple
+
+try:
+    import psutil
+except ImportError:  # psutil はオプション依存
+    psutil = None
+
+
+class DeadlineIndex:
+    """
+    期限インデックス
+
+    touch() のたびに新しい期限をヒープへ積み、古いエントリは世代番号で
+    遅延無効化する。pop_expired() のコストは期限切れ件数に比例する
+    """
+
+    def __init__(self, timeout: float):
+        """初期化"""
+        self.timeout = timeout
+        self._heap: List[Tuple[float, int, str]] = []
+        self._generation: Dict[str, int] = {}
+        self._deadlines: Dict[str, float] = {}
+
+    def touch(self, key: str, now: Optional[float] = None):
+        """期限を更新 (now + timeout)"""
+        now = time.monotonic() if now is None else now
+        generation = self._generation.get(key, 0) + 1
+        self._generation[key] = generation
+        deadline = now + self.timeout
+        self._deadlines[key] = deadline
+        heapq.heappush(self._heap, (deadline, generation, key))
+
+        # 無効エントリが溜まり過ぎた場合はヒープを再構築
+        if len(self._heap) > 4 * max(len(self._deadlines), 16):
+            self._compact()
+
+    def discard(self, key: str):
+        """監視対象から外す"""
+        if key in self._deadlines:
+            del self._deadlines[key]
+            self._generation[key] = self._generation.get(key, 0) + 1
+
+    def pop_expired(self, now: Optional[float] = None) -> List[str]:
+        """期限切れのキーを取り出す"""
+        now = time.monotonic() if now is None else now
+        expired = []
+
+        while self._heap and self._heap[0][0] <= now:
+            _, generation, key = heapq.heappop(self._heap)
+            if self._generation.get(key) == generation and key in self._deadlines:
+                del self._deadlines[key]
+                expired.append(key)
+
+        return expired
+
+    def next_deadline(self) -> Optional[float]:
+        """最も近い有効期限"""
+        while self._heap:
+            _, generation, key = self._heap[0]
+            if self._generation.get(key) == generation and key in self._deadlines:
+                return self._heap[0][0]
+            heapq.heappop(self._heap)
+        return None
+
+    def _compact(self):
+        """無効エントリを除去してヒープ再構築"""
+        self._heap = [
+            (deadline, self._generation[key], key)
+            for key, deadline in self._deadlines.items()
+        ]
+        heapq.heapify(self._heap)
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+
+class ResourceSampler:
+    """
+    バッチ型リソースサンプラー
+
+    登録された PID を1パスでサンプリングし、agent_id ごとの
+    CPU使用率 / メモリ使用量を返す
+    """
+
+    def __init__(self):
+        """初期化"""
+        self.logger = logging.getLogger(__name__)
+        self._processes: Dict[str, Any] = {}
+        self.samples_taken = 0
+        self.last_sample_duration = 0.0
+
+    @property
+    def available(self) -> bool:
+        """psutil が利用可能か"""
+        return psutil is not None
+
+    def register(self, agent_id: str, pid: Optional[int]):
+        """エージェントのワーカーPID登録"""
+        if psutil is None or pid is None:
+            return
+        try:
+            process = psutil.Process(pid)
+            # 初回呼び出しは基準値の取得のみ (次回以降に有効な値が返る)
+            process.cpu_percent(None)
+            self._processes[agent_id] = process
+        except psutil.Error as e:
+            self.logger.warning(f"Cannot monitor pid {pid} for agent {agent_id}: {e}")
+
+    def unregister(self, agent_id: str):
+        """PID登録解除"""
+        self._processes.pop(agent_id, None)
+
+    def sample(self) -> Dict[str, Dict[str, float]]:
+        """全登録プロセスを1パスでサンプリング"""
+        if psutil is None:
+            return {}
+
+        started = time.perf_counter()
+        samples = {}
+        for agent_id, process in list(self._processes.items()):
+            try:
+                with process.oneshot():
+                    samples[agent_id] = {
+                        'cpu': process.cpu_percent(None),
+                        'memory_mb': process.memory_info().rss / (1024 * 1024),
+                        'threads': float(process.num_threads())
+                    }
+            except psutil.Error:
+                # 終了したプロセスは監視対象から外す
+                self._processes.pop(agent_id, None)
+
+        self.samples_taken += 1
+        self.last_sample_duration = time.perf_counter() - started
+        return samples
+
+    def get_stats(self) -> Dict[str, Any]:
+        """サンプラー統計取得"""
+        return {
+            "available": self.available,
+            "monitored_processes": len(self._processes),
+            "samples_taken": self.samples_taken,
+            "last_sample_duration": self.last_sample_duration
+        }
@@ -0,0 +1,101 @@
+"""
+Ultimate ShunsukeModel Ecosystem - Hedged Execution
+ストラグラー対策のヘッジ実行ポリシー
+
+エージェントタイプ別のレイテンシ分布を保持し、パーセンタイル閾値を
+超えたサブタスクを同タイプの別エージェントで投機的に再実行する判断材料を提供する
+"""
+
+import bisect
+import math
+from typing import Dict, List, Any, Optional
+from dataclasses import dataclass
+from collections import deque
+
+
+@dataclass
+class HedgingPolicy:
+    """ヘッジ実行ポリシー"""
+    enabled: bool = False
+    percentile: float = 0.9  # この分位点を超えたらヘッジを起動
+    min_samples: int = 20  # 閾値を信頼するのに必要な観測数
+    min_delay: float = 1.0  # 閾値の下限 (秒)
+    max_delay: Optional[float] = None  # 閾値の上限 (秒)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'HedgingPolicy':
+        """設定辞書からポリシー作成"""
+        return cls(**{name: config[name] for name in cls.__dataclass_fields__ if name in config})
+
+
+class LatencyTracker:
+    """
+    タイプ別レイテンシトラッカー
+
+    直近 window 件の実行時間を到着順 (退避用) とソート済み (分位点用) の両方で保持し、
+    パーセンタイルは再ソートせずに返す。キャンセルされた実行は経過時間を下限値として記録する
+    """
+
+    def __init__(self, window: int = 200):
+        """初期化"""
+        self.window = window
+        self._samples: Dict[Any, deque] = {}
+        self._sorted: Dict[Any, List[float]] = {}
+        self.censored: Dict[Any, int] = {}
+
+    def record(self, key: Any, latency: float):
+        """レイテンシ記録 (ソート済みリストへ挿入し、窓から外れた値を削除)"""
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque()
+            self._sorted[key] = []
+        ordered = self._sorted[key]
+
+        samples.append(latency)
+        bisect.insort(ordered, latency)
+        if len(samples) > self.window:
+            evicted = samples.popleft()
+            del ordered[bisect.bisect_left(ordered, evicted)]
+
+    def record_censored(self, key: Any, elapsed: float):
+        """
+        完了前にキャンセルされた実行の記録 (ヘッジの敗者)
+
+        実際のレイテンシは elapsed 以上のため下限値として分布に加える。
+        ストラグラーを除外すると分位点が下振れし、ヘッジが過剰に起動するのを防ぐ
+        """
+        self.record(key, elapsed)
+        self.censored[key] = self.censored.get(key, 0) + 1
+
+    def count(self, key: Any) -> int:
+        """観測数"""
+        return len(self._samples.get(key, ()))
+
+    def percentile(self, key: Any, q: float) -> Optional[float]:
+        """パーセンタイル (最近傍法)"""
+        ordered = self._sorted.get(key)
+        if not ordered:
+            return None
+        rank = max(0, min(len(ordered) - 1, math.ceil(q * len(ordered)) - 1))
+        return ordered[rank]
+
+    def hedge_delay(self, key: Any, policy: HedgingPolicy) -> Optional[float]:
+        """ヘッジ起動までの待ち時間 (観測不足ならNone)"""
+        if not policy.enabled or self.count(key) < policy.min_samples:
+            return None
+        delay = max(policy.min_delay, self.percentile(key, policy.percentile))
+        if policy.max_delay is not None:
+            delay = min(delay, policy.max_delay)
+        return delay
+
+    def summary(self, key: Any) -> Dict[str, float]:
+        """代表値"""
+        if not self.count(key):
+            return {}
+        return {
+            "samples": float(self.count(key)),
+            "censored": float(self.censored.get(key, 0)),
+            "p50": self.percentile(key, 0.5),
+            "p90": self.percentile(key, 0.9),
+            "p99": self.percentile(key, 0.99)
+        }
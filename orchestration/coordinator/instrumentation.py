@@ -0,0 +1,236 @@
+"""
+Ultimate ShunsukeModel Ecosystem - Coordinator Instrumentation
+コーディネーター計測基盤
+
+イベントループ遅延のサンプリング、協調戦略別のタスクレイテンシ分布、
+エージェント別の待ち時間 / 実行時間、低速コールバック検出を提供し、
+コンパクトなスナップショットとしてファイルへ書き出す
+"""
+
+import asyncio
+import bisect
+import json
+import logging
+import os
+import re
+import time
+from typing import Dict, Any, Optional
+from pathlib import Path
+from collections import deque
+from datetime import datetime, timezone
+
+
+# ヒストグラムのバケット上限 (秒, 対数スケール)
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0
+)
+
+
+class LatencyHistogram:
+    """
+    固定バケットのレイテンシヒストグラム
+
+    観測値を保持せずバケット件数のみを持つため、メモリ使用量は一定
+    """
+
+    __slots__ = ('bounds', 'counts', 'count', 'total', 'max')
+
+    def __init__(self, bounds=DEFAULT_BUCKETS):
+        """初期化"""
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # 末尾は上限超過
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        """観測値を記録"""
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, q: float) -> Optional[float]:
+        """パーセンタイル (該当バケットの上限で近似)"""
+        if not self.count:
+            return None
+        target = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            if cumulative >= target:
+                return min(self.bounds[index], self.max) if index < len(self.bounds) else self.max
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        """要約 (空バケットは省略)"""
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "mean": self.total / self.count,
+            "p50": self.percentile(0.5),
+            "p90": self.percentile(0.9),
+            "p99": self.percentile(0.99),
+            "max": self.max,
+            "buckets": {
+                (str(self.bounds[i]) if i < len(self.bounds) else "+inf"): c
+                for i, c in enumerate(self.counts) if c
+            }
+        }
+
+
+class _SlowCallbackHandler(logging.Handler):
+    """asyncio デバッグモードの低速コールバック警告を取り込むハンドラー"""
+
+    PATTERN = re.compile(r"Executing (?P<handle>.+) took (?P<duration>[0-9.]+) seconds")
+
+    def __init__(self, monitor: 'LoopMonitor'):
+        super().__init__(logging.WARNING)
+        self.monitor = monitor
+
+    def emit(self, record: logging.LogRecord):
+        match = self.PATTERN.search(record.getMessage())
+        if match:
+            self.monitor.record_slow_callback(float(match.group('duration')), match.group('handle')[:200])
+
+
+class LoopMonitor:
+    """
+    イベントループ遅延モニター
+
+    interval ごとにスリープし、予定時刻からの遅れをループ遅延として記録する。
+    遅延が slow_threshold を超えた場合は低速コールバックとして記録し、
+    asyncio デバッグモード有効時は原因となったハンドルも取り込む
+    """
+
+    def __init__(self, interval: float = 0.5, slow_threshold: float = 0.1, capture_asyncio_debug: bool = False):
+        """初期化"""
+        self.interval = interval
+        self.slow_threshold = slow_threshold
+        self.capture_asyncio_debug = capture_asyncio_debug
+        self.lag = LatencyHistogram()
+        self.last_lag = 0.0
+        self.slow_callbacks: deque = deque(maxlen=50)
+        self.slow_callback_count = 0
+        self._handler: Optional[_SlowCallbackHandler] = None
+
+    def record_slow_callback(self, duration: float, source: str):
+        """低速コールバックを記録"""
+        self.slow_callback_count += 1
+        self.slow_callbacks.append({
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "duration": round(duration, 4),
+            "source": source
+        })
+
+    def install(self, loop: asyncio.AbstractEventLoop):
+        """asyncio デバッグ出力の取り込み設定"""
+        if not self.capture_asyncio_debug:
+            return
+        loop.set_debug(True)
+        loop.slow_callback_duration = self.slow_threshold
+        self._handler = _SlowCallbackHandler(self)
+        logging.getLogger('asyncio').addHandler(self._handler)
+
+    def uninstall(self):
+        """取り込み設定の解除"""
+        if self._handler is not None:
+            logging.getLogger('asyncio').removeHandler(self._handler)
+            self._handler = None
+
+    async def run(self, stop_event: asyncio.Event):
+        """遅延サンプリングループ"""
+        self.install(asyncio.get_running_loop())
+        try:
+            while not stop_event.is_set():
+                expected = time.monotonic() + self.interval
+                await asyncio.sleep(self.interval)
+                lag = max(0.0, time.monotonic() - expected)
+                self.last_lag = lag
+                self.lag.observe(lag)
+                if lag >= self.slow_threshold and self._handler is None:
+                    self.record_slow_callback(lag, "event_loop_lag")
+        finally:
+            self.uninstall()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """要約"""
+        return {
+            "interval": self.interval,
+            "last_lag": self.last_lag,
+            "lag": self.lag.to_dict(),
+            "slow_callbacks": self.slow_callback_count,
+            "recent_slow_callbacks": list(self.slow_callbacks)[-10:]
+        }
+
+
+class CoordinatorMetrics:
+    """
+    コーディネーターメトリクス
+
+    主要機能:
+    1. 協調戦略別のタスクレイテンシ分布
+    2. エージェント別のキュー待ち時間 / 実行時間分布
+    3. ループ遅延モニターとの統合とスナップショット出力
+    """
+
+    def __init__(self, loop_monitor: Optional[LoopMonitor] = None, snapshot_path: Optional[Path] = None):
+        """初期化"""
+        self.loop_monitor = loop_monitor
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self.strategy_latency: Dict[str, LatencyHistogram] = {}
+        self.agent_queue_wait: Dict[str, LatencyHistogram] = {}
+        self.agent_execution: Dict[str, LatencyHistogram] = {}
+        self.snapshots_written = 0
+
+    @staticmethod
+    def _histogram(table: Dict[str, LatencyHistogram], key: str) -> LatencyHistogram:
+        histogram = table.get(key)
+        if histogram is None:
+            histogram = table[key] = LatencyHistogram()
+        return histogram
+
+    def observe_strategy(self, strategy: str, latency: float):
+        """協調戦略のタスクレイテンシを記録"""
+        self._histogram(self.strategy_latency, strategy).observe(latency)
+
+    def observe_agent(self, agent_id: str, queue_wait: float, execution: float):
+        """エージェントの待ち時間と実行時間を記録"""
+        self._histogram(self.agent_queue_wait, agent_id).observe(queue_wait)
+        self._histogram(self.agent_execution, agent_id).observe(execution)
+
+    def forget_agent(self, agent_id: str):
+        """削除されたエージェントのヒストグラムを破棄"""
+        self.agent_queue_wait.pop(agent_id, None)
+        self.agent_execution.pop(agent_id, None)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """メトリクススナップショット"""
+        return {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "event_loop": self.loop_monitor.to_dict() if self.loop_monitor else None,
+            "strategy_latency": {k: v.to_dict() for k, v in self.strategy_latency.items()},
+            "agents": {
+                agent_id: {
+                    "queue_wait": self.agent_queue_wait[agent_id].to_dict(),
+                    "execution": self.agent_execution[agent_id].to_dict()
+                }
+                for agent_id in self.agent_execution
+            }
+        }
+
+    def write_snapshot(self) -> Optional[Path]:
+        """スナップショットをファイルへ書き出す (一時ファイル経由で置換)"""
+        if self.snapshot_path is None:
+            return None
+
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.snapshot_path.with_suffix(self.snapshot_path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.snapshot(), f, separators=(',', ':'), default=str)
+        os.replace(tmp_path, self.snapshot_path)
+        self.snapshots_written += 1
+        return self.snapshot_path
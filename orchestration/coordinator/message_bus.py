@@ -0,0 +1,162 @@
+"""
+Ultimate ShunsukeModel Ecosystem - Coordinator Message Bus
+優先レーン付き有界メッセージバス
+
+エラー > ステータス > パフォーマンス の順に処理されるレーンを持ち、
+同一エージェントからの未処理ステータス更新は最新のものに集約する。
+レーンが満杯の場合、生産者は空きができるまで待機する (バックプレッシャー)
+"""
+
+import asyncio
+from typing import Dict, List, Any, Optional, Deque
+from collections import deque, OrderedDict
+
+
+# レーン定義 (先頭ほど優先)
+LANE_ERRORS = "errors"
+LANE_STATUS = "status"
+LANE_PERFORMANCE = "performance"
+LANES = (LANE_ERRORS, LANE_STATUS, LANE_PERFORMANCE)
+
+MESSAGE_LANES = {
+    "error_report": LANE_ERRORS,
+    "status_update": LANE_STATUS,
+    "performance_report": LANE_PERFORMANCE
+}
+
+
+class MessageBus:
+    """
+    有界マルチレーンメッセージバス
+
+    主要機能:
+    1. メッセージタイプ別の優先レーン (未知のタイプは最下位レーン)
+    2. レーンごとの容量上限と生産者へのバックプレッシャー
+    3. 同一送信者のステータス更新の集約
+    4. 優先順でのバッチ取り出し
+    """
+
+    def __init__(self, lane_capacity: Optional[Dict[str, int]] = None, default_capacity: int = 1000):
+        """初期化"""
+        lane_capacity = lane_capacity or {}
+        self.capacity = {lane: lane_capacity.get(lane, default_capacity) for lane in LANES}
+
+        self._lanes: Dict[str, Deque[Any]] = {
+            LANE_ERRORS: deque(),
+            LANE_PERFORMANCE: deque()
+        }
+        # ステータスレーンは sender -> 最新メッセージ (挿入順を保持)
+        self._status: "OrderedDict[str, Any]" = OrderedDict()
+
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Condition()
+
+        self.stats = {
+            'published': 0,
+            'delivered': 0,
+            'coalesced': 0,
+            'superseded': 0,
+            'producer_waits': 0,
+            'batches': 0
+        }
+
+    @staticmethod
+    def lane_of(message: Any) -> str:
+        """メッセージのレーン"""
+        return MESSAGE_LANES.get(message.message_type, LANE_PERFORMANCE)
+
+    def _lane_size(self, lane: str) -> int:
+        """レーン内の件数"""
+        return len(self._status) if lane == LANE_STATUS else len(self._lanes[lane])
+
+    def _is_full(self, message: Any, lane: str) -> bool:
+        """メッセージを受け入れる余地がないか"""
+        if lane == LANE_STATUS and message.sender in self._status:
+            # 集約されるため容量を消費しない
+            return False
+        return self._lane_size(lane) >= self.capacity[lane]
+
+    def try_put(self, message: Any) -> bool:
+        """待機せずに投入 (満杯なら False)"""
+        lane = self.lane_of(message)
+        if self._is_full(message, lane):
+            return False
+        self._enqueue(message, lane)
+        return True
+
+    async def put(self, message: Any):
+        """投入 (満杯なら空きができるまで待機)"""
+        lane = self.lane_of(message)
+        if not self._is_full(message, lane):
+            self._enqueue(message, lane)
+            return
+
+        self.stats['producer_waits'] += 1
+        async with self._not_full:
+            await self._not_full.wait_for(lambda: not self._is_full(message, lane))
+            self._enqueue(message, lane)
+
+    def _enqueue(self, message: Any, lane: str):
+        """レーンへ追加"""
+        if lane == LANE_STATUS:
+            previous = self._status.pop(message.sender, None)
+            if previous is not None:
+                # 未処理の更新とキー単位でマージし、最新のメッセージとして扱う
+                message.content = {**previous.content, **message.content}
+                self.stats['coalesced'] += 1
+            self._status[message.sender] = message
+        else:
+            if lane == LANE_ERRORS and self._status.pop(message.sender, None) is not None:
+                # エラーより前に送られたステータス更新はエラー処理後に適用すると古い状態に戻すため破棄
+                self.stats['superseded'] += 1
+            self._lanes[lane].append(message)
+
+        self.stats['published'] += 1
+        self._not_empty.set()
+
+    def _drain(self, max_batch: int) -> List[Any]:
+        """優先順に最大 max_batch 件を取り出す"""
+        batch = []
+        for lane in LANES:
+            while len(batch) < max_batch:
+                if lane == LANE_STATUS:
+                    if not self._status:
+                        break
+                    batch.append(self._status.popitem(last=False)[1])
+                else:
+                    queue = self._lanes[lane]
+                    if not queue:
+                        break
+                    batch.append(queue.popleft())
+
+        if not self.qsize():
+            self._not_empty.clear()
+        return batch
+
+    async def get_batch(self, max_batch: int = 64, timeout: Optional[float] = None) -> List[Any]:
+        """バッチ取得 (timeout 内にメッセージがなければ空リスト)"""
+        if not self.qsize():
+            try:
+                await asyncio.wait_for(self._not_empty.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                return []
+
+        batch = self._drain(max_batch)
+        if batch:
+            self.stats['delivered'] += len(batch)
+            self.stats['batches'] += 1
+            async with self._not_full:
+                self._not_full.notify_all()
+        return batch
+
+    def qsize(self) -> int:
+        """未処理メッセージ数"""
+        return sum(self._lane_size(lane) for lane in LANES)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """バス統計取得"""
+        return {
+            "pending": {lane: self._lane_size(lane) for lane in LANES},
+            "capacity": dict(self.capacity),
+            **self.stats
+        }
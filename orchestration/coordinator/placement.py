@@ -0,0 +1,196 @@
+"""
+Ultimate ShunsukeModel Ecosystem - Agent Placement Policies
+エージェント配置ポリシー
+
+同タイプのアイドルエージェント候補から実行エージェントを選ぶ戦略。
+ローカリティ考慮型は同じプロジェクト / パスを直近に扱ったエージェントを
+負荷の許容幅内で優先し、エージェント側のキャッシュを活かす
+"""
+
+import os
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List, Any, Optional, Tuple, Sequence
+from collections import OrderedDict, deque
+
+
+# タスク仕様からローカリティキーを探すフィールド (先頭優先)
+LOCALITY_FIELDS = ('project_path', 'target_path', 'path', 'project_id', 'project')
+
+
+def locality_key_of(spec: Optional[Dict[str, Any]]) -> Optional[str]:
+    """タスク仕様 / 要求からローカリティキーを抽出"""
+    if not isinstance(spec, dict):
+        return None
+
+    sources = [spec]
+    if isinstance(spec.get('requirements'), dict):
+        sources.append(spec['requirements'])
+
+    for source in sources:
+        for name in LOCALITY_FIELDS:
+            value = source.get(name)
+            if value:
+                value = str(value)
+                if name.endswith('path'):
+                    value = os.path.normpath(os.path.expanduser(value))
+                return value
+    return None
+
+
+def agent_load(agent: Any) -> float:
+    """エージェント負荷 (CPU使用率)"""
+    return agent.resource_usage.get('cpu', 0)
+
+
+class PlacementPolicy(ABC):
+    """
+    配置ポリシー抽象基底クラス
+
+    select() は候補と選択理由を返す。record() / forget() で
+    ポリシー固有の履歴を更新する
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def select(self, candidates: Sequence[Any], locality_key: Optional[str] = None) -> Tuple[Any, str]:
+        """候補からエージェントを選択"""
+
+    def record(self, agent_id: str, locality_key: Optional[str]):
+        """エージェントへの配置を記録"""
+
+    def forget(self, agent_id: str):
+        """エージェントの履歴を破棄"""
+
+    def get_stats(self) -> Dict[str, Any]:
+        """ポリシー統計取得"""
+        return {"policy": self.name}
+
+
+class LeastLoadedPlacement(PlacementPolicy):
+    """最小負荷配置"""
+
+    name = "least_loaded"
+
+    def select(self, candidates: Sequence[Any], locality_key: Optional[str] = None) -> Tuple[Any, str]:
+        """CPU使用率が最も低いエージェントを選択"""
+        return min(candidates, key=agent_load), "least_loaded"
+
+
+class LocalityAwarePlacement(PlacementPolicy):
+    """
+    ローカリティ考慮型配置
+
+    同じローカリティキーを直近に扱ったエージェントのうち、負荷が
+    最小負荷 + load_slack 以内のものを優先する。該当がなければ最小負荷配置
+    """
+
+    name = "locality"
+
+    def __init__(self, load_slack: float = 20.0, history_size: int = 32, locality_ttl: float = 1800.0):
+        """初期化"""
+        self.load_slack = load_slack
+        self.history_size = history_size
+        self.locality_ttl = locality_ttl
+
+        # agent_id -> OrderedDict(locality_key -> 最終使用時刻)
+        self._recent: Dict[str, "OrderedDict[str, float]"] = {}
+        self.stats = {'locality_hits': 0, 'locality_misses': 0, 'rejected_for_load': 0}
+
+    def _last_used(self, agent_id: str, locality_key: str, now: float) -> Optional[float]:
+        """エージェントが locality_key を最後に扱った時刻 (期限切れは None)"""
+        last_used = self._recent.get(agent_id, {}).get(locality_key)
+        if last_used is None or now - last_used > self.locality_ttl:
+            return None
+        return last_used
+
+    def select(self, candidates: Sequence[Any], locality_key: Optional[str] = None) -> Tuple[Any, str]:
+        """ローカリティ優先で選択"""
+        least_loaded = min(candidates, key=agent_load)
+        if locality_key is None:
+            return least_loaded, "least_loaded"
+
+        now = time.monotonic()
+        bound = agent_load(least_loaded) + self.load_slack
+        warm: List[Tuple[float, Any]] = []
+        overloaded = False
+
+        for agent in candidates:
+            last_used = self._last_used(agent.id, locality_key, now)
+            if last_used is None:
+                continue
+            if agent_load(agent) <= bound:
+                warm.append((last_used, agent))
+            else:
+                overloaded = True
+
+        if warm:
+            self.stats['locality_hits'] += 1
+            return max(warm, key=lambda item: item[0])[1], "locality"
+
+        if overloaded:
+            self.stats['rejected_for_load'] += 1
+            return least_loaded, "locality_rejected_for_load"
+
+        self.stats['locality_misses'] += 1
+        return least_loaded, "least_loaded"
+
+    def record(self, agent_id: str, locality_key: Optional[str]):
+        """エージェントが locality_key を扱ったことを記録"""
+        if locality_key is None:
+            return
+        recent = self._recent.setdefault(agent_id, OrderedDict())
+        recent[locality_key] = time.monotonic()
+        recent.move_to_end(locality_key)
+        while len(recent) > self.history_size:
+            recent.popitem(last=False)
+
+    def forget(self, agent_id: str):
+        """エージェントの履歴を破棄"""
+        self._recent.pop(agent_id, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """ポリシー統計取得"""
+        return {
+            "policy": self.name,
+            "load_slack": self.load_slack,
+            "tracked_agents": len(self._recent),
+            **self.stats
+        }
+
+
+PLACEMENT_POLICIES = {
+    LeastLoadedPlacement.name: LeastLoadedPlacement,
+    LocalityAwarePlacement.name: LocalityAwarePlacement
+}
+
+
+def create_placement_policy(config: Dict[str, Any]) -> PlacementPolicy:
+    """設定から配置ポリシー生成"""
+    options = dict(config)
+    name = options.pop('policy', LocalityAwarePlacement.name)
+    if name not in PLACEMENT_POLICIES:
+        raise ValueError(f"Unknown placement policy: {name}")
+    return PLACEMENT_POLICIES[name](**options)
+
+
+class PlacementLog:
+    """配置判断の履歴 (分析用リングバッファ)"""
+
+    def __init__(self, maxlen: int = 1000):
+        """初期化"""
+        self._entries: deque = deque(maxlen=maxlen)
+        self.reasons: Dict[str, int] = {}
+
+    def append(self, decision: Dict[str, Any]):
+        """判断を記録"""
+        self._entries.append(decision)
+        self.reasons[decision['reason']] = self.reasons.get(decision['reason'], 0) + 1
+
+    def recent(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """直近の判断"""
+        return list(self._entries)[-limit:]
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,318 @@
+"""
+Ultimate ShunsukeModel Ecosystem - Agent Result Cache
+エージェント実行結果キャッシュ
+
+(エージェントタイプ, 正規化したタスク内容とコンテキスト入力のハッシュ) をキーに
+成功結果を保持する。TTL と LRU 退避を持つメモリ層と、任意のディスク層で構成される。
+対象パスを持つタスクはパスの状態 (mtime / サイズ) の指紋をキーに含め、
+ファイル変更後に古い結果を返さないようにする
+"""
+
+import asyncio
+import json
+import os
+import time
+import hashlib
+import logging
+from typing import Dict, Any, Optional, Tuple
+from pathlib import Path
+from collections import OrderedDict
+
+
+# キャッシュキーから除外する揮発的なフィールド
+VOLATILE_FIELDS = frozenset({'task_id', 'priority', 'timestamp', 'created_at', 'updated_at'})
+
+
+def normalize_for_hash(value: Any) -> Any:
+    """ハッシュ用に値を正規化 (揮発フィールド除去・順序非依存化)"""
+    if hasattr(value, 'to_message_dict'):
+        value = value.to_message_dict()
+    if isinstance(value, dict) or (hasattr(value, 'items') and hasattr(value, 'keys')):
+        return {
+            str(k): normalize_for_hash(v)
+            for k, v in value.items()
+            if k not in VOLATILE_FIELDS
+        }
+    if isinstance(value, (list, tuple)):
+        return [normalize_for_hash(v) for v in value]
+    if isinstance(value, str):
+        return value.strip()
+    return value
+
+
+# パス指紋の計算で辿らないディレクトリ
+FINGERPRINT_SKIP_DIRS = frozenset({'.git', 'node_modules', '__pycache__', '.venv', '.mypy_cache'})
+
+
+def path_fingerprint(path: str) -> Optional[str]:
+    """
+    パスの状態指紋 (ファイルは mtime / サイズ、ディレクトリは配下全ファイルの集計)
+
+    ファイル内容は読まず stat のみで求める。パスが存在しない場合は None
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    if not os.path.isdir(path):
+        return f"f:{stat.st_mtime_ns}:{stat.st_size}"
+
+    digest = hashlib.sha256()
+    files = 0
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = sorted(os.scandir(current), key=lambda entry: entry.name)
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in FINGERPRINT_SKIP_DIRS:
+                        stack.append(entry.path)
+                    continue
+                entry_stat = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            digest.update(f"{entry.path}\0{entry_stat.st_mtime_ns}\0{entry_stat.st_size}\n".encode('utf-8', 'surrogateescape'))
+            files += 1
+    return f"d:{files}:{digest.hexdigest()[:16]}"
+
+
+class FingerprintMemo:
+    """
+    ディレクトリ指紋の短時間メモ化
+
+    同じディレクトリを対象とする送信が続く場合に配下の走査を繰り返さない。
+    ファイルの指紋は stat 1回で求まるためメモ化せず常に最新を使う
+    """
+
+    def __init__(self, ttl: float = 2.0, max_entries: int = 256):
+        """初期化"""
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Optional[str]]]" = OrderedDict()
+
+    async def fingerprint(self, path: str) -> Optional[str]:
+        """パス指紋取得 (走査はイベントループ外で行う)"""
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        value = await asyncio.get_running_loop().run_in_executor(None, path_fingerprint, path)
+        if value is not None and value.startswith('d:') and self.ttl > 0:
+            self._entries[path] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        else:
+            self._entries.pop(path, None)
+        return value
+
+
+def make_cache_key(agent_type: str, task_content: Dict[str, Any]) -> str:
+    """キャッシュキー生成"""
+    canonical = json.dumps(
+        normalize_for_hash(task_content),
+        sort_keys=True,
+        default=str,
+        ensure_ascii=False,
+        separators=(',', ':')
+    )
+    digest = hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+    return f"{agent_type}:{digest}"
+
+
+class AgentResultCache:
+    """
+    エージェント結果キャッシュ
+
+    主要機能:
+    1. TTL 付き LRU メモリキャッシュ
+    2. 任意のディスク層 (エントリごとの JSON ファイル, 非同期 API では executor で読み書き)
+    3. ヒット / ミス / 退避の統計
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        default_ttl: float = 600.0,
+        disk_dir: Optional[Path] = None
+    ):
+        """初期化"""
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.logger = logging.getLogger(__name__)
+
+        # key -> (expires_at (monotonic), value)
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+        self.stats = {
+            'hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'stores': 0,
+            'evictions': 0,
+            'expirations': 0
+        }
+
+        if self.disk_dir:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """キャッシュ取得 (ディスク層は同期読み込み)"""
+        value = self.get_memory(key)
+        if value is not None:
+            return value
+
+        value = self._disk_get(key)
+        if value is not None:
+            self.stats['disk_hits'] += 1
+            return value
+
+        self.stats['misses'] += 1
+        return None
+
+    def get_memory(self, key: str) -> Optional[Dict[str, Any]]:
+        """メモリ層のみから取得 (ミスは計上しない)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at > time.monotonic():
+            self._entries.move_to_end(key)
+            self.stats['hits'] += 1
+            return value
+        del self._entries[key]
+        self.stats['expirations'] += 1
+        return None
+
+    async def aget(self, key: str) -> Optional[Dict[str, Any]]:
+        """キャッシュ取得 (ディスク層は executor で読み込み、イベントループを塞がない)"""
+        value = self.get_memory(key)
+        if value is not None:
+            return value
+
+        if self.disk_dir:
+            record = await asyncio.get_running_loop().run_in_executor(None, self._disk_read, key)
+            value = self._promote(key, record)
+            if value is not None:
+                self.stats['disk_hits'] += 1
+                return value
+
+        self.stats['misses'] += 1
+        return None
+
+    async def aput(self, key: str, value: Dict[str, Any], ttl: Optional[float] = None):
+        """キャッシュ格納 (ディスク層は executor で書き込み)"""
+        ttl = self.default_ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+
+        self._memory_put(key, value, time.monotonic() + ttl)
+        self.stats['stores'] += 1
+
+        if self.disk_dir:
+            await asyncio.get_running_loop().run_in_executor(None, self._disk_put, key, value, ttl)
+
+    def put(self, key: str, value: Dict[str, Any], ttl: Optional[float] = None):
+        """キャッシュ格納"""
+        ttl = self.default_ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+
+        self._memory_put(key, value, time.monotonic() + ttl)
+        self.stats['stores'] += 1
+
+        if self.disk_dir:
+            self._disk_put(key, value, ttl)
+
+    def _memory_put(self, key: str, value: Dict[str, Any], expires_at: float):
+        """メモリ層へ格納 (LRU 退避)"""
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats['evictions'] += 1
+
+    def _disk_path(self, key: str) -> Path:
+        """ディスク層のファイルパス"""
+        digest = key.rpartition(':')[2]
+        return self.disk_dir / digest[:2] / f"{key.replace(':', '_')}.json"
+
+    def _disk_get(self, key: str) -> Optional[Dict[str, Any]]:
+        """ディスク層から取得 (ヒット時はメモリ層へ昇格)"""
+        if not self.disk_dir:
+            return None
+        return self._promote(key, self._disk_read(key))
+
+    def _disk_read(self, key: str) -> Optional[Tuple[float, Any]]:
+        """ディスク層の読み込み (executor スレッドからも呼ばれるためキャッシュ状態には触れない)
+
+        Returns:
+            (残り TTL, 値)。期限切れは残り TTL 0 以下で返し、ファイルは削除する
+        """
+        path = self._disk_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        remaining = record.get('expires_at', 0) - time.time()
+        if remaining <= 0:
+            path.unlink(missing_ok=True)
+            return remaining, None
+        return remaining, record['value']
+
+    def _promote(self, key: str, record: Optional[Tuple[float, Any]]) -> Optional[Dict[str, Any]]:
+        """ディスク層の読み込み結果をメモリ層へ昇格"""
+        if record is None:
+            return None
+        remaining, value = record
+        if remaining <= 0:
+            self.stats['expirations'] += 1
+            return None
+        self._memory_put(key, value, time.monotonic() + remaining)
+        return value
+
+    def _disk_put(self, key: str, value: Dict[str, Any], ttl: float):
+        """ディスク層へ格納"""
+        path = self._disk_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'expires_at': time.time() + ttl, 'value': value}, f, default=str, ensure_ascii=False)
+            tmp_path.replace(path)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning(f"Failed to persist cache entry {key}: {e}")
+
+    def invalidate(self, agent_type: Optional[str] = None):
+        """キャッシュ無効化 (agent_type 指定時はそのタイプのみ)"""
+        if agent_type is None:
+            self._entries.clear()
+        else:
+            prefix = f"{agent_type}:"
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+
+        if self.disk_dir:
+            pattern = f"{agent_type}_*.json" if agent_type else "*.json"
+            for path in self.disk_dir.glob(f"*/{pattern}"):
+                path.unlink(missing_ok=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """キャッシュ統計取得"""
+        lookups = self.stats['hits'] + self.stats['disk_hits'] + self.stats['misses']
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "disk_tier": str(self.disk_dir) if self.disk_dir else None,
+            "hit_rate": (self.stats['hits'] + self.stats['disk_hits']) / lookups if lookups else 0.0,
+            **self.stats
+        }
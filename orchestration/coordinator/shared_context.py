@@ -0,0 +1,192 @@
+"""
+Ultimate ShunsukeModel Ecosystem - Shared Context
+構造共有型の不変コンテキスト
+
+パイプライン / 階層実行でステージ間に受け渡すコンテキストを
+レイヤー構造の永続マップとして表現し、大きな出力はコンテンツアドレス型
+ブロブストアに格納して参照で共有する
+"""
+
+import hashlib
+from typing import Dict, Any, Optional, Iterator, Mapping, Tuple
+from collections.abc import Mapping as MappingABC
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class BlobRef:
+    """ブロブ参照"""
+    digest: str
+    size: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        """辞書形式に変換"""
+        return {"$blob": self.digest, "size": self.size}
+
+
+class BlobStore:
+    """
+    コンテンツアドレス型ブロブストア
+
+    同一内容の大きな出力は1度だけ保持され、コンテキストやメッセージからは
+    BlobRef で参照される。協調タスク単位で生成し、タスク終了とともに破棄する
+    """
+
+    def __init__(self, inline_threshold: int = 64 * 1024):
+        """初期化"""
+        self.inline_threshold = inline_threshold
+        self._blobs: Dict[str, Any] = {}
+        self.stats = {'stored': 0, 'deduplicated': 0, 'bytes_stored': 0}
+
+    def should_store(self, value: Any) -> bool:
+        """ブロブ化対象か判定 (サイズを安価に求められる文字列/バイト列のみ)"""
+        return isinstance(value, (str, bytes)) and len(value) >= self.inline_threshold
+
+    def put(self, value: Any) -> BlobRef:
+        """ブロブ格納"""
+        raw = value.encode('utf-8') if isinstance(value, str) else value
+        digest = hashlib.sha256(raw).hexdigest()
+
+        if digest in self._blobs:
+            self.stats['deduplicated'] += 1
+        else:
+            self._blobs[digest] = value
+            self.stats['stored'] += 1
+            self.stats['bytes_stored'] += len(raw)
+
+        return BlobRef(digest=digest, size=len(raw))
+
+    def get(self, ref: BlobRef) -> Any:
+        """ブロブ取得"""
+        return self._blobs[ref.digest]
+
+    def resolve(self, value: Any) -> Any:
+        """ブロブ参照 (BlobRef またはメッセージ用の {"$blob": digest} 辞書) を解決、それ以外はそのまま返す"""
+        if isinstance(value, BlobRef):
+            return self._blobs[value.digest]
+        if isinstance(value, dict) and "$blob" in value:
+            return self._blobs[value["$blob"]]
+        return value
+
+    def get_stats(self) -> Dict[str, Any]:
+        """統計取得"""
+        return {"blobs": len(self._blobs), **self.stats}
+
+
+class SharedContext(MappingABC):
+    """
+    不変・構造共有コンテキスト
+
+    with_updates() は既存レイヤーを共有したまま差分レイヤーを1枚追加するため、
+    ステージごとのコストは追加キー数に比例する。レイヤーが深くなった場合のみ
+    参照のコピーで平坦化する
+    """
+
+    __slots__ = ('_layer', '_parent', '_depth', '_blob_store', '_length')
+
+    MAX_DEPTH = 16
+
+    def __init__(
+        self,
+        layer: Optional[Dict[str, Any]] = None,
+        parent: Optional['SharedContext'] = None,
+        blob_store: Optional[BlobStore] = None
+    ):
+        """初期化"""
+        self._layer: Dict[str, Any] = layer or {}
+        self._parent = parent
+        self._depth = (parent._depth + 1) if parent is not None else 0
+        self._blob_store = blob_store if blob_store is not None else (parent._blob_store if parent is not None else None)
+        self._length: Optional[int] = None
+
+    @classmethod
+    def empty(cls, blob_store: Optional[BlobStore] = None) -> 'SharedContext':
+        """空のコンテキスト"""
+        return cls(blob_store=blob_store)
+
+    def with_updates(self, updates: Optional[Mapping[str, Any]]) -> 'SharedContext':
+        """差分を適用した新しいコンテキストを返す (自身は変更しない)"""
+        if not updates:
+            return self
+
+        layer = {}
+        for key, value in updates.items():
+            if self._blob_store is not None and self._blob_store.should_store(value):
+                value = self._blob_store.put(value)
+            layer[key] = value
+
+        if self._depth + 1 >= self.MAX_DEPTH:
+            # レイヤーが深くなり過ぎた場合は参照を平坦化 (値自体はコピーしない)
+            flattened = dict(self._raw_items())
+            flattened.update(layer)
+            return SharedContext(flattened, blob_store=self._blob_store)
+
+        return SharedContext(layer, parent=self)
+
+    def _lookup_raw(self, key: str) -> Tuple[bool, Any]:
+        """ブロブ参照を解決せずに検索"""
+        node: Optional[SharedContext] = self
+        while node is not None:
+            if key in node._layer:
+                return True, node._layer[key]
+            node = node._parent
+        return False, None
+
+    def _resolve(self, value: Any) -> Any:
+        """ブロブ参照の解決"""
+        if isinstance(value, BlobRef) and self._blob_store is not None:
+            return self._blob_store.get(value)
+        return value
+
+    def __getitem__(self, key: str) -> Any:
+        found, value = self._lookup_raw(key)
+        if not found:
+            raise KeyError(key)
+        return self._resolve(value)
+
+    def __contains__(self, key: object) -> bool:
+        return self._lookup_raw(key)[0]
+
+    def _raw_items(self) -> Iterator[Tuple[str, Any]]:
+        """全キーと未解決の値を走査 (新しいレイヤー優先)"""
+        seen = set()
+        node: Optional[SharedContext] = self
+        while node is not None:
+            for key, value in node._layer.items():
+                if key not in seen:
+                    seen.add(key)
+                    yield key, value
+            node = node._parent
+
+    def __iter__(self) -> Iterator[str]:
+        for key, _ in self._raw_items():
+            yield key
+
+    def __len__(self) -> int:
+        if self._length is None:
+            self._length = sum(1 for _ in self._raw_items())
+        return self._length
+
+    def __repr__(self) -> str:
+        return f"SharedContext(keys={len(self)}, depth={self._depth})"
+
+    @property
+    def depth(self) -> int:
+        """レイヤー深さ"""
+        return self._depth
+
+    @property
+    def blob_store(self) -> Optional[BlobStore]:
+        """ブロブ参照の解決に使うストア"""
+        return self._blob_store
+
+    def to_dict(self) -> Dict[str, Any]:
+        """通常の辞書に展開 (ブロブ参照は解決)"""
+        return {key: self._resolve(value) for key, value in self._raw_items()}
+
+    def to_message_dict(self) -> Dict[str, Any]:
+        """メッセージ用辞書 (大きな値はブロブ参照のまま)"""
+        return {
+            key: value.to_dict() if isinstance(value, BlobRef) else value
+            for key, value in self._raw_items()
+        }
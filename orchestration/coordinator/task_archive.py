@@ -0,0 +1,297 @@
+"""
+Ultimate ShunsukeModel Ecosystem - Task Archive
+完了タスクのアーカイブストア
+
+完了した協調タスクを追記専用の JSONL セグメントへ退避し、
+セグメント別インデックスによって ID から再取得できるようにする。
+追記はメモリ上でオフセットを確定させてバッファし、イベントループ実行中は
+一定間隔ごとに executor スレッドでまとめて書き込む
+"""
+
+import asyncio
+import json
+import logging
+from typing import Dict, List, Any, Optional, Tuple, Iterator
+from pathlib import Path
+
+
+class TaskArchive:
+    """
+    追記専用 JSONL セグメントストア
+
+    主要機能:
+    1. 完了タスクレコードのセグメントファイルへの追記
+    2. サイズ上限によるセグメントローテーションと古いセグメントの削除
+    3. セグメントごとのインデックスファイル (task_id -> オフセット)
+    4. task_id によるランダムアクセス (書き込み待ちレコードはメモリから返す)
+    5. executor スレッドでのバッチ書き込み
+    """
+
+    SEGMENT_PREFIX = "segment-"
+
+    def __init__(
+        self,
+        archive_dir: Path,
+        segment_max_bytes: int = 8 * 1024 * 1024,
+        max_segments: int = 32,
+        flush_interval: float = 0.05
+    ):
+        """初期化"""
+        self.archive_dir = Path(archive_dir)
+        self.segment_max_bytes = segment_max_bytes
+        self.max_segments = max_segments
+        self.flush_interval = flush_interval
+        self.logger = logging.getLogger(__name__)
+
+        # task_id -> (segment番号, バイトオフセット)
+        self._index: Dict[str, Tuple[int, int]] = {}
+        self._segments: List[int] = []
+        self._data_file = None
+        self._index_file = None
+        self._file_segment: Optional[int] = None
+        self._current_size = 0
+        self.records_written = 0
+
+        # 書き込み待ち: (segment, offset, task_id, line) と task_id -> line、削除待ちセグメント
+        self._buffer: List[Tuple[int, int, str, bytes]] = []
+        self._pending: Dict[str, bytes] = {}
+        self._dropped: List[int] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self.batches_written = 0
+
+    def open(self):
+        """アーカイブを開き、既存インデックスを読み込む"""
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+
+        self._segments = sorted(
+            int(path.stem[len(self.SEGMENT_PREFIX):])
+            for path in self.archive_dir.glob(f"{self.SEGMENT_PREFIX}*.jsonl")
+        )
+
+        for segment in self._segments:
+            index_path = self._index_path(segment)
+            if not index_path.exists():
+                self._rebuild_segment_index(segment)
+                continue
+            with open(index_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    task_id, _, offset = line.rstrip('\n').rpartition('\t')
+                    if task_id:
+                        self._index[task_id] = (segment, int(offset))
+
+        if not self._segments:
+            self._segments.append(1)
+
+        # 保持セグメント数を超えた古いセグメントを削除
+        while len(self._segments) > self.max_segments:
+            segment = self._segments.pop(0)
+            self._index = {task_id: loc for task_id, loc in self._index.items() if loc[0] != segment}
+            self._drop_segment_files(segment)
+        segment = self._segments[-1]
+        path = self._segment_path(segment)
+        self._current_size = path.stat().st_size if path.exists() else 0
+        self._open_files(segment)
+        self.logger.info(f"Task archive opened: {len(self._index)} records in {len(self._segments)} segments")
+
+    def _segment_path(self, segment: int) -> Path:
+        """セグメントファイルパス"""
+        return self.archive_dir / f"{self.SEGMENT_PREFIX}{segment:06d}.jsonl"
+
+    def _index_path(self, segment: int) -> Path:
+        """インデックスファイルパス"""
+        return self.archive_dir / f"{self.SEGMENT_PREFIX}{segment:06d}.idx"
+
+    def _rebuild_segment_index(self, segment: int):
+        """インデックスファイルが失われたセグメントを再走査"""
+        offset = 0
+        with open(self._segment_path(segment), 'rb') as data, open(self._index_path(segment), 'w', encoding='utf-8') as index:
+            for raw in data:
+                try:
+                    task_id = json.loads(raw)['id']
+                except (ValueError, KeyError):
+                    offset += len(raw)
+                    continue
+                self._index[task_id] = (segment, offset)
+                index.write(f"{task_id}\t{offset}\n")
+                offset += len(raw)
+
+    def _open_files(self, segment: int):
+        """書き込み用セグメントファイルを開く"""
+        self._close_files()
+        self._data_file = open(self._segment_path(segment), 'ab')
+        self._index_file = open(self._index_path(segment), 'a', encoding='utf-8')
+        self._file_segment = segment
+
+    def _start_segment(self):
+        """新しいセグメントへ切り替え (ファイル操作は書き込み時に行う)"""
+        self._segments.append(self._segments[-1] + 1)
+        self._current_size = 0
+
+        # 保持セグメント数を超えた古いセグメントを削除
+        while len(self._segments) > self.max_segments:
+            segment = self._segments.pop(0)
+            self._index = {task_id: loc for task_id, loc in self._index.items() if loc[0] != segment}
+            self._dropped.append(segment)
+
+    def _drop_segment_files(self, segment: int):
+        """セグメントファイル削除"""
+        self._segment_path(segment).unlink(missing_ok=True)
+        self._index_path(segment).unlink(missing_ok=True)
+        self.logger.info(f"Dropped archive segment {segment}")
+
+    def append(self, record: Dict[str, Any]):
+        """
+        タスクレコード追記
+
+        レコードは呼び出し時点でシリアライズし、ファイルへの書き込みは
+        イベントループ実行中なら flush_interval 後にまとめて executor で行う
+        """
+        if self._data_file is None and not self._segments:
+            self.open()
+
+        line = (json.dumps(record, default=str, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+
+        if self._current_size and self._current_size + len(line) > self.segment_max_bytes:
+            self._start_segment()
+
+        segment, offset = self._segments[-1], self._current_size
+        self._current_size += len(line)
+        self._index[record['id']] = (segment, offset)
+        self._pending[record['id']] = line
+        self._buffer.append((segment, offset, record['id'], line))
+        self.records_written += 1
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # イベントループ外では同期で書き込む
+            self._write_now()
+            return
+        if self._flush_handle is None and self._flush_task is None:
+            self._flush_handle = loop.call_later(self.flush_interval, self._start_flush)
+
+    def _start_flush(self):
+        """遅延フラッシュの開始"""
+        self._flush_handle = None
+        if self._flush_task is None:
+            self._flush_task = asyncio.ensure_future(self.flush())
+
+    def _take_batch(self) -> Tuple[List[Tuple[int, int, str, bytes]], List[int]]:
+        """書き込み待ちレコードと削除待ちセグメントを取り出す"""
+        batch, self._buffer = self._buffer, []
+        dropped, self._dropped = self._dropped, []
+        return batch, dropped
+
+    def _write_batch(self, work: Tuple[List[Tuple[int, int, str, bytes]], List[int]]):
+        """バッチ書き込み (executor スレッドで実行, ループ側の状態には触れない)"""
+        batch, dropped = work
+        for segment, offset, task_id, line in batch:
+            if segment != self._file_segment:
+                self._open_files(segment)
+            self._data_file.write(line)
+            self._index_file.write(f"{task_id}\t{offset}\n")
+        if batch:
+            self._data_file.flush()
+            self._index_file.flush()
+        for segment in dropped:
+            self._drop_segment_files(segment)
+        self.batches_written += 1
+
+    def _write_now(self):
+        """書き込み待ちレコードを同期で書き込む"""
+        work = self._take_batch()
+        self._write_batch(work)
+        self._release_pending(work[0])
+
+    def _release_pending(self, batch: List[Tuple[int, int, str, bytes]]):
+        """書き込み済みレコードをメモリから外す (同じ ID で再追記されたものは残す)"""
+        for _, _, task_id, line in batch:
+            if self._pending.get(task_id) is line:
+                del self._pending[task_id]
+
+    async def flush(self):
+        """書き込み待ちレコードを executor でまとめて書き込む"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        current = asyncio.current_task()
+        if self._flush_task is not None and self._flush_task is not current:
+            # 実行中の書き込みを待ってから残りを書く (書き込みは常に1本)
+            await asyncio.shield(self._flush_task)
+        self._flush_task = current
+        try:
+            while self._buffer or self._dropped:
+                work = self._take_batch()
+                await asyncio.get_running_loop().run_in_executor(None, self._write_batch, work)
+                self._release_pending(work[0])
+        except OSError as e:
+            # 書き込めなかったレコードは get() 用にメモリへ残る
+            self.logger.error(f"Task archive write failed: {e}")
+        finally:
+            self._flush_task = None
+            if self._buffer and self._flush_handle is None:
+                self._flush_handle = asyncio.get_running_loop().call_later(self.flush_interval, self._start_flush)
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """task_id でレコード取得"""
+        pending = self._pending.get(task_id)
+        if pending is not None:
+            return json.loads(pending)
+
+        location = self._index.get(task_id)
+        if location is None:
+            return None
+
+        segment, offset = location
+        with open(self._segment_path(segment), 'rb') as f:
+            f.seek(offset)
+            return json.loads(f.readline())
+
+    def __contains__(self, task_id: str) -> bool:
+        return task_id in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """全レコードを古い順に走査"""
+        for segment in list(self._segments):
+            path = self._segment_path(segment)
+            if not path.exists():
+                continue
+            with open(path, 'rb') as f:
+                for raw in f:
+                    if raw.strip():
+                        yield json.loads(raw)
+
+    def _close_files(self):
+        """ファイルハンドルを閉じる"""
+        for handle in (self._data_file, self._index_file):
+            if handle is not None:
+                handle.close()
+        self._data_file = None
+        self._index_file = None
+        self._file_segment = None
+
+    def close(self):
+        """アーカイブを閉じる (書き込み中のバッチがある場合は事前に flush() を await すること)"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._buffer or self._dropped:
+            self._write_now()
+        self._close_files()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """アーカイブ統計取得"""
+        return {
+            "archive_dir": str(self.archive_dir),
+            "archived_records": len(self._index),
+            "segments": len(self._segments),
+            "current_segment_bytes": self._current_size,
+            "records_written": self.records_written,
+            "pending_records": len(self._buffer),
+            "batches_written": self.batches_written
+        }
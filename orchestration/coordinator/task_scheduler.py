@@ -0,0 +1,309 @@
+"""
+Ultimate ShunsukeModel Ecosystem - Work-Stealing Task Scheduler
+ワークスティーリング型タスクスケジューラー
+
+エージェントタイプ別の優先度付きレディキュー、エージェント解放時の
+イベント駆動ディスパッチ、同時実行数制御、同一タイプ間のワークスティーリングを提供
+"""
+
+import asyncio
+import heapq
+import time
+from typing import Dict, List, Any, Optional, Callable, Tuple, Deque
+from dataclasses import dataclass, field
+from collections import deque
+
+
+@dataclass
+class ScheduledTask:
+    """スケジュール待ちタスク"""
+    task_id: str
+    agent_types: List[Any]  # 必要なエージェントタイプ (先頭がホームキューのタイプ)
+    task_spec: Dict[str, Any]
+    priority: int = 3  # TaskPriority.value (小さいほど高優先)
+    sequence: int = 0
+    enqueued_at: float = field(default_factory=time.monotonic)
+    future: Optional[asyncio.Future] = None
+    home_agent: Optional[str] = None
+
+    @property
+    def sort_key(self) -> Tuple[int, int]:
+        """ヒープ順序キー"""
+        return (self.priority, self.sequence)
+
+
+class WorkStealingScheduler:
+    """
+    ワークスティーリングスケジューラー
+
+    主要機能:
+    1. エージェントごとのローカル優先度キュー (タイプ単位で集約)
+    2. 空きエージェントによる同一タイプ兄弟キューからのスティール
+    3. max_concurrent_tasks による同時実行数の上限制御
+    4. submit / 解放通知によるイベント駆動ウェイクアップ
+    """
+
+    def __init__(
+        self,
+        max_concurrent_tasks: int,
+        is_agent_available: Callable[[str], bool],
+        launch: Callable[[ScheduledTask, List[str]], None]
+    ):
+        """初期化"""
+        self.max_concurrent_tasks = max(1, max_concurrent_tasks)
+        self._is_agent_available = is_agent_available
+        self._launch = launch
+
+        # agent_type -> agent_id -> ローカルヒープ [(priority, sequence, ScheduledTask)]
+        self._queues: Dict[Any, Dict[str, List[Tuple[int, int, ScheduledTask]]]] = {}
+        self._agent_types: Dict[str, Any] = {}
+
+        self._sequence = 0
+        self.running = 0
+        self._slot_waiters: Deque[asyncio.Future] = deque()
+        self.wakeup = asyncio.Event()
+
+        # 統計情報
+        self.stats = {
+            'submitted': 0,
+            'dispatched': 0,
+            'steals': 0,
+            'total_wait_time': 0.0,
+            'max_wait_time': 0.0
+        }
+
+    # ------------------------------------------------------------------
+    # エージェント登録
+    # ------------------------------------------------------------------
+
+    def register_agent(self, agent_id: str, agent_type: Any):
+        """エージェント登録"""
+        self._agent_types[agent_id] = agent_type
+        self._queues.setdefault(agent_type, {}).setdefault(agent_id, [])
+        self.notify()
+
+    def unregister_agent(self, agent_id: str) -> List[ScheduledTask]:
+        """エージェント登録解除 (ローカルキューは兄弟エージェントへ再配置)"""
+        agent_type = self._agent_types.pop(agent_id, None)
+        if agent_type is None:
+            return []
+
+        orphaned = [entry for _, _, entry in self._queues[agent_type].pop(agent_id, [])]
+        for entry in orphaned:
+            entry.home_agent = None
+            self._enqueue(entry)
+
+        self.notify()
+        return orphaned
+
+    def agents_of_type(self, agent_type: Any) -> List[str]:
+        """タイプ別登録エージェントID一覧"""
+        return list(self._queues.get(agent_type, {}).keys())
+
+    # ------------------------------------------------------------------
+    # 投入とウェイクアップ
+    # ------------------------------------------------------------------
+
+    def submit(self, entry: ScheduledTask):
+        """タスク投入"""
+        if not entry.agent_types:
+            raise ValueError(f"Scheduled task {entry.task_id} requires at least one agent type")
+
+        self._sequence += 1
+        entry.sequence = self._sequence
+        entry.enqueued_at = time.monotonic()
+        self._enqueue(entry)
+
+        self.stats['submitted'] += 1
+        self.notify()
+
+    def _enqueue(self, entry: ScheduledTask):
+        """ホームエージェントのローカルキューに追加"""
+        agent_type = entry.agent_types[0]
+        agent_queues = self._queues.setdefault(agent_type, {})
+
+        if entry.home_agent not in agent_queues:
+            if agent_queues:
+                # 最も短いキューを持つエージェントをホームにする (空きエージェント優先)
+                entry.home_agent = min(
+                    agent_queues,
+                    key=lambda a: (len(agent_queues[a]), not self._is_agent_available(a))
+                )
+            else:
+                # エージェント未登録のタイプはオーバーフローキューで待機
+                entry.home_agent = f"__{getattr(agent_type, 'value', agent_type)}_overflow"
+                agent_queues.setdefault(entry.home_agent, [])
+
+        heapq.heappush(agent_queues[entry.home_agent], (entry.priority, entry.sequence, entry))
+
+    def notify(self):
+        """スケジューラーを起こす"""
+        self.wakeup.set()
+
+    # ------------------------------------------------------------------
+    # 同時実行スロット
+    # ------------------------------------------------------------------
+
+    async def acquire_slot(self):
+        """実行スロット取得 (上限到達時は解放まで待機)"""
+        if self.running < self.max_concurrent_tasks and not self._slot_waiters:
+            self.running += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._slot_waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # 譲渡済みスロットを返却
+                self.release_slot()
+            else:
+                self._slot_waiters.remove(waiter)
+            raise
+
+    def release_slot(self):
+        """実行スロット解放"""
+        # 直接実行の待機者 (既にエージェントを保持している) へ優先的に譲渡
+        while self._slot_waiters:
+            waiter = self._slot_waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+        self.running = max(0, self.running - 1)
+        self.notify()
+
+    # ------------------------------------------------------------------
+    # ディスパッチ
+    # ------------------------------------------------------------------
+
+    def dispatch_ready(self) -> int:
+        """実行可能なタスクをディスパッチ"""
+        dispatched = 0
+        # 追加エージェントが揃わず開始できないタスク (このパスの間はキューから外しておく)
+        held: List[Tuple[List[Tuple[int, int, ScheduledTask]], Tuple[int, int, ScheduledTask]]] = []
+
+        while self.running < self.max_concurrent_tasks and not self._slot_waiters:
+            candidate = self._select_candidate()
+            if candidate is None:
+                break
+
+            agent_id, victim_id = candidate
+            agent_type = self._agent_types[agent_id]
+            _, _, entry = self._queues[agent_type][victim_id][0]
+
+            # 追加で必要なタイプのエージェントを確保
+            assigned = [agent_id]
+            for extra_type in entry.agent_types[1:]:
+                extra_agent = self._find_idle_agent(extra_type, exclude=assigned)
+                if extra_agent is None:
+                    break
+                assigned.append(extra_agent)
+
+            if len(assigned) < len(entry.agent_types):
+                # 必要なエージェントが揃わない場合は次の解放まで保留し、後続のタスクの選択を続ける
+                local_queue = self._queues[agent_type][victim_id]
+                held.append((local_queue, heapq.heappop(local_queue)))
+                continue
+
+            heapq.heappop(self._queues[agent_type][victim_id])
+            if victim_id != agent_id:
+                self.stats['steals'] += 1
+                entry.home_agent = agent_id
+
+            wait_time = time.monotonic() - entry.enqueued_at
+            self.stats['total_wait_time'] += wait_time
+            self.stats['max_wait_time'] = max(self.stats['max_wait_time'], wait_time)
+            self.stats['dispatched'] += 1
+
+            self.running += 1
+            dispatched += 1
+            self._launch(entry, assigned)
+
+        for local_queue, item in held:
+            heapq.heappush(local_queue, item)
+
+        return dispatched
+
+    def _select_candidate(self) -> Optional[Tuple[str, str]]:
+        """(実行エージェント, 取り出し元キューの所有エージェント) を選択"""
+        best: Optional[Tuple[Tuple[int, int], str, str]] = None
+
+        for agent_type, agent_queues in self._queues.items():
+            for agent_id, local_queue in agent_queues.items():
+                if agent_id not in self._agent_types or not self._is_agent_available(agent_id):
+                    continue
+
+                victim_id = agent_id
+                if not local_queue:
+                    # 自キューが空なら最長の兄弟キューからスティール
+                    victim_id = max(agent_queues, key=lambda a: len(agent_queues[a]))
+                    if not agent_queues[victim_id]:
+                        continue
+
+                head_priority, head_sequence, _ = agent_queues[victim_id][0]
+                key = (head_priority, head_sequence)
+                if best is None or key < best[0]:
+                    best = (key, agent_id, victim_id)
+
+        if best is None:
+            return None
+        return best[1], best[2]
+
+    def _find_idle_agent(self, agent_type: Any, exclude: List[str]) -> Optional[str]:
+        """指定タイプの空きエージェント検索"""
+        for agent_id in self._queues.get(agent_type, {}):
+            if agent_id in self._agent_types and agent_id not in exclude and self._is_agent_available(agent_id):
+                return agent_id
+        return None
+
+    def task_finished(self):
+        """スケジュール実行タスクの完了通知"""
+        self.release_slot()
+
+    # ------------------------------------------------------------------
+    # 状態
+    # ------------------------------------------------------------------
+
+    def queued_count(self, agent_type: Any = None) -> int:
+        """待機タスク数"""
+        if agent_type is not None:
+            return sum(len(q) for q in self._queues.get(agent_type, {}).values())
+        return sum(len(q) for agent_queues in self._queues.values() for q in agent_queues.values())
+
+    def oldest_wait_time(self, agent_type: Any) -> float:
+        """指定タイプの最古待機タスクの待ち時間"""
+        oldest = [
+            entry.enqueued_at
+            for q in self._queues.get(agent_type, {}).values()
+            for _, _, entry in q
+        ]
+        return time.monotonic() - min(oldest) if oldest else 0.0
+
+    def drain(self) -> List[ScheduledTask]:
+        """全待機タスクを取り出す (シャットダウン用)"""
+        drained = []
+        for agent_queues in self._queues.values():
+            for local_queue in agent_queues.values():
+                drained.extend(entry for _, _, entry in local_queue)
+                local_queue.clear()
+        return drained
+
+    def get_stats(self) -> Dict[str, Any]:
+        """スケジューラー統計取得"""
+        dispatched = self.stats['dispatched']
+        return {
+            "running_tasks": self.running,
+            "max_concurrent_tasks": self.max_concurrent_tasks,
+            "queued_tasks": {
+                getattr(agent_type, 'value', str(agent_type)): self.queued_count(agent_type)
+                for agent_type in self._queues
+            },
+            "waiting_direct_executions": len(self._slot_waiters),
+            "submitted": self.stats['submitted'],
+            "dispatched": dispatched,
+            "steals": self.stats['steals'],
+            "average_wait_time": self.stats['total_wait_time'] / dispatched if dispatched else 0.0,
+            "max_wait_time": self.stats['max_wait_time']
+        }
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+シュンスケ式 CommandTask メモリベンチマーク - Ultimate ShunsukeModel Ecosystem
+
+長時間セッションを想定して多数のタスクにログを積み、従来の辞書形式ログと
+スロット化したコンパクト表現 (TaskLogEntry) のメモリ使用量を tracemalloc で比較する
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List
+
+
+# テスト対象モジュールのインポート (ハイフン付きディレクトリは別名で読み込む)
+from repo_modules import import_repo_module
+
+CommandTask = import_repo_module("core.command_tower.command_tower").CommandTask
+
+
+# 1タスクあたりの典型的なログ (作成 → 配置 → 実行 → 完了 → 消し込み)
+LOG_PATTERN = [
+    ("task_created", {"source": "command_tower"}),
+    ("agents_allocated", {"agents": ["scout_001", "code_striker_002"]}),
+    ("execution_started", None),
+    ("task_completed", {"completion_time": "2026-01-01T00:00:00+00:00"}),
+    ("task_archived", {"archive_time": "2026-01-01T00:00:00+00:00", "reason": "command_sequence_completion"})
+]
+
+
+def build_legacy_logs(task_count: int, rounds: int) -> List[CommandTask]:
+    """従来の add_log と同じ辞書形式でログを生成 (タスク本体は共通)"""
+    tasks = []
+    for i in range(task_count):
+        task = CommandTask(id=f"bench_task_{i:06d}", name=f"Task {i}", description="")
+        for _ in range(rounds):
+            for action, details in LOG_PATTERN:
+                task.logs.append({
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "action": action,
+                    "details": details or {},
+                    "status": task.status.value
+                })
+        tasks.append(task)
+    return tasks
+
+
+def build_compact_logs(task_count: int, rounds: int) -> List[CommandTask]:
+    """CommandTask.add_log でログを生成"""
+    tasks = []
+    for i in range(task_count):
+        task = CommandTask(id=f"bench_task_{i:06d}", name=f"Task {i}", description="")
+        for _ in range(rounds):
+            for action, details in LOG_PATTERN:
+                task.add_log(action, details)
+        tasks.append(task)
+    return tasks
+
+
+def measure(builder: Callable[[int, int], Any], task_count: int, rounds: int) -> Dict[str, Any]:
+    """生成したオブジェクトが保持するメモリを計測"""
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    retained = builder(task_count, rounds)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    entries = task_count * rounds * len(LOG_PATTERN)
+    result = {
+        "retained_bytes": current - baseline,
+        "peak_bytes": peak - baseline,
+        "bytes_per_entry": (current - baseline) / entries if entries else 0.0
+    }
+    del retained
+    return result
+
+
+def run_benchmark(task_count: int = 2000, rounds: int = 4) -> Dict[str, Any]:
+    """メモリベンチマーク実行"""
+    legacy = measure(build_legacy_logs, task_count, rounds)
+    compact = measure(build_compact_logs, task_count, rounds)
+
+    return {
+        "tasks": task_count,
+        "log_entries": task_count * rounds * len(LOG_PATTERN),
+        "legacy": legacy,
+        "compact": compact,
+        "reduction": 1 - compact["retained_bytes"] / legacy["retained_bytes"] if legacy["retained_bytes"] else 0.0
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="CommandTask log memory benchmark")
+    parser.add_argument("--tasks", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=4, help="1タスクあたりのログパターン繰り返し回数")
+    parser.add_argument("--json", action="store_true", help="結果を JSON で出力")
+    args = parser.parse_args()
+
+    result = run_benchmark(args.tasks, args.rounds)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        sys.exit(0)
+
+    print(f"\n🧠 CommandTask log memory ({result['tasks']:,} tasks, {result['log_entries']:,} log entries)")
+    for label in ("legacy", "compact"):
+        stats = result[label]
+        print(
+            f"   {label:<8} {stats['retained_bytes'] / 1024 / 1024:8.2f} MB retained, "
+            f"{stats['bytes_per_entry']:6.1f} B/entry (peak {stats['peak_bytes'] / 1024 / 1024:.2f} MB)"
+        )
+    print(f"\n📉 Reduction: {result['reduction'] * 100:.1f}%")
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+シュンスケ式 Command Tower 起動時間ベンチマーク - Ultimate ShunsukeModel Ecosystem
+
+短命な CLI 呼び出し (status など) を想定し、新しいプロセスでの
+import → CommandTower 生成 → initialize → get_system_status → shutdown の
+所要時間と、-X importtime によるモジュール別 import 時間の内訳を計測する
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List
+
+import repo_modules
+
+
+LOAD_TEST_DIR = Path(__file__).resolve().parent
+
+# 短命な CLI 呼び出しの目標起動時間
+STARTUP_BUDGET_MS = 200.0
+
+# 子プロセスで実行する計測スクリプト (各段階の経過時間を JSON で出力)
+PROBE = """
+import asyncio, json, sys, time
+started = time.perf_counter()
+sys.path.insert(0, {load_test_dir!r})
+from repo_modules import import_repo_module
+CommandTower = import_repo_module("core.command_tower.command_tower").CommandTower
+imported = time.perf_counter()
+
+async def main():
+    tower = CommandTower()
+    constructed = time.perf_counter()
+    await tower.initialize()
+    initialized = time.perf_counter()
+    await tower.get_system_status()
+    status = time.perf_counter()
+    await tower.shutdown()
+    finished = time.perf_counter()
+    return {{
+        "import_ms": (imported - started) * 1000,
+        "construct_ms": (constructed - imported) * 1000,
+        "initialize_ms": (initialized - constructed) * 1000,
+        "status_ms": (status - initialized) * 1000,
+        "shutdown_ms": (finished - status) * 1000,
+        "total_ms": (finished - started) * 1000,
+        "loaded_components": sorted(tower._components)
+    }}
+
+print(json.dumps(asyncio.run(main())))
+"""
+
+
+def _isolated_env(home: str) -> Dict[str, str]:
+    """ユーザー設定やログに触れないよう HOME を一時ディレクトリへ向けた環境変数"""
+    env = dict(os.environ)
+    env["HOME"] = home
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
+    return env
+
+
+def run_probe(home: str) -> Dict[str, Any]:
+    """新しいプロセスで起動段階ごとの時間を計測"""
+    completed = subprocess.run(
+        [sys.executable, "-c", PROBE.format(load_test_dir=str(LOAD_TEST_DIR))],
+        env=_isolated_env(home),
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def import_breakdown(home: str, top: int = 15) -> List[Dict[str, Any]]:
+    """-X importtime の出力からモジュール別の累積 import 時間上位を取得"""
+    completed = subprocess.run(
+        [
+            sys.executable, "-X", "importtime", "-c",
+            # import 文で読み込む (importlib.import_module 経由では最上位モジュールが計測されない)
+            f"import sys; sys.path.insert(0, {str(LOAD_TEST_DIR)!r}); import repo_modules; repo_modules.install(); "
+            f"import {repo_modules.ROOT_PACKAGE}.core.command_tower.command_tower"
+        ],
+        env=_isolated_env(home),
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    entries = []
+    for line in completed.stderr.splitlines():
+        # 形式: "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, self_us, cumulative_us, module = (part.strip() for part in line.replace("import time:", "|", 1).split("|"))
+        entries.append({
+            "module": module.strip(),
+            "self_ms": int(self_us) / 1000,
+            "cumulative_ms": int(cumulative_us) / 1000
+        })
+
+    return sorted(entries, key=lambda entry: entry["cumulative_ms"], reverse=True)[:top]
+
+
+def run_benchmark(iterations: int = 10) -> Dict[str, Any]:
+    """起動時間ベンチマーク実行 (初回は設定ファイル生成を含むため別計上)"""
+    with tempfile.TemporaryDirectory() as home:
+        first_run = run_probe(home)
+        runs = [run_probe(home) for _ in range(iterations)]
+        breakdown = import_breakdown(home)
+
+    phases = [key for key in runs[0] if key.endswith("_ms")]
+    summary = {
+        phase: {
+            "median": statistics.median(run[phase] for run in runs),
+            "max": max(run[phase] for run in runs)
+        }
+        for phase in phases
+    }
+
+    return {
+        "iterations": iterations,
+        "first_run": first_run,
+        "phases": summary,
+        "loaded_components": runs[-1]["loaded_components"],
+        "import_breakdown": breakdown,
+        "budget_ms": STARTUP_BUDGET_MS,
+        "within_budget": summary["total_ms"]["median"] < STARTUP_BUDGET_MS
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Command Tower startup benchmark")
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--json", action="store_true", help="結果を JSON で出力")
+    args = parser.parse_args()
+
+    result = run_benchmark(args.iterations)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        sys.exit(0 if result["within_budget"] else 1)
+
+    print(f"\n🚀 Command Tower startup ({result['iterations']} runs, median / max)")
+    for phase, stats in result["phases"].items():
+        print(f"   {phase:<14} {stats['median']:8.1f}ms / {stats['max']:8.1f}ms")
+    print(f"   first run      {result['first_run']['total_ms']:8.1f}ms (includes default config creation)")
+    print(f"   components loaded: {result['loaded_components'] or 'none'}")
+
+    print(f"\n📦 Import time breakdown (cumulative)")
+    for entry in result["import_breakdown"]:
+        print(f"   {entry['cumulative_ms']:8.1f}ms  {entry['module']}")
+
+    status = "✅" if result["within_budget"] else "⚠️ "
+    print(f"\n{status} median startup {result['phases']['total_ms']['median']:.1f}ms (budget {STARTUP_BUDGET_MS:.0f}ms)")
+    sys.exit(0 if result["within_budget"] else 1)
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+シュンスケ式 メタプロジェクト依存グラフベンチマーク - Ultimate ShunsukeModel Ecosystem
+
+数千件のメタプロジェクトを作成し、作成ごとにグラフ全体を再構築する従来方式と
+差分更新方式の所要時間、および実行プラン生成時のレイアウトキャッシュの効果を計測する
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+
+# テスト対象モジュールのインポート (ハイフン付きディレクトリは別名で読み込む)
+from repo_modules import import_repo_module
+
+configure_logging = import_repo_module("core.ecosystem_logging").configure_logging
+MetaProjectManager = import_repo_module("core.meta_framework.meta_project_manager").MetaProjectManager
+
+
+# 依存関係が推定されるサブプロジェクト名の組み合わせ (mcp → integration, doc → api など)
+SUB_PROJECT_PATTERNS = [
+    ["mcp_server_{i}", "integration_{i}", "documentation_{i}", "api_{i}"],
+    ["quality_{i}", "test_suite_{i}", "implementation_{i}"],
+    ["performance_{i}", "implementation_{i}", "doc_{i}", "code_{i}"]
+]
+
+
+def sub_projects_for(index: int) -> List[str]:
+    """ベンチマーク用サブプロジェクト名 (連続する3件のメタプロジェクトでサブプロジェクトを一部共有)"""
+    pattern = SUB_PROJECT_PATTERNS[index % len(SUB_PROJECT_PATTERNS)]
+    return [name.format(i=index // len(SUB_PROJECT_PATTERNS)) for name in pattern]
+
+
+async def build_projects(count: int, full_rebuild: bool) -> Dict[str, Any]:
+    """メタプロジェクトを count 件作成 (full_rebuild=True は作成ごとに従来の全再構築を行う)"""
+    manager = MetaProjectManager({})
+    await manager.initialize()
+
+    meta_ids = []
+    started = time.perf_counter()
+    for i in range(count):
+        meta_ids.append(await manager.create_meta_project(f"bench_meta_{i}", "", sub_projects_for(i)))
+        if full_rebuild:
+            await manager._rebuild_dependency_graph()
+    elapsed = time.perf_counter() - started
+
+    return {
+        "manager": manager,
+        "meta_ids": meta_ids,
+        "create_s": elapsed,
+        "per_create_ms": elapsed / count * 1000 if count else 0.0,
+        "nodes": len(manager.dependency_graph.nodes),
+        "edges": len(manager.dependency_graph.edges)
+    }
+
+
+async def measure_plans(manager: MetaProjectManager, meta_ids: List[str]) -> Dict[str, float]:
+    """実行プラン生成 (1巡目はキャッシュなし, 2巡目はキャッシュ済み)"""
+    timings = {}
+    for label in ("cold", "cached"):
+        started = time.perf_counter()
+        for meta_id in meta_ids:
+            await manager.get_execution_plan(meta_id)
+        timings[f"{label}_ms"] = (time.perf_counter() - started) * 1000
+    return timings
+
+
+async def measure_removals(manager: MetaProjectManager, meta_ids: List[str]) -> Dict[str, Any]:
+    """一部メタプロジェクトの削除と、影響を受けたキャッシュのみが無効化されることの確認"""
+    targets = meta_ids[::10]
+    before = manager.graph_stats['layout_invalidations']
+    started = time.perf_counter()
+    for meta_id in targets:
+        await manager.remove_meta_project(meta_id)
+    elapsed = time.perf_counter() - started
+
+    return {
+        "removed": len(targets),
+        "remove_ms": elapsed * 1000,
+        "invalidated_layouts": manager.graph_stats['layout_invalidations'] - before,
+        "cached_layouts": len(manager._layout_cache)
+    }
+
+
+async def run_benchmark(count: int = 3000, baseline_count: int = 1000) -> Dict[str, Any]:
+    """依存グラフベンチマーク実行"""
+    with tempfile.TemporaryDirectory() as log_dir:
+        configure_logging(log_dir)
+
+        baseline = await build_projects(baseline_count, full_rebuild=True)
+        incremental_small = await build_projects(baseline_count, full_rebuild=False)
+        incremental = await build_projects(count, full_rebuild=False)
+
+        # 差分更新と全再構築で同じグラフになること
+        rebuilt = incremental["manager"]
+        edges_before = set(rebuilt.dependency_graph.edges)
+        nodes_before = set(rebuilt.dependency_graph.nodes)
+        await rebuilt._rebuild_dependency_graph()
+        consistent = (
+            edges_before == set(rebuilt.dependency_graph.edges)
+            and nodes_before == set(rebuilt.dependency_graph.nodes)
+        )
+
+        plans = await measure_plans(rebuilt, incremental["meta_ids"])
+        removals = await measure_removals(rebuilt, incremental["meta_ids"])
+
+    for result in (baseline, incremental_small, incremental):
+        del result["manager"], result["meta_ids"]
+
+    return {
+        "meta_projects": count,
+        "baseline_meta_projects": baseline_count,
+        "full_rebuild": baseline,
+        "incremental_same_size": incremental_small,
+        "incremental": incremental,
+        "speedup": baseline["create_s"] / incremental_small["create_s"] if incremental_small["create_s"] else 0.0,
+        "graph_consistent": consistent,
+        "plans": plans,
+        "removals": removals
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Meta project dependency graph benchmark")
+    parser.add_argument("--count", type=int, default=3000, help="差分更新で作成するメタプロジェクト数")
+    parser.add_argument("--baseline-count", type=int, default=1000, help="全再構築方式で作成するメタプロジェクト数")
+    parser.add_argument("--json", action="store_true", help="結果を JSON で出力")
+    args = parser.parse_args()
+
+    result = asyncio.run(run_benchmark(args.count, args.baseline_count))
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        sys.exit(0 if result["graph_consistent"] else 1)
+
+    print(f"\n🕸️  Meta project dependency graph")
+    print(
+        f"   full rebuild  {result['baseline_meta_projects']:>6,} projects: "
+        f"{result['full_rebuild']['create_s']:8.2f}s ({result['full_rebuild']['per_create_ms']:.2f}ms/create)"
+    )
+    print(
+        f"   incremental   {result['baseline_meta_projects']:>6,} projects: "
+        f"{result['incremental_same_size']['create_s']:8.2f}s ({result['incremental_same_size']['per_create_ms']:.2f}ms/create)"
+    )
+    print(
+        f"   incremental   {result['meta_projects']:>6,} projects: "
+        f"{result['incremental']['create_s']:8.2f}s ({result['incremental']['per_create_ms']:.2f}ms/create), "
+        f"{result['incremental']['nodes']:,} nodes / {result['incremental']['edges']:,} edges"
+    )
+    print(f"\n⚡ Speedup at {result['baseline_meta_projects']:,} projects: {result['speedup']:.1f}x")
+
+    print(f"\n📋 Execution plans: cold {result['plans']['cold_ms']:.1f}ms, cached {result['plans']['cached_ms']:.1f}ms")
+    removals = result["removals"]
+    print(
+        f"🗑️  Removed {removals['removed']:,} projects in {removals['remove_ms']:.1f}ms, "
+        f"{removals['invalidated_layouts']:,} layouts invalidated, {removals['cached_layouts']:,} still cached"
+    )
+
+    status = "✅" if result["graph_consistent"] else "❌"
+    print(f"\n{status} incremental graph matches full rebuild")
+    sys.exit(0 if result["graph_consistent"] else 1)
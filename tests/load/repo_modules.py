@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+シュンスケ式 ベンチマーク用モジュールローダー - Ultimate ShunsukeModel Ecosystem
+
+core/command-tower や core/meta-framework はディレクトリ名にハイフンを含み、
+モジュールはリポジトリルートを最上位パッケージとする相対 import
+(from ...orchestration... など) を使うため、sys.path 経由の通常の import では読み込めない。
+リポジトリルートを仮想パッケージとして登録し、ハイフン付きディレクトリを
+import 可能な別名で公開した上でモジュールを読み込む
+"""
+
+import importlib
+import importlib.machinery
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+
+# リポジトリルートに割り当てる最上位パッケージ名
+ROOT_PACKAGE = "shunsuke_ecosystem"
+
+# import 用の別名 -> リポジトリルートからの相対ディレクトリ
+PACKAGE_ALIASES = {
+    "core": "core",
+    "core.command_tower": "core/command-tower",
+    "core.meta_framework": "core/meta-framework",
+    "orchestration": "orchestration"
+}
+
+
+def _register_package(name: str, directory: Path) -> ModuleType:
+    """ディレクトリを名前空間パッケージとして登録"""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    spec = importlib.machinery.ModuleSpec(name, None, is_package=True)
+    spec.submodule_search_locations = [str(directory)]
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+
+    parent, _, child = name.rpartition('.')
+    if parent:
+        setattr(sys.modules[parent], child, module)
+    return module
+
+
+def install() -> str:
+    """仮想パッケージの登録 (冪等)"""
+    _register_package(ROOT_PACKAGE, REPO_ROOT)
+    for alias, directory in PACKAGE_ALIASES.items():
+        _register_package(f"{ROOT_PACKAGE}.{alias}", REPO_ROOT / directory)
+    return ROOT_PACKAGE
+
+
+def import_repo_module(name: str) -> ModuleType:
+    """
+    リポジトリ内モジュールの読み込み
+
+    Args:
+        name: 別名表記のモジュール名 (例: "core.command_tower.command_tower")
+
+    Returns:
+        読み込んだモジュール
+    """
+    return importlib.import_module(f"{install()}.{name}")
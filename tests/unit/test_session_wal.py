@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+シュンスケ式 セッション WAL テスト - Ultimate ShunsukeModel Ecosystem
+
+プロセスのクラッシュ後の復旧 (完了済みタスクの再実行抑止)、書きかけの最終行、
+稼働中のオーナーが所有するセッションを引き継がないことを検証する
+"""
+
+import asyncio
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+# テスト対象モジュールのインポート (ハイフン付きディレクトリは別名で読み込む)
+sys.path.append(str(Path(__file__).parent.parent / "load"))
+
+from repo_modules import import_repo_module
+
+session_wal = import_repo_module("core.command_tower.session_wal")
+SessionWAL = session_wal.SessionWAL
+DONE_STATUSES = session_wal.DONE_STATUSES
+
+
+pytestmark = pytest.mark.unit
+
+
+# 3タスクのうち2件が完了済み (completed / archived) のまま停止したセッション
+SESSION_RECORDS = [
+    {"type": "session_started", "session_id": "s1", "user_intent": "build api", "streaming": False},
+    {"type": "phase", "session_id": "s1", "entry": {"phase": "task_planning"}},
+    {"type": "task_planned", "session_id": "s1", "task": {"id": "t1", "status": "pending"}},
+    {"type": "task_planned", "session_id": "s1", "task": {"id": "t2", "status": "pending"}},
+    {"type": "task_planned", "session_id": "s1", "task": {"id": "t3", "status": "pending"}},
+    {"type": "task_result", "session_id": "s1", "task_id": "t1", "result": {"success": True}},
+    {"type": "task_status", "session_id": "s1", "task_id": "t1", "status": "completed"},
+    {"type": "task_result", "session_id": "s1", "task_id": "t2", "result": {"success": True}},
+    {"type": "task_status", "session_id": "s1", "task_id": "t2", "status": "archived"},
+    {"type": "task_status", "session_id": "s1", "task_id": "t3", "status": "in_progress"}
+]
+
+# 書き込み後に fsync 済みの状態で異常終了する子プロセス
+CRASHING_WRITER = """
+import asyncio, json, os, sys
+sys.path.append(sys.argv[1])
+from repo_modules import import_repo_module
+SessionWAL = import_repo_module("core.command_tower.session_wal").SessionWAL
+
+async def main():
+    wal = SessionWAL(sys.argv[2])
+    wal.start()
+    for record in json.loads(sys.argv[3]):
+        wal.append(record)
+    await wal.flush()
+    os._exit(1)
+
+asyncio.run(main())
+"""
+
+
+async def write_session(wal: SessionWAL, records):
+    """レコードを書き込んで fsync まで待つ"""
+    wal.start()
+    for record in records:
+        wal.append(dict(record))
+    await wal.flush()
+
+
+def pending_tasks(state):
+    """復旧時に再実行されるタスク"""
+    return sorted(task_id for task_id, status in state["status"].items() if status not in DONE_STATUSES)
+
+
+def test_crash_mid_session_resumes_only_unfinished_tasks(tmp_path: Path):
+    crashed = subprocess.run(
+        [sys.executable, "-c", CRASHING_WRITER,
+         str(Path(__file__).parent.parent / "load"), str(tmp_path), json.dumps(SESSION_RECORDS)],
+        capture_output=True
+    )
+    assert crashed.returncode == 1, crashed.stderr.decode()
+
+    wal = SessionWAL(tmp_path)
+    try:
+        recovered = wal.recover()
+
+        assert list(recovered) == ["s1"]
+        state = recovered["s1"]
+        assert state["user_intent"] == "build api"
+        assert state["owner"] == wal.owner_id
+        assert set(state["results"]) == {"t1", "t2"}
+        assert pending_tasks(state) == ["t3"]
+    finally:
+        asyncio.run(wal.close())
+
+    # 引き継ぎはログに記録され、引き継いだプロセスが稼働中の間は他のプロセスが再度引き継がない
+    records = [json.loads(line) for line in wal.path.read_text(encoding="utf-8").splitlines()]
+    assert records[-1]["type"] == "session_adopted"
+    assert records[-1]["owner"] == wal.owner_id
+
+
+def test_torn_last_line_is_skipped_and_compacted(tmp_path: Path):
+    async def scenario():
+        writer = SessionWAL(tmp_path)
+        await write_session(writer, SESSION_RECORDS)
+        await writer.close()
+
+    asyncio.run(scenario())
+
+    # クラッシュで途中まで書かれた最終行
+    with open(tmp_path / SessionWAL.FILE_NAME, "ab") as f:
+        f.write(b'{"type":"task_status","session_id":"s1","task_id":"t3","sta')
+
+    wal = SessionWAL(tmp_path)
+    try:
+        recovered = wal.recover()
+    finally:
+        asyncio.run(wal.close())
+
+    assert pending_tasks(recovered["s1"]) == ["t3"]
+    assert recovered["s1"]["status"]["t3"] == "in_progress"
+
+    # 圧縮後のログには書きかけの行が残らない
+    lines = wal.path.read_bytes().splitlines()
+    assert len(lines) == len(SESSION_RECORDS) + 1
+    for line in lines:
+        json.loads(line)
+
+
+def test_live_owner_session_is_not_adopted(tmp_path: Path):
+    async def scenario():
+        owner = SessionWAL(tmp_path)
+        await write_session(owner, SESSION_RECORDS)
+
+        other = SessionWAL(tmp_path)
+        try:
+            assert other.recover() == {}
+        finally:
+            await other.close()
+
+        # 稼働中のオーナーのセッションは圧縮で除去されない
+        records = [json.loads(line) for line in owner.path.read_text(encoding="utf-8").splitlines()]
+        assert len(records) == len(SESSION_RECORDS)
+        assert all(record["type"] != "session_adopted" for record in records)
+
+        # オーナーが終了した後は引き継げる
+        await owner.close()
+        successor = SessionWAL(tmp_path)
+        try:
+            assert list(successor.recover()) == ["s1"]
+        finally:
+            await successor.close()
+
+    asyncio.run(scenario())